@@ -1,6 +1,6 @@
 from .client import MoySkladClient
 from .errors import MoySkladError
-from . import types, api, helpers, client, errors
+from . import types, api, helpers, client, errors, query, sync, mirror, webhooks
 
 __all__ = [
     "MoySkladClient",
@@ -10,4 +10,8 @@ __all__ = [
     "helpers",
     "client",
     "errors",
+    "query",
+    "sync",
+    "mirror",
+    "webhooks",
 ]
@@ -1,3 +1,3 @@
-from . import reports, entities, documents, audit, notification
+from . import reports, entities, documents, audit, notification, bulk
 
-__all__ = ["reports", "entities", "documents", "audit", "notification"]
+__all__ = ["reports", "entities", "documents", "audit", "notification", "bulk"]
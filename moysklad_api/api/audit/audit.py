@@ -21,6 +21,21 @@ class AuditContext(types.MoySkladBaseClass):
     support_access: typing.Optional[bool]
     uid: typing.Optional[str]
 
+    _json_fields = {
+        "entity_type": ("entityType", None),
+        "event_type": ("eventType", None),
+        "events": ("events", None),
+        "id": ("id", None),
+        "info": ("info", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "object_count": ("objectCount", None),
+        "object_type": ("objectType", None),
+        "source": ("source", None),
+        "support_access": ("supportAccess", None),
+        "uid": ("uid", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "AuditContext":
         instance = cls()
@@ -60,6 +75,22 @@ class AuditEvent(types.MoySkladBaseClass):
     support_access: typing.Optional[bool]
     uid: typing.Optional[str]
 
+    _json_fields = {
+        "additional_info": ("additionalInfo", None),
+        "audit": ("audit", helpers.get_meta),
+        "diff": ("diff", None),
+        "entity": ("entity", helpers.get_meta),
+        "entity_type": ("entityType", None),
+        "event_type": ("eventType", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "object_count": ("objectCount", None),
+        "object_type": ("objectType", None),
+        "source": ("source", None),
+        "support_access": ("supportAccess", None),
+        "uid": ("uid", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "AuditEvent":
         instance = cls()
@@ -88,6 +119,12 @@ class AuditFilters(types.MoySkladBaseClass):
     source: typing.Optional[typing.List[str]]
     entity_type: typing.Optional[typing.List[str]]
 
+    _json_fields = {
+        "event_type": ("eventType", None),
+        "source": ("source", None),
+        "entity_type": ("entitytype", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "AuditFilters":
         instance = cls()
@@ -123,7 +160,7 @@ class GetAuditContextsRequest(types.ApiRequest):
         return RequestData(method="GET", url=f"{helpers.BASE_URL}/audit", params=params)
 
     def from_response(self, result: dict) -> typing.List[AuditContext]:
-        return [AuditContext.from_json(x) for x in result["rows"]]
+        return self.parse_rows(AuditContext, result["rows"])
 
 
 class GetAuditEventsByContextRequest(types.ApiRequest):
@@ -150,7 +187,7 @@ class GetAuditEventsByContextRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[AuditEvent]:
-        return [AuditEvent.from_json(x) for x in result["rows"]]
+        return self.parse_rows(AuditEvent, result["rows"])
 
 
 class GetAuditEventsByEntityRequest(types.ApiRequest):
@@ -179,7 +216,7 @@ class GetAuditEventsByEntityRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[AuditEvent]:
-        return [AuditEvent.from_json(x) for x in result["rows"]]
+        return self.parse_rows(AuditEvent, result["rows"])
 
 
 class GetAuditFiltersRequest(types.ApiRequest):
@@ -0,0 +1,13 @@
+from .bulk import (
+    BulkUpsertRequest,
+    BulkDeleteRequest,
+    GetByIdsRequest,
+    GetEntityListRequest,
+)
+
+__all__ = [
+    "BulkUpsertRequest",
+    "BulkDeleteRequest",
+    "GetByIdsRequest",
+    "GetEntityListRequest",
+]
@@ -0,0 +1,266 @@
+import re
+import typing
+
+from ... import types, helpers
+from ...errors import MoySkladError
+from ...types import RequestData
+
+
+# https://dev.moysklad.ru/doc/api/remap/1.2/#mojsklad-json-api-obschie-swedeniq-sozdanie-i-obnowlenie-neskol-kih-ob-ektow
+# POST /entity/<type> with an array of objects creates objects without meta and updates objects with meta.
+# (POST /entity/<type> с массивом объектов создает объекты без meta и обновляет объекты с meta.)
+
+_UPDATE_URL_RE = re.compile(r"/entity/(\w+)/[a-f0-9-]{36}$")
+_CREATE_URL_RE = re.compile(r"/entity/\w+$")
+
+
+def _to_bulk_item(request_data: RequestData) -> typing.Tuple[str, dict]:
+    """
+    Converts the request of a single create/update request to (collection url, array element).
+    (Преобразует запрос создания/обновления одного объекта в (url коллекции, элемент массива).)
+    """
+    if not isinstance(request_data.json, dict):
+        raise ValueError(
+            f"Only single-object requests can be batched: {request_data.method} {request_data.url}"
+        )
+    url = request_data.url.rstrip("/")
+    if request_data.method == "POST" and _CREATE_URL_RE.search(url):
+        return url, request_data.json
+    found = _UPDATE_URL_RE.search(url)
+    if request_data.method == "PUT" and found:
+        entity_type = found.group(1)
+        collection_url = url.rsplit("/", 1)[0]
+        item = dict(request_data.json)
+        item["meta"] = {
+            "href": url,
+            "metadataHref": f"{collection_url}/metadata",
+            "type": entity_type,
+            "mediaType": "application/json",
+        }
+        return collection_url, item
+    raise ValueError(
+        f"Request can not be batched: {request_data.method} {request_data.url}"
+    )
+
+
+class BulkUpsertRequest(types.ApiRequest):
+    """
+    https://dev.moysklad.ru/doc/api/remap/1.2/#mojsklad-json-api-obschie-swedeniq-sozdanie-i-obnowlenie-neskol-kih-ob-ektow
+
+    Create and update up to 1000 objects of one type in one request.
+    Takes ordinary single-object Create*Request / Update*Request instances (for example CreateProductRequest, UpdateProductRequest).
+    (Создание и обновление до 1000 объектов одного типа одним запросом.
+    Принимает обычные запросы Create*Request / Update*Request (например CreateProductRequest, UpdateProductRequest).)
+    """
+
+    def __init__(self, requests: typing.List[types.ApiRequest]):
+        """
+
+        :param requests: Create/update requests of the same entity type (Запросы создания/обновления сущностей одного типа)
+        """
+        if not requests:
+            raise ValueError("requests must not be empty")
+        if len(requests) > helpers.MAX_BULK_SIZE:
+            raise ValueError(
+                f"At most {helpers.MAX_BULK_SIZE} objects can be sent in one request"
+            )
+        self.requests = requests
+
+    @staticmethod
+    def collection_url(request: types.ApiRequest) -> str:
+        """
+        Returns the url the request would be sent to as part of a bulk request.
+        (Возвращает url, на который запрос был бы отправлен в составе массового запроса.)
+        """
+        return _to_bulk_item(request.to_request())[0]
+
+    def to_request(self) -> RequestData:
+        url = None
+        json_data = []
+        for request in self.requests:
+            item_url, item = _to_bulk_item(request.to_request())
+            if url is None:
+                url = item_url
+            elif url != item_url:
+                raise ValueError(
+                    f"All requests must have the same entity type: {url} != {item_url}"
+                )
+            json_data.append(item)
+        return RequestData(
+            method="POST",
+            url=url,
+            json=json_data,
+        )
+
+    def from_response(
+        self, result: list
+    ) -> typing.List[typing.Union[typing.Any, MoySkladError]]:
+        """
+        :return: For each request, in the same order: its parsed result, or MoySkladError if that object failed
+         (Для каждого запроса, в том же порядке: его результат, или MoySkladError, если объект не сохранен)
+        """
+        if len(result) != len(self.requests):
+            raise ValueError(
+                f"Expected {len(self.requests)} objects in response, got {len(result)}"
+            )
+        results = []
+        for request, item in zip(self.requests, result):
+            if isinstance(item, dict) and item.get("errors"):
+                results.append(MoySkladError(item["errors"][0]))
+            else:
+                results.append(request.from_response(item))
+        return results
+
+
+def _delete_item(entity_type: str, id_or_meta: typing.Union[str, types.Meta]) -> dict:
+    if isinstance(id_or_meta, str):
+        return {
+            "meta": {
+                "href": f"{helpers.BASE_URL}/entity/{entity_type}/{id_or_meta}",
+                "metadataHref": f"{helpers.BASE_URL}/entity/{entity_type}/metadata",
+                "type": entity_type,
+                "mediaType": "application/json",
+            }
+        }
+    return {"meta": id_or_meta}
+
+
+class BulkDeleteRequest(types.ApiRequest):
+    """
+    https://dev.moysklad.ru/doc/api/remap/1.2/#mojsklad-json-api-obschie-swedeniq-massowoe-udalenie
+
+    Delete up to 1000 objects of one type in one request (POST /entity/<type>/delete).
+    (Удаление до 1000 объектов одного типа одним запросом (POST /entity/<type>/delete).)
+    """
+
+    def __init__(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        ids: typing.List[typing.Union[str, types.Meta]],
+    ):
+        """
+
+        :param entity: Entity type name ("product") or model class (Product) (Тип сущности ("product") или класс модели (Product))
+        :param ids: Object ids or metas. For "assortment" only metas, of different types
+         (id или meta объектов. Для "assortment" только meta, разных типов)
+        :raises ValueError: if an id is given for "assortment" (если для "assortment" указан id)
+        """
+        entity = helpers.get_entity_type(entity)
+        if not ids:
+            raise ValueError("ids must not be empty")
+        if len(ids) > helpers.MAX_BULK_SIZE:
+            raise ValueError(
+                f"At most {helpers.MAX_BULK_SIZE} objects can be sent in one request"
+            )
+        if entity == "assortment" and any(isinstance(x, str) for x in ids):
+            # the type of the object is not known from its id (тип объекта нельзя узнать по id)
+            raise ValueError("Metas are required to delete assortment, not ids")
+        self.entity_type = entity
+        self.ids = ids
+
+    def to_request(self) -> RequestData:
+        return RequestData(
+            method="POST",
+            url=f"{helpers.BASE_URL}/entity/{self.entity_type}/delete",
+            json=[_delete_item(self.entity_type, x) for x in self.ids],
+        )
+
+    def from_response(
+        self, result: list
+    ) -> typing.List[typing.Optional[MoySkladError]]:
+        """
+        :return: For each id, in the same order: None if it was deleted, or MoySkladError
+         (Для каждого id, в том же порядке: None, если объект удален, или MoySkladError)
+        """
+        if len(result) != len(self.ids):
+            raise ValueError(
+                f"Expected {len(self.ids)} objects in response, got {len(result)}"
+            )
+        return [
+            MoySkladError(item["errors"][0])
+            if isinstance(item, dict) and item.get("errors")
+            else None
+            for item in result
+        ]
+
+
+class GetByIdsRequest(types.ApiRequest):
+    """
+    Get up to 1000 objects of one type by their ids in one request (GET /entity/<type>?filter=id=...;id=...).
+    Objects that are not found are simply missing from the result.
+    (Получение до 1000 объектов одного типа по их id одним запросом (GET /entity/<type>?filter=id=...;id=...).
+    Ненайденные объекты просто отсутствуют в результате.)
+    """
+
+    def __init__(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        ids: typing.List[str],
+    ):
+        """
+
+        :param entity: Entity type name ("product") or model class (Product) (Тип сущности ("product") или класс модели (Product))
+        :param ids: Object ids (id объектов)
+        """
+        entity = helpers.get_entity_type(entity)
+        self.model = types.get_model_class((entity,))
+        if self.model is None:
+            raise ValueError(f"Unknown entity type: {entity}")
+        if not ids:
+            raise ValueError("ids must not be empty")
+        if len(ids) > helpers.MAX_PAGE_SIZE:
+            raise ValueError(
+                f"At most {helpers.MAX_PAGE_SIZE} objects can be requested at once"
+            )
+        self.entity_type = entity
+        self.ids = ids
+
+    def to_request(self) -> RequestData:
+        return RequestData(
+            method="GET",
+            url=f"{helpers.BASE_URL}/entity/{self.entity_type}",
+            params={
+                "filter": ";".join(f"id={x}" for x in self.ids),
+                "limit": helpers.MAX_PAGE_SIZE,
+            },
+        )
+
+    def from_response(self, result: dict) -> typing.List[types.MoySkladBaseClass]:
+        return self.parse_rows(self.model, result["rows"])
+
+
+class GetEntityListRequest(types.ApiRequest):
+    """
+    List of objects of any type (GET /entity/<type>), converted to the model registered for the type.
+    (Список объектов любого типа (GET /entity/<type>), преобразуется в модель, зарегистрированную для типа.)
+    """
+
+    def __init__(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        limit: int = helpers.MAX_PAGE_SIZE,
+        offset: int = 0,
+    ):
+        """
+
+        :param entity: Entity type name ("product") or model class (Product) (Тип сущности ("product") или класс модели (Product))
+        :param limit: Limit of entities to extract (Лимит сущностей для извлечения)
+        :param offset: Offset in the list of entities (Отступ в выдаваемом списке сущностей)
+        """
+        entity = helpers.get_entity_type(entity)
+        self.model = types.get_model_class((entity,))
+        if self.model is None:
+            raise ValueError(f"Unknown entity type: {entity}")
+        self.entity_type = entity
+        self.limit = limit
+        self.offset = offset
+
+    def to_request(self) -> RequestData:
+        return RequestData(
+            method="GET",
+            url=f"{helpers.BASE_URL}/entity/{self.entity_type}",
+            params={"limit": self.limit, "offset": self.offset},
+        )
+
+    def from_response(self, result: dict) -> typing.List[types.MoySkladBaseClass]:
+        return self.parse_rows(self.model, result["rows"])
@@ -41,6 +41,41 @@ class CashIn(types.MoySkladBaseClass):
     facture_out: typing.Optional[types.Meta]
     operations: typing.Optional[typing.List[dict]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "payment_purpose": ("paymentPurpose", None),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "sales_channel": ("salesChannel", helpers.get_meta),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_sum": ("vatSum", None),
+        "facture_out": ("factureOut", helpers.get_meta),
+        "operations": ("operations", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CashIn":
         instance = cls()
@@ -179,7 +214,7 @@ class GetCashInsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CashIn]:
-        return [CashIn.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CashIn, result["rows"])
 
 
 class CreateCashInRequest(types.ApiRequest):
@@ -56,6 +56,57 @@ class CommissionReportIn(types.MoySkladBaseClass):
     vat_sum: typing.Optional[float]
     payments: typing.Optional[typing.List[types.Meta]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "commission_overhead": ("commissionOverhead", None),
+        "commission_period_end": ("commissionPeriodEnd", helpers.parse_date),
+        "commission_period_start": ("commissionPeriodStart", helpers.parse_date),
+        "commitent_sum": ("commitentSum", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "payed_sum": ("payedSum", None),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "return_to_commissioner_positions": ("returnToCommissionerPositions", None),
+        "reward_percent": ("rewardPercent", None),
+        "reward_type": ("rewardType", None),
+        "sales_channel": ("salesChannel", helpers.get_meta),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+        "payments": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("payments", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CommissionReportIn":
         instance = cls()
@@ -90,7 +141,7 @@ class CommissionReportIn(types.MoySkladBaseClass):
         )
         instance.owner = helpers.get_meta(dict_data.get("owner"))
         instance.payed_sum = dict_data.get("payedSum")
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published")
@@ -132,6 +183,18 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "reward": ("reward", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -163,6 +226,17 @@ class ReturnPosition(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "reward": ("reward", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ReturnPosition":
         instance = cls()
@@ -313,7 +387,7 @@ class GetCommissionReportInsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CommissionReportIn]:
-        return [CommissionReportIn.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CommissionReportIn, result["rows"])
 
 
 class CreateCommissionReportInRequest(types.ApiRequest):
@@ -600,7 +674,7 @@ class GetCommissionReportInPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetCommissionReportInPositionRequest(types.ApiRequest):
@@ -745,7 +819,7 @@ class GetCommissionReportInReturnPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ReturnPosition]:
-        return [ReturnPosition.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ReturnPosition, result["rows"])
 
 
 class GetCommissionReportInReturnPositionRequest(types.ApiRequest):
@@ -50,6 +50,55 @@ class CommissionReportOut(types.MoySkladBaseClass):
     vat_sum: typing.Optional[float]
     payments: typing.Optional[typing.List[types.Meta]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "commission_period_end": ("commissionPeriodEnd", helpers.parse_date),
+        "commission_period_start": ("commissionPeriodStart", helpers.parse_date),
+        "commitent_sum": ("commitentSum", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "payed_sum": ("payedSum", None),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "reward_percent": ("rewardPercent", None),
+        "reward_type": ("rewardType", None),
+        "shared": ("shared", None),
+        "sales_channel": ("salesChannel", helpers.get_meta),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+        "payments": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("payments", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CommissionReportOut":
         instance = cls()
@@ -83,7 +132,7 @@ class CommissionReportOut(types.MoySkladBaseClass):
         )
         instance.owner = helpers.get_meta(dict_data.get("owner"))
         instance.payed_sum = dict_data.get("payedSum")
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published")
@@ -120,6 +169,18 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "reward": ("reward", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -255,7 +316,7 @@ class GetCommissionReportOutsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CommissionReportOut]:
-        return [CommissionReportOut.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CommissionReportOut, result["rows"])
 
 
 class CreateCommissionReportOutRequest(types.ApiRequest):
@@ -515,7 +576,7 @@ class GetCommissionReportOutPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetCommissionReportOutPositionRequest(types.ApiRequest):
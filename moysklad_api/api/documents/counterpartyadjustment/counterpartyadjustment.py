@@ -30,6 +30,30 @@ class CounterpartyAdjustment(types.MoySkladBaseClass):
     sum: typing.Optional[float]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "shared": ("shared", None),
+        "sum": ("sum", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CounterpartyAdjustment":
         instance = cls()
@@ -129,7 +153,7 @@ class GetCounterpartyAdjustmentsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CounterpartyAdjustment]:
-        return [CounterpartyAdjustment.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CounterpartyAdjustment, result["rows"])
 
 
 class CreateCounterpartyAdjustmentRequest(types.ApiRequest):
@@ -112,6 +112,96 @@ class CustomerOrder(types.MoySkladBaseClass):
     moves: typing.Optional[typing.List[types.Meta]]
     prepayments: typing.Optional[typing.List[types.Meta]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "delivery_planned_moment": ("deliveryPlannedMoment", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "invoiced_sum": ("invoicedSum", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "payed_sum": ("payedSum", None),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "reserved_sum": ("reservedSum", None),
+        "sales_channel": ("salesChannel", helpers.get_meta),
+        "shared": ("shared", None),
+        "shipment_address": ("shipmentAddress", None),
+        "shipment_address_full": ("shipmentAddressFull", None),
+        "shipped_sum": ("shippedSum", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "tax_system": ("taxSystem", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+        "purchase_orders": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("purchaseOrders", [])
+            ],
+        ),
+        "demands": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("demands", [])
+            ],
+        ),
+        "payments": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("payments", [])
+            ],
+        ),
+        "production_tasks": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("productionTasks", [])
+            ],
+        ),
+        "invoices_out": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("invoicesOut", [])
+            ],
+        ),
+        "moves": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("moves", [])
+            ],
+        ),
+        "prepayments": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("prepayments", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CustomerOrder":
         instance = cls()
@@ -142,7 +232,7 @@ class CustomerOrder(types.MoySkladBaseClass):
         )
         instance.owner = helpers.get_meta(dict_data.get("owner"))
         instance.payed_sum = dict_data.get("payedSum")
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published")
@@ -220,6 +310,21 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "discount": ("discount", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "reserve": ("reserve", None),
+        "shipped": ("shipped", None),
+        "tax_system": ("taxSystem", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -367,7 +472,7 @@ class GetCustomerOrdersRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CustomerOrder]:
-        return [CustomerOrder.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CustomerOrder, result["rows"])
 
 
 class CreateCustomerOrderRequest(types.ApiRequest):
@@ -645,7 +750,7 @@ class GetCustomerOrderPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class CreateCustomerOrderPositionRequest(types.ApiRequest):
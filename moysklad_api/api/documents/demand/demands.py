@@ -89,6 +89,48 @@ class Demand(types.MoySkladBaseClass):
     vat_included: typing.Optional[bool]
     vat_sum: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "overhead": ("overhead", None),
+        "owner": ("owner", helpers.get_meta),
+        "payed_sum": ("payedSum", None),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "sales_channel": ("salesChannel", helpers.get_meta),
+        "shared": ("shared", None),
+        "shipment_address": ("shipmentAddress", None),
+        "shipment_address_full": ("shipmentAddressFull", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Demand":
         instance = cls()
@@ -116,7 +158,7 @@ class Demand(types.MoySkladBaseClass):
         instance.overhead = dict_data.get("overhead")
         instance.owner = helpers.get_meta(dict_data.get("owner"))
         instance.payed_sum = dict_data.get("payedSum")
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published")
@@ -176,6 +218,24 @@ class DemandPosition(types.MoySkladBaseClass):
     vat: int
     vat_enabled: bool
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "cost": ("cost", None),
+        "discount": ("discount", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "slot": ("slot", helpers.get_meta),
+        "things": ("things", None),
+        "tracking_codes": ("trackingCodes", None),
+        "tracking_codes_1162": ("trackingCodes_1162", None),
+        "overhead": ("overhead", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "DemandPosition":
         instance = cls()
@@ -462,7 +522,7 @@ class GetDemandsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Demand]:
-        return [Demand.from_json(demand_json) for demand_json in result["rows"]]
+        return self.parse_rows(Demand, result["rows"])
 
 
 class DeleteDemandRequest(types.ApiRequest):
@@ -769,9 +829,8 @@ class GetDemandPositionsRequest(types.ApiRequest):
             params=params,
         )
 
-    @classmethod
-    def from_response(cls, dict_data: dict) -> typing.List[DemandPosition]:
-        return [DemandPosition.from_json(item) for item in dict_data["rows"]]
+    def from_response(self, result: dict) -> typing.List[DemandPosition]:
+        return self.parse_rows(DemandPosition, result["rows"])
 
 
 class CreateDemandPositionsRequest(types.ApiRequest):
@@ -37,6 +37,36 @@ class EmissionOrder(types.MoySkladBaseClass):
     updated: typing.Optional[datetime.datetime]
     production_tasks: typing.Optional[typing.List[types.Meta]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "created": ("created", helpers.parse_date),
+        "description": ("description", None),
+        "document_state": ("documentState", None),
+        "emission_type": ("emissionType", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "tracking_type": ("trackingType", None),
+        "updated": ("updated", helpers.parse_date),
+        "production_tasks": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("productionTasks", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "EmissionOrder":
         instance = cls()
@@ -53,7 +83,7 @@ class EmissionOrder(types.MoySkladBaseClass):
         instance.name = dict_data.get("name")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.published = dict_data.get("published")
         instance.shared = dict_data.get("shared")
@@ -79,6 +109,15 @@ class Position(types.MoySkladBaseClass):
     quantity: typing.Optional[float]
     status: typing.Optional[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "quantity": ("quantity", None),
+        "status": ("status", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -165,7 +204,7 @@ class GetEmissionOrdersRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[EmissionOrder]:
-        return [EmissionOrder.from_json(x) for x in result["rows"]]
+        return self.parse_rows(EmissionOrder, result["rows"])
 
 
 class CreateEmissionOrderRequest(types.ApiRequest):
@@ -321,7 +360,7 @@ class GetEmissionOrderPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetEmissionOrderPositionRequest(types.ApiRequest):
@@ -77,6 +77,37 @@ class Enter(types.MoySkladBaseClass):
     sync_id: typing.Optional[str]
     updated: datetime.datetime
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "overhead": ("overhead", None),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Enter":
         instance = cls()
@@ -97,7 +128,7 @@ class Enter(types.MoySkladBaseClass):
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.overhead = dict_data.get("overhead")
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published")
@@ -151,6 +182,21 @@ class EnterPosition(types.MoySkladBaseClass):
     slot: typing.Optional[types.Meta]
     things: typing.Optional[dict]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "country": ("country", helpers.get_meta),
+        "gtd": ("gtd", None),
+        "id": ("id", None),
+        "overhead": ("overhead", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "reason": ("reason", None),
+        "slot": ("slot", helpers.get_meta),
+        "things": ("things", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "EnterPosition":
         instance = cls()
@@ -215,7 +261,7 @@ class GetEntersRequest(types.ApiRequest):
         )
 
     def from_response(self, result) -> typing.List[Enter]:
-        return [Enter.from_json(row) for row in result["rows"]]
+        return self.parse_rows(Enter, result["rows"])
 
 
 class CreateEnterRequest(types.ApiRequest):
@@ -660,7 +706,7 @@ class GetEnterPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result) -> typing.List[EnterPosition]:
-        return [EnterPosition.from_json(position) for position in result["rows"]]
+        return self.parse_rows(EnterPosition, result["rows"])
 
 
 class CreateEnterPositionRequest(types.ApiRequest):
@@ -734,7 +780,7 @@ class CreateEnterPositionRequest(types.ApiRequest):
         )
 
     def from_response(self, result) -> typing.List[EnterPosition]:
-        return [EnterPosition.from_json(position) for position in result["rows"]]
+        return self.parse_rows(EnterPosition, result["rows"])
 
 
 class GetEnterPositionRequest(types.ApiRequest):
@@ -39,6 +39,49 @@ class FactureIn(types.MoySkladBaseClass):
     supplies: typing.Optional[typing.List[types.Meta]]
     payments: typing.Optional[typing.List[types.Meta]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "incoming_date": ("incomingDate", helpers.parse_date),
+        "incoming_number": ("incomingNumber", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "supplies": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("supplies", [])
+            ],
+        ),
+        "payments": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("payments", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "FactureIn":
         instance = cls()
@@ -173,7 +216,7 @@ class GetFactureInsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[FactureIn]:
-        return [FactureIn.from_json(x) for x in result["rows"]]
+        return self.parse_rows(FactureIn, result["rows"])
 
 
 class CreateFactureInRequest(types.ApiRequest):
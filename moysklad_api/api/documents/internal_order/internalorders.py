@@ -77,6 +77,53 @@ class InternalOrder(types.MoySkladBaseClass):
     vat_included: typing.Optional[bool]
     vat_sum: float
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "delivery_planned_moment": ("deliveryPlannedMoment", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "moves": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("move", [])
+            ],
+        ),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "project": ("project", helpers.get_meta),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "purchase_orders": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("purchaseOrders", [])
+            ],
+        ),
+        "rate": ("rate", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "InternalOrder":
         instance = cls()
@@ -102,7 +149,7 @@ class InternalOrder(types.MoySkladBaseClass):
         instance.name = dict_data.get("name")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.printed = dict_data.get("printed")
         instance.published = dict_data.get("published")
@@ -139,6 +186,15 @@ class Position(types.MoySkladBaseClass):
     vatEnabled 	Boolean 	Включен ли НДС для позиции. С помощью этого флага для позиции можно выставлять НДС = 0 или НДС = "без НДС". (vat = 0, vatEnabled = false) -> vat = "без НДС", (vat = 0, vatEnabled = true) -> vat = 0%. Обязательное при ответе
     """
 
+    account_id: typing.Optional[str]
+    assortment: typing.Optional[types.Meta]
+    id: typing.Optional[str]
+    pack: typing.Optional[dict]
+    price: float
+    quantity: float
+    vat: int
+    vat_enabled: typing.Optional[bool]
+
     def __init__(
         self,
         account_id: typing.Optional[str] = None,
@@ -150,14 +206,28 @@ class Position(types.MoySkladBaseClass):
         vat: typing.Optional[int] = None,
         vat_enabled: typing.Optional[bool] = None,
     ):
-        self.account_id: typing.Optional[str] = account_id
-        self.assortment: typing.Optional[types.Meta] = assortment
-        self.id: typing.Optional[str] = id_
-        self.pack: typing.Optional[dict] = pack
-        self.price: float = price
-        self.quantity: float = quantity
-        self.vat: int = vat
-        self.vat_enabled: typing.Optional[bool] = vat_enabled
+        self.account_id = account_id
+        self.assortment = assortment
+        self.id = id_
+        self.pack = pack
+        self.price = price
+        self.quantity = quantity
+        self.vat = vat
+        self.vat_enabled = vat_enabled
+
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": (
+            None,
+            lambda dict_data: dict_data.get("assortment", {}).get("meta"),
+        ),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
 
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
@@ -221,7 +291,7 @@ class GetInternalOrdersRequest(types.ApiRequest):
         )
 
     def from_response(self, response: dict) -> typing.List[InternalOrder]:
-        return [InternalOrder.from_json(i) for i in response["rows"]]
+        return self.parse_rows(InternalOrder, response["rows"])
 
 
 class CreateInternalOrderRequest(types.ApiRequest):
@@ -667,7 +737,7 @@ class GetOrderPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, response: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in response["rows"]]
+        return self.parse_rows(Position, response["rows"])
 
 
 class AddOrderPositionsRequest(types.ApiRequest):
@@ -35,6 +35,35 @@ class Inventory(types.MoySkladBaseClass):
     enters: typing.Optional[types.Meta]
     losses: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "enters": ("enters", helpers.get_meta),
+        "losses": ("losses", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Inventory":
         instance = cls()
@@ -53,7 +82,7 @@ class Inventory(types.MoySkladBaseClass):
         instance.name = dict_data.get("name")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.published = dict_data.get("published")
         instance.shared = dict_data.get("shared")
@@ -82,6 +111,18 @@ class Position(types.MoySkladBaseClass):
     price: typing.Optional[float]
     quantity: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "calculated_quantity": ("calculatedQuantity", None),
+        "correction_amount": ("correctionAmount", None),
+        "correction_sum": ("correctionSum", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -180,7 +221,7 @@ class GetInventoriesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Inventory]:
-        return [Inventory.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Inventory, result["rows"])
 
 
 class CreateInventoryRequest(types.ApiRequest):
@@ -368,7 +409,7 @@ class GetInventoryPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetInventoryPositionRequest(types.ApiRequest):
@@ -94,6 +94,58 @@ class InvoiceIn(types.MoySkladBaseClass):
     supplies: typing.List[types.Meta]
     purchase_order: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": (None, lambda dict_data: dict_data.get("applicable", False)),
+        "attributes": (None, lambda dict_data: dict_data.get("attributes", [])),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": (None, lambda dict_data: dict_data.get("files", [])),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "incoming_date": ("incomingDate", helpers.parse_date),
+        "incoming_number": ("incomingNumber", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "payed_sum": ("payedSum", None),
+        "payment_planned_moment": ("paymentPlannedMoment", helpers.parse_date),
+        "positions": (
+            None,
+            lambda dict_data: helpers.get_expanded(dict_data.get("positions", [])),
+        ),
+        "printed": (None, lambda dict_data: dict_data.get("printed", False)),
+        "project": ("project", helpers.get_meta),
+        "published": (None, lambda dict_data: dict_data.get("published", False)),
+        "rate": ("rate", None),
+        "shared": (None, lambda dict_data: dict_data.get("shared", False)),
+        "shipped_sum": ("shippedSum", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": (None, lambda dict_data: dict_data.get("vatEnabled", False)),
+        "vat_included": (None, lambda dict_data: dict_data.get("vatIncluded", False)),
+        "vat_sum": ("vatSum", None),
+        "supplies": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("supply", [])
+            ],
+        ),
+        "purchase_order": ("purchaseOrder", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "InvoiceIn":
         instance = cls()
@@ -125,7 +177,7 @@ class InvoiceIn(types.MoySkladBaseClass):
         instance.payment_planned_moment = helpers.parse_date(
             dict_data.get("paymentPlannedMoment")
         )
-        instance.positions = dict_data.get("positions", [])
+        instance.positions = helpers.get_expanded(dict_data.get("positions", []))
         instance.printed = dict_data.get("printed", False)
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published", False)
@@ -193,7 +245,7 @@ class GetInvoicesInRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[InvoiceIn]:
-        return [InvoiceIn.from_json(obj_json) for obj_json in result["rows"]]
+        return self.parse_rows(InvoiceIn, result["rows"])
 
 
 class GetInvoiceInRequest(types.ApiRequest):
@@ -485,6 +537,18 @@ class InvoiceInPosition(types.MoySkladBaseClass):
     vat_enabled: typing.Optional[bool]
     assortment: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "meta": ("meta", None),
+        "id": ("id", None),
+        "account_id": ("accountId", None),
+        "quantity": ("quantity", None),
+        "price": ("price", None),
+        "discount": ("discount", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+        "assortment": ("assortment", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, data: dict) -> "InvoiceInPosition":
         instance = cls()
@@ -816,7 +880,7 @@ class GetInvoiceInPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, response: dict) -> typing.List[InvoiceInPosition]:
-        return [InvoiceInPosition.from_json(item) for item in response.get("rows", [])]
+        return self.parse_rows(InvoiceInPosition, response.get("rows", []))
 
 
 class CreateInvoiceInPositionRequest(types.ApiRequest):
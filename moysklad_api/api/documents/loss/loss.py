@@ -39,6 +39,39 @@ class Loss(types.MoySkladBaseClass):
     sales_return: typing.Optional[types.Meta]
     inventory: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "expense_item": ("expenseItem", helpers.get_meta),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "sales_return": ("salesReturn", helpers.get_meta),
+        "inventory": ("inventory", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Loss":
         instance = cls()
@@ -59,7 +92,7 @@ class Loss(types.MoySkladBaseClass):
         instance.name = dict_data.get("name")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published")
@@ -92,6 +125,20 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "declaration": ("declaration", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "reason": ("reason", None),
+        "slot": ("slot", helpers.get_meta),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -204,7 +251,7 @@ class GetLossesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Loss]:
-        return [Loss.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Loss, result["rows"])
 
 
 class CreateLossRequest(types.ApiRequest):
@@ -416,7 +463,7 @@ class GetLossPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class CreateLossPositionRequest(types.ApiRequest):
@@ -76,6 +76,40 @@ class Move(types.MoySkladBaseClass):
     target_store: types.Meta
     updated: datetime.datetime
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "internal_order": ("internalOrder", helpers.get_meta),
+        "custom_order": ("customOrder", helpers.get_meta),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "overhead": ("overhead", None),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "shared": ("shared", None),
+        "source_store": ("sourceStore", helpers.get_meta),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "target_store": ("targetStore", helpers.get_meta),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Move":
         instance = cls()
@@ -98,7 +132,7 @@ class Move(types.MoySkladBaseClass):
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.overhead = dict_data.get("overhead")
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published")
@@ -143,6 +177,19 @@ class MovePosition(types.MoySkladBaseClass):
     target_slot: types.Meta
     things: typing.List[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.construct_or_meta),
+        "id": ("id", None),
+        "overhead": ("overhead", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "source_slot": ("sourceSlot", helpers.get_meta),
+        "target_slot": ("targetSlot", helpers.get_meta),
+        "things": ("things", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "MovePosition":
         instance = cls()
@@ -206,7 +253,7 @@ class GetMovesRequest(types.ApiRequest):
         )
 
     def from_response(self, result) -> typing.List[Move]:
-        return [Move.from_json(move) for move in result["rows"]]
+        return self.parse_rows(Move, result["rows"])
 
 
 class CreateMoveRequest(types.ApiRequest):
@@ -637,7 +684,7 @@ class GetMovePositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result) -> typing.List[MovePosition]:
-        return [MovePosition.from_json(item) for item in result["rows"]]
+        return self.parse_rows(MovePosition, result["rows"])
 
 
 class CreateMovePositionRequest(types.ApiRequest):
@@ -692,7 +739,7 @@ class CreateMovePositionRequest(types.ApiRequest):
         )
 
     def from_response(self, result) -> typing.List[MovePosition]:
-        return [MovePosition.from_json(item) for item in result["rows"]]
+        return self.parse_rows(MovePosition, result["rows"])
 
 
 class GetMovePositionRequest(types.ApiRequest):
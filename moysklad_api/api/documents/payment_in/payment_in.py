@@ -45,6 +45,45 @@ class PaymentIn(types.MoySkladBaseClass):
     facture_out: typing.Optional[types.Meta]
     operations: typing.Optional[typing.List[dict]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "incoming_date": ("incomingDate", helpers.parse_date),
+        "incoming_number": ("incomingNumber", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "payment_purpose": ("paymentPurpose", None),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "sales_channel": ("salesChannel", helpers.get_meta),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_sum": ("vatSum", None),
+        "facture_out": ("factureOut", helpers.get_meta),
+        "operations": ("operations", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "PaymentIn":
         instance = cls()
@@ -201,7 +240,7 @@ class GetPaymentInsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[PaymentIn]:
-        return [PaymentIn.from_json(x) for x in result["rows"]]
+        return self.parse_rows(PaymentIn, result["rows"])
 
 
 class CreatePaymentInRequest(types.ApiRequest):
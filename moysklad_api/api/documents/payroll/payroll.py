@@ -33,6 +33,33 @@ class Payroll(types.MoySkladBaseClass):
     start_payroll_period: typing.Optional[datetime.datetime]
     end_payroll_period: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "description": ("description", None),
+        "attributes": ("attributes", None),
+        "created": ("created", helpers.parse_date),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "start_payroll_period": ("startPayrollPeriod", helpers.parse_date),
+        "end_payroll_period": ("endPayrollPeriod", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Payroll":
         instance = cls()
@@ -50,7 +77,7 @@ class Payroll(types.MoySkladBaseClass):
         instance.name = dict_data.get("name")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.published = dict_data.get("published")
         instance.shared = dict_data.get("shared")
@@ -79,6 +106,15 @@ class Position(types.MoySkladBaseClass):
     base_salary: typing.Optional[float]
     piecework_salary: typing.Optional[float]
 
+    _json_fields = {
+        "meta": ("meta", None),
+        "account_id": ("accountId", None),
+        "id": ("id", None),
+        "employee": ("employee", helpers.get_meta),
+        "base_salary": ("baseSalary", None),
+        "piecework_salary": ("pieceworkSalary", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -177,7 +213,7 @@ class GetPayrollsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Payroll]:
-        return [Payroll.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Payroll, result["rows"])
 
 
 class CreatePayrollRequest(types.ApiRequest):
@@ -371,7 +407,7 @@ class GetPayrollPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetPayrollPositionRequest(types.ApiRequest):
@@ -46,6 +46,46 @@ class Prepayment(types.MoySkladBaseClass):
     vat_included: typing.Optional[bool]
     vat_sum: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "cash_sum": ("cashSum", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "customer_order": ("customerOrder", helpers.get_meta),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "no_cash_sum": ("noCashSum", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "qr_sum": ("qrSum", None),
+        "rate": ("rate", None),
+        "retail_shift": ("retailShift", helpers.get_meta),
+        "retail_store": ("retailStore", helpers.get_meta),
+        "returns": ("returns", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "tax_system": ("taxSystem", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Prepayment":
         instance = cls()
@@ -69,7 +109,7 @@ class Prepayment(types.MoySkladBaseClass):
         instance.no_cash_sum = dict_data.get("noCashSum")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.published = dict_data.get("published")
         instance.qr_sum = dict_data.get("qrSum")
@@ -104,6 +144,18 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "discount": ("discount", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -235,7 +287,7 @@ class GetPrepaymentsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Prepayment]:
-        return [Prepayment.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Prepayment, result["rows"])
 
 
 class CreatePrepaymentRequest(types.ApiRequest):
@@ -491,7 +543,7 @@ class GetPrepaymentPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetPrepaymentPositionRequest(types.ApiRequest):
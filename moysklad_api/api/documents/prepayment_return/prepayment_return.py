@@ -45,6 +45,45 @@ class PrepaymentReturn(types.MoySkladBaseClass):
     vat_included: typing.Optional[bool]
     vat_sum: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "cash_sum": ("cashSum", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "no_cash_sum": ("noCashSum", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "prepayment": ("prepayment", helpers.get_meta),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "qr_sum": ("qrSum", None),
+        "rate": ("rate", None),
+        "retail_shift": ("retailShift", helpers.get_meta),
+        "retail_store": ("retailStore", helpers.get_meta),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "tax_system": ("taxSystem", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "PrepaymentReturn":
         instance = cls()
@@ -67,7 +106,7 @@ class PrepaymentReturn(types.MoySkladBaseClass):
         instance.no_cash_sum = dict_data.get("noCashSum")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.prepayment = helpers.get_meta(dict_data.get("prepayment"))
         instance.printed = dict_data.get("printed")
         instance.published = dict_data.get("published")
@@ -102,6 +141,18 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "discount": ("discount", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -235,7 +286,7 @@ class GetPrepaymentReturnsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[PrepaymentReturn]:
-        return [PrepaymentReturn.from_json(x) for x in result["rows"]]
+        return self.parse_rows(PrepaymentReturn, result["rows"])
 
 
 class CreatePrepaymentReturnRequest(types.ApiRequest):
@@ -493,7 +544,7 @@ class GetPrepaymentReturnPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetPrepaymentReturnPositionRequest(types.ApiRequest):
@@ -44,6 +44,34 @@ class PriceList(types.MoySkladBaseClass):
     sync_id: typing.Optional[str]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "columns": ("columns", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "price_type": ("priceType", None),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "PriceList":
         instance = cls()
@@ -64,7 +92,7 @@ class PriceList(types.MoySkladBaseClass):
         instance.name = dict_data.get("name")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.price_type = dict_data.get("priceType")
         instance.printed = dict_data.get("printed")
         instance.published = dict_data.get("published")
@@ -86,6 +114,14 @@ class Position(types.MoySkladBaseClass):
     id: typing.Optional[str]
     pack: typing.Optional[dict]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "cells": ("cells", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -184,7 +220,7 @@ class GetPriceListsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[PriceList]:
-        return [PriceList.from_json(x) for x in result["rows"]]
+        return self.parse_rows(PriceList, result["rows"])
 
 
 class CreatePriceListRequest(types.ApiRequest):
@@ -374,7 +410,7 @@ class GetPriceListPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetPriceListPositionRequest(types.ApiRequest):
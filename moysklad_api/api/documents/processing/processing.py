@@ -41,6 +41,41 @@ class Processing(types.MoySkladBaseClass):
     updated: typing.Optional[datetime.datetime]
     processing_order: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "materials": ("materials", None),
+        "materials_store": ("materialsStore", helpers.get_meta),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "printed": ("printed", None),
+        "processing_plan": ("processingPlan", helpers.get_meta),
+        "processing_sum": ("processingSum", None),
+        "products": ("products", None),
+        "products_store": ("productsStore", helpers.get_meta),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "quantity": ("quantity", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "processing_order": ("processingOrder", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Processing":
         instance = cls()
@@ -92,6 +127,14 @@ class Material(types.MoySkladBaseClass):
     quantity: typing.Optional[float]
     slot: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "quantity": ("quantity", None),
+        "slot": ("slot", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Material":
         instance = cls()
@@ -114,6 +157,14 @@ class Product(types.MoySkladBaseClass):
     quantity: typing.Optional[float]
     slot: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "quantity": ("quantity", None),
+        "slot": ("slot", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Product":
         instance = cls()
@@ -240,7 +291,7 @@ class GetProcessingsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Processing]:
-        return [Processing.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Processing, result["rows"])
 
 
 class CreateProcessingRequest(types.ApiRequest):
@@ -476,7 +527,7 @@ class GetProcessingMaterialsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Material]:
-        return [Material.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Material, result["rows"])
 
 
 class GetProcessingMaterialRequest(types.ApiRequest):
@@ -599,7 +650,7 @@ class GetProcessingProductsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Product]:
-        return [Product.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Product, result["rows"])
 
 
 class GetProcessingProductRequest(types.ApiRequest):
@@ -38,6 +38,43 @@ class ProcessingOrder(types.MoySkladBaseClass):
     updated: typing.Optional[datetime.datetime]
     processings: typing.Optional[typing.List[types.Meta]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "delivery_planned_moment": ("deliveryPlannedMoment", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "processing_plan": ("processingPlan", helpers.get_meta),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "quantity": ("quantity", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "processings": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("processings", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProcessingOrder":
         instance = cls()
@@ -60,7 +97,7 @@ class ProcessingOrder(types.MoySkladBaseClass):
         instance.name = dict_data.get("name")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.processing_plan = helpers.get_meta(dict_data.get("processingPlan"))
         instance.project = helpers.get_meta(dict_data.get("project"))
@@ -89,6 +126,15 @@ class Position(types.MoySkladBaseClass):
     quantity: typing.Optional[float]
     reserve: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "quantity": ("quantity", None),
+        "reserve": ("reserve", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -200,7 +246,7 @@ class GetProcessingOrdersRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProcessingOrder]:
-        return [ProcessingOrder.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProcessingOrder, result["rows"])
 
 
 class CreateProcessingOrderRequest(types.ApiRequest):
@@ -420,7 +466,7 @@ class GetProcessingOrderPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetProcessingOrderPositionRequest(types.ApiRequest):
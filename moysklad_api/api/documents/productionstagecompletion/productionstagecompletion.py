@@ -34,6 +34,34 @@ class ProductionStageCompletion(types.MoySkladBaseClass):
     standard_hour_cost: typing.Optional[float]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "created": ("created", helpers.parse_date),
+        "defect": ("defect", None),
+        "description": ("description", None),
+        "enable_hour_accounting": ("enableHourAccounting", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "labour_unit_cost": ("labourUnitCost", None),
+        "standard_hour_unit": ("standardHourUnit", None),
+        "materials": ("materials", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "performer": ("performer", helpers.get_meta),
+        "processing_unit_cost": ("processingUnitCost", None),
+        "production_stage": ("productionStage", helpers.get_meta),
+        "production_volume": ("productionVolume", None),
+        "products": ("products", None),
+        "service": ("service", helpers.get_meta),
+        "shared": ("shared", None),
+        "standard_hour_cost": ("standardHourCost", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProductionStageCompletion":
         instance = cls()
@@ -76,6 +104,14 @@ class Material(types.MoySkladBaseClass):
     consumed_quantity: typing.Optional[float]
     things: typing.Optional[typing.List[str]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "consumed_quantity": ("consumedQuantity", None),
+        "things": ("things", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Material":
         instance = cls()
@@ -98,6 +134,14 @@ class Product(types.MoySkladBaseClass):
     produced_quantity: typing.Optional[float]
     things: typing.Optional[typing.List[str]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "produced_quantity": ("producedQuantity", None),
+        "things": ("things", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Product":
         instance = cls()
@@ -199,7 +243,7 @@ class GetProductionStageCompletionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProductionStageCompletion]:
-        return [ProductionStageCompletion.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProductionStageCompletion, result["rows"])
 
 
 class CreateProductionStageCompletionRequest(types.ApiRequest):
@@ -395,7 +439,7 @@ class GetProductionStageCompletionMaterialsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Material]:
-        return [Material.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Material, result["rows"])
 
 
 class CreateProductionStageCompletionMaterialRequest(types.ApiRequest):
@@ -480,7 +524,7 @@ class GetProductionStageCompletionProductsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Product]:
-        return [Product.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Product, result["rows"])
 
 
 class UpdateProductionStageCompletionProductRequest(types.ApiRequest):
@@ -48,6 +48,99 @@ class ProductionTask(types.MoySkladBaseClass):
     purchase_orders: typing.Optional[typing.List[types.Meta]]
     supplies: typing.Optional[typing.List[types.Meta]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "awaiting": ("awaiting", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "delivery_planned_moment": ("deliveryPlannedMoment", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "materials_store": ("materialsStore", helpers.get_meta),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "printed": ("printed", None),
+        "production_rows": ("productionRows", None),
+        "production_end": ("productionEnd", helpers.parse_date),
+        "production_start": ("productionStart", helpers.parse_date),
+        "products": ("products", None),
+        "products_store": ("productsStore", helpers.get_meta),
+        "published": ("published", None),
+        "reserve": ("reserve", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "updated": ("updated", helpers.parse_date),
+        "customer_orders": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("customerOrders", [])
+            ],
+        ),
+        "demands": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("demands", [])
+            ],
+        ),
+        "emission_orders": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("emissionOrders", [])
+            ],
+        ),
+        "internal_orders": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("internalOrders", [])
+            ],
+        ),
+        "moves": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("moves", [])
+            ],
+        ),
+        "production_tasks": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("productionTasks", [])
+            ],
+        ),
+        "production_task_supplies": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("productionTaskSupplies", [])
+            ],
+        ),
+        "purchase_orders": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("purchaseOrders", [])
+            ],
+        ),
+        "supplies": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("supplies", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProductionTask":
         instance = cls()
@@ -133,6 +226,17 @@ class ProductionRow(types.MoySkladBaseClass):
     production_volume: typing.Optional[float]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "processing_plan": ("processingPlan", helpers.get_meta),
+        "production_volume": ("productionVolume", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProductionRow":
         instance = cls()
@@ -160,6 +264,14 @@ class ProductionTaskResult(types.MoySkladBaseClass):
     plan_quantity: typing.Optional[float]
     production_row: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "plan_quantity": ("planQuantity", None),
+        "production_row": ("productionRow", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProductionTaskResult":
         instance = cls()
@@ -200,6 +312,30 @@ class ProductionStage(types.MoySkladBaseClass):
     standard_hour_unit: typing.Optional[float]
     planned_end_date: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "enable_hour_accounting": ("enableHourAccounting", None),
+        "files": ("files", None),
+        "id": ("id", None),
+        "instruction": ("instruction", None),
+        "meta": ("meta", None),
+        "labour_unit_cost": ("labourUnitCost", None),
+        "materials": ("materials", None),
+        "material_store": ("materialStore", helpers.get_meta),
+        "ordering_position": ("orderingPosition", None),
+        "stage": ("stage", helpers.get_meta),
+        "production_row": ("productionRow", helpers.get_meta),
+        "total_quantity": ("totalQuantity", None),
+        "completed_quantity": ("completedQuantity", None),
+        "available_quantity": ("availableQuantity", None),
+        "blocked_quantity": ("blockedQuantity", None),
+        "skipped_quantity": ("skippedQuantity", None),
+        "processing_unit_cost": ("processingUnitCost", None),
+        "standard_hour_cost": ("standardHourCost", None),
+        "standard_hour_unit": ("standardHourUnit", None),
+        "planned_end_date": ("plannedEndDate", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProductionStage":
         instance = cls()
@@ -237,6 +373,13 @@ class ProductionStageMaterial(types.MoySkladBaseClass):
     id: typing.Optional[str]
     plan_quantity: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "plan_quantity": ("planQuantity", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProductionStageMaterial":
         instance = cls()
@@ -364,7 +507,7 @@ class GetProductionTasksRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProductionTask]:
-        return [ProductionTask.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProductionTask, result["rows"])
 
 
 class CreateProductionTaskRequest(types.ApiRequest):
@@ -582,7 +725,7 @@ class GetProductionTaskRowsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProductionRow]:
-        return [ProductionRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProductionRow, result["rows"])
 
 
 class GetProductionTaskRowRequest(types.ApiRequest):
@@ -663,7 +806,7 @@ class GetProductionTaskProductsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProductionTaskResult]:
-        return [ProductionTaskResult.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProductionTaskResult, result["rows"])
 
 
 class GetProductionTaskProductRequest(types.ApiRequest):
@@ -785,7 +928,7 @@ class GetProductionStagesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProductionStage]:
-        return [ProductionStage.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProductionStage, result["rows"])
 
 
 class GetProductionStageRequest(types.ApiRequest):
@@ -868,7 +1011,7 @@ class GetProductionStageMaterialsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProductionStageMaterial]:
-        return [ProductionStageMaterial.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProductionStageMaterial, result["rows"])
 
 
 class CreateProductionStageMaterialRequest(types.ApiRequest):
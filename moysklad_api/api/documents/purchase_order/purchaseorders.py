@@ -104,6 +104,74 @@ class PurchaseOrder(types.MoySkladBaseClass):
     supplies: typing.Optional[typing.List[types.Meta]]
     internal_order: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "delivery_planned_moment": ("deliveryPlannedMoment", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "invoiced_sum": ("invoicedSum", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", None),
+        "payed_sum": ("payedSum", None),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "shared": ("shared", None),
+        "shipped_sum": ("shippedSum", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+        "wait_sum": ("waitSum", None),
+        "custom_orders": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True)
+                for x in dict_data.get("customOrders", [])
+            ],
+        ),
+        "invoices_in": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("invoicesIn", [])
+            ],
+        ),
+        "payments": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("payments", [])
+            ],
+        ),
+        "supplies": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("supply", [])
+            ],
+        ),
+        "internal_order": ("internalOrder", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "PurchaseOrder":
         instance = cls()
@@ -134,7 +202,7 @@ class PurchaseOrder(types.MoySkladBaseClass):
         )
         instance.owner = dict_data.get("owner")
         instance.payed_sum = dict_data.get("payedSum")
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published")
@@ -203,6 +271,21 @@ class PurchaseOrderPosition(types.MoySkladBaseClass):
     vat_enabled: bool
     wait: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "discount": ("discount", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "shipped": ("shipped", None),
+        "in_transit": ("inTransit", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+        "wait": ("wait", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "PurchaseOrderPosition":
         instance = cls()
@@ -267,7 +350,7 @@ class GetPurchaseOrderListRequest(types.ApiRequest):
         )
 
     def from_response(self, result) -> typing.List[PurchaseOrder]:
-        return [PurchaseOrder.from_json(item) for item in result["rows"]]
+        return self.parse_rows(PurchaseOrder, result["rows"])
 
 
 class CreatePurchaseOrderRequest(types.ApiRequest):
@@ -927,7 +1010,7 @@ class GetPurchaseOrderPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result) -> typing.List[PurchaseOrderPosition]:
-        return [PurchaseOrderPosition.from_json(item) for item in result["rows"]]
+        return self.parse_rows(PurchaseOrderPosition, result["rows"])
 
 
 class CreatePurchaseOrderPositionRequest(types.ApiRequest):
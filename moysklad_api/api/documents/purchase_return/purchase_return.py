@@ -48,6 +48,53 @@ class PurchaseReturn(types.MoySkladBaseClass):
     payed_sum: typing.Optional[float]
     payments: typing.Optional[typing.List[types.Meta]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+        "positions": ("positions", helpers.get_expanded),
+        "supply": ("supply", helpers.get_meta),
+        "facture_out": ("factureOut", helpers.get_meta),
+        "facture_in": ("factureIn", helpers.get_meta),
+        "payed_sum": ("payedSum", None),
+        "payments": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("payments", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "PurchaseReturn":
         instance = cls()
@@ -86,7 +133,7 @@ class PurchaseReturn(types.MoySkladBaseClass):
         instance.vat_enabled = dict_data.get("vatEnabled")
         instance.vat_included = dict_data.get("vatIncluded")
         instance.vat_sum = dict_data.get("vatSum")
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.supply = helpers.get_meta(dict_data.get("supply"))
         instance.facture_out = helpers.get_meta(dict_data.get("factureOut"))
         instance.facture_in = helpers.get_meta(dict_data.get("factureIn"))
@@ -112,6 +159,18 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "discount": ("discount", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -240,7 +299,7 @@ class GetPurchaseReturnsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[PurchaseReturn]:
-        return [PurchaseReturn.from_json(x) for x in result["rows"]]
+        return self.parse_rows(PurchaseReturn, result["rows"])
 
 
 class CreatePurchaseReturnRequest(types.ApiRequest):
@@ -492,7 +551,7 @@ class GetPurchaseReturnPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class CreatePurchaseReturnPositionRequest(types.ApiRequest):
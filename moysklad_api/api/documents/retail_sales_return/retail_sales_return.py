@@ -48,6 +48,48 @@ class RetailSalesReturn(types.MoySkladBaseClass):
     vat_included: typing.Optional[bool]
     vat_sum: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "cash_sum": ("cashSum", None),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "demand": ("demand", helpers.get_meta),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "no_cash_sum": ("noCashSum", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "qr_sum": ("qrSum", None),
+        "rate": ("rate", None),
+        "retail_shift": ("retailShift", helpers.get_meta),
+        "retail_store": ("retailStore", helpers.get_meta),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "tax_system": ("taxSystem", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "RetailSalesReturn":
         instance = cls()
@@ -75,7 +117,7 @@ class RetailSalesReturn(types.MoySkladBaseClass):
             dict_data.get("organizationAccount")
         )
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.published = dict_data.get("published")
         instance.qr_sum = dict_data.get("qrSum")
@@ -110,6 +152,18 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "discount": ("discount", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -252,7 +306,7 @@ class GetRetailSalesReturnsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[RetailSalesReturn]:
-        return [RetailSalesReturn.from_json(x) for x in result["rows"]]
+        return self.parse_rows(RetailSalesReturn, result["rows"])
 
 
 class CreateRetailSalesReturnRequest(types.ApiRequest):
@@ -528,7 +582,7 @@ class GetRetailSalesReturnPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetRetailSalesReturnPositionRequest(types.ApiRequest):
@@ -59,6 +59,59 @@ class RetailDemand(types.MoySkladBaseClass):
     vat_included: typing.Optional[bool]
     vat_sum: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "advance_payment_sum": ("advancePaymentSum", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "cash_sum": ("cashSum", None),
+        "check_number": ("checkNumber", None),
+        "check_sum": ("checkSum", None),
+        "cheque": ("cheque", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "customer_order": ("customerOrder", helpers.get_meta),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "document_number": ("documentNumber", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "gift_cards": ("giftCards", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "no_cash_sum": ("noCashSum", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "payed_sum": ("payedSum", None),
+        "positions": ("positions", helpers.get_expanded),
+        "prepayment_cash_sum": ("prepaymentCashSum", None),
+        "prepayment_no_cash_sum": ("prepaymentNoCashSum", None),
+        "prepayment_qr_sum": ("prepaymentQrSum", None),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "qr_sum": ("qrSum", None),
+        "rate": ("rate", None),
+        "retail_shift": ("retailShift", helpers.get_meta),
+        "retail_store": ("retailStore", helpers.get_meta),
+        "session_number": ("sessionNumber", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "tax_system": ("taxSystem", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "RetailDemand":
         instance = cls()
@@ -93,7 +146,7 @@ class RetailDemand(types.MoySkladBaseClass):
         )
         instance.owner = helpers.get_meta(dict_data.get("owner"))
         instance.payed_sum = dict_data.get("payedSum")
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.prepayment_cash_sum = dict_data.get("prepaymentCashSum")
         instance.prepayment_no_cash_sum = dict_data.get("prepaymentNoCashSum")
         instance.prepayment_qr_sum = dict_data.get("prepaymentQrSum")
@@ -135,6 +188,21 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "cost": ("cost", None),
+        "declaration": ("declaration", None),
+        "discount": ("discount", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "tracking_codes": ("trackingCodes", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -284,7 +352,7 @@ class GetRetailDemandsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[RetailDemand]:
-        return [RetailDemand.from_json(x) for x in result["rows"]]
+        return self.parse_rows(RetailDemand, result["rows"])
 
 
 class CreateRetailDemandRequest(types.ApiRequest):
@@ -570,7 +638,7 @@ class GetRetailDemandPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetRetailDemandPositionRequest(types.ApiRequest):
@@ -35,6 +35,35 @@ class RetailDrawerCashOut(types.MoySkladBaseClass):
     sync_id: typing.Optional[str]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "retail_shift": ("retailShift", helpers.get_meta),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "RetailDrawerCashOut":
         instance = cls()
@@ -157,7 +186,7 @@ class GetRetailDrawerCashOutsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[RetailDrawerCashOut]:
-        return [RetailDrawerCashOut.from_json(x) for x in result["rows"]]
+        return self.parse_rows(RetailDrawerCashOut, result["rows"])
 
 
 class CreateRetailDrawerCashOutRequest(types.ApiRequest):
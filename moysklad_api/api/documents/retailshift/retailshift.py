@@ -48,6 +48,48 @@ class RetailShift(types.MoySkladBaseClass):
     vat_enabled: typing.Optional[bool]
     vat_included: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "acquire": ("acquire", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "attributes": ("attributes", None),
+        "bank_comission": ("bankComission", None),
+        "bank_percent": ("bankPercent", None),
+        "cheque": ("cheque", None),
+        "close_date": ("closeDate", helpers.parse_date),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "operations": ("operations", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "payment_operations": ("paymentOperations", None),
+        "printed": ("printed", None),
+        "proceeds_cash": ("proceedsCash", None),
+        "proceeds_no_cash": ("proceedsNoCash", None),
+        "published": ("published", None),
+        "qr_acquire": ("qrAcquire", helpers.get_meta),
+        "qr_bank_comission": ("qrBankComission", None),
+        "qr_bank_percent": ("qrBankPercent", None),
+        "received_cash": ("receivedCash", None),
+        "received_no_cash": ("receivedNoCash", None),
+        "retail_store": ("retailStore", helpers.get_meta),
+        "shared": ("shared", None),
+        "store": ("store", helpers.get_meta),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "RetailShift":
         instance = cls()
@@ -189,7 +231,7 @@ class GetRetailShiftsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[RetailShift]:
-        return [RetailShift.from_json(x) for x in result["rows"]]
+        return self.parse_rows(RetailShift, result["rows"])
 
 
 class CreateRetailShiftRequest(types.ApiRequest):
@@ -53,6 +53,47 @@ class RetireOrder(types.MoySkladBaseClass):
     vat_included: typing.Optional[bool]
     vat_sum: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "destination_country": ("destinationCountry", helpers.get_meta),
+        "document_state": ("documentState", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "primary_document_name": ("primaryDocumentName", None),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "reason_description": ("reasonDescription", None),
+        "retire_order_type": ("retireOrderType", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "state_contract_id": ("stateContractId", None),
+        "supporting_transaction": ("supportingTransaction", None),
+        "supporting_transaction_date": (
+            "supportingTransactionDate",
+            helpers.parse_date,
+        ),
+        "supporting_transaction_number": ("supportingTransactionNumber", None),
+        "sync_id": ("syncId", None),
+        "tracking_type": ("trackingType", None),
+        "updated": ("updated", helpers.parse_date),
+        "sum": ("sum", None),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "RetireOrder":
         instance = cls()
@@ -73,7 +114,7 @@ class RetireOrder(types.MoySkladBaseClass):
         instance.name = dict_data.get("name")
         instance.organization = helpers.get_meta(dict_data.get("organization"))
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.primary_document_name = dict_data.get("primaryDocumentName")
         instance.printed = dict_data.get("printed")
         instance.published = dict_data.get("published")
@@ -114,6 +155,17 @@ class Position(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "tracking_codes": ("trackingCodes", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -240,7 +292,7 @@ class GetRetireOrdersRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[RetireOrder]:
-        return [RetireOrder.from_json(x) for x in result["rows"]]
+        return self.parse_rows(RetireOrder, result["rows"])
 
 
 class CreateRetireOrderRequest(types.ApiRequest):
@@ -460,7 +512,7 @@ class GetRetireOrderPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class GetRetireOrderPositionRequest(types.ApiRequest):
@@ -93,6 +93,54 @@ class Supply(types.MoySkladBaseClass):
     invoices_in: typing.List[types.Meta]
     facture_in: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "contract": ("contract", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "deleted": ("deleted", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", helpers.get_meta),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "incoming_date": ("incomingDate", helpers.parse_date),
+        "incoming_number": ("incomingNumber", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "overhead": ("overhead", None),
+        "owner": ("owner", helpers.get_meta),
+        "payed_sum": ("payedSum", None),
+        "positions": ("positions", helpers.get_expanded),
+        "printed": ("printed", None),
+        "project": ("project", helpers.get_meta),
+        "published": ("published", None),
+        "rate": ("rate", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+        "sum": ("sum", None),
+        "sync_id": ("syncId", None),
+        "updated": ("updated", helpers.parse_date),
+        "vat_enabled": ("vatEnabled", None),
+        "vat_included": ("vatIncluded", None),
+        "vat_sum": ("vatSum", None),
+        "invoices_in": (
+            None,
+            lambda dict_data: [
+                helpers.get_meta(x, must=True) for x in dict_data.get("invoicesIn", [])
+            ],
+        ),
+        "facture_in": ("factureIn", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Supply":
         instance = cls()
@@ -122,7 +170,7 @@ class Supply(types.MoySkladBaseClass):
         instance.overhead = dict_data.get("overhead")
         instance.owner = helpers.get_meta(dict_data.get("owner"))
         instance.payed_sum = dict_data.get("payedSum")
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.printed = dict_data.get("printed")
         instance.project = helpers.get_meta(dict_data.get("project"))
         instance.published = dict_data.get("published")
@@ -184,6 +232,23 @@ class Position(types.MoySkladBaseClass):
     vat: bool
     vat_enabled: bool
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "country": ("country", helpers.get_meta),
+        "discount": ("discount", None),
+        "gtd": ("gtd", None),
+        "id": ("id", None),
+        "pack": ("pack", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "slot": ("slot", helpers.get_meta),
+        "things": ("things", None),
+        "overhead": ("overhead", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Position":
         instance = cls()
@@ -250,7 +315,7 @@ class GetSuppliesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Supply]:
-        return [Supply.from_json(i) for i in result["rows"]]
+        return self.parse_rows(Supply, result["rows"])
 
 
 class CreateSupplyRequest(types.ApiRequest):
@@ -790,7 +855,7 @@ class GetSupplyPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Position]:
-        return [Position.from_json(position) for position in result["rows"]]
+        return self.parse_rows(Position, result["rows"])
 
 
 class CreateSupplyPositionRequest(types.ApiRequest):
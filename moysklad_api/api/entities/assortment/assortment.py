@@ -43,6 +43,42 @@ class Assortment(types.MoySkladBaseClass):
     in_transit: float
     quantity: float
 
+    _json_fields = {
+        "meta": ("meta", None),
+        "id": ("id", None),
+        "account_id": ("accountId", None),
+        "owner": ("owner", helpers.get_meta),
+        "shared": ("shared", None),
+        "group": ("group", helpers.get_meta),
+        "updated": ("updated", helpers.parse_date),
+        "name": ("name", None),
+        "code": ("code", None),
+        "external_code": ("externalCode", None),
+        "archived": ("archived", None),
+        "path_name": ("pathName", None),
+        "use_parent_vat": ("useParentVat", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+        "effective_vat": ("effectiveVat", None),
+        "effective_vat_enabled": ("effectiveVatEnabled", None),
+        "uom": ("uom", helpers.get_meta),
+        "images": ("images", helpers.get_meta),
+        "min_price": ("minPrice", None),
+        "sale_prices": (None, lambda dict_data: dict_data.get("salePrices") or []),
+        "supplier": ("supplier", helpers.get_meta),
+        "buy_price": ("buyPrice", None),
+        "article": ("article", None),
+        "weight": ("weight", None),
+        "volume": ("volume", None),
+        "barcodes": (None, lambda dict_data: dict_data.get("barcodes") or []),
+        "variants_count": ("variantsCount", None),
+        "is_serial_trackable": ("isSerialTrackable", None),
+        "stock": ("stock", None),
+        "reserve": ("reserve", None),
+        "in_transit": ("inTransit", None),
+        "quantity": ("quantity", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Assortment":
         instance = cls()
@@ -90,6 +126,11 @@ class AssortmentSettingsUniqueCodeRules(types.MoySkladBaseClass):
     check_unique_code: bool
     fill_unique_code: bool
 
+    _json_fields = {
+        "check_unique_code": ("checkUniqueCodeBoolean", None),
+        "fill_unique_code": ("fillUniqueCode", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "AssortmentSettingsUniqueCodeRules":
         instance = cls()
@@ -106,6 +147,11 @@ class AssortmentSettingsBarcodeRules(types.MoySkladBaseClass):
     fill_ean13_barcode: bool
     weight_barcode_prefix: int
 
+    _json_fields = {
+        "fill_ean13_barcode": ("fillEAN13Barcode", None),
+        "weight_barcode_prefix": ("weightBarcodePrefix", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "AssortmentSettingsBarcodeRules":
         instance = cls()
@@ -124,6 +170,23 @@ class AssortmentSettings(types.MoySkladBaseClass):
     created_shared: bool
     meta: types.Meta
 
+    _json_fields = {
+        "unique_code_rules": (
+            None,
+            lambda dict_data: AssortmentSettingsUniqueCodeRules.from_json(
+                dict_data.get("uniqueCodeRules")
+            ),
+        ),
+        "barcode_rules": (
+            None,
+            lambda dict_data: AssortmentSettingsBarcodeRules.from_json(
+                dict_data.get("barcodeRules")
+            ),
+        ),
+        "created_shared": ("createdShared", None),
+        "meta": ("meta", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "AssortmentSettings":
         instance = cls()
@@ -170,28 +233,42 @@ class GetAssortmentListRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List["Assortment"]:
-        return [Assortment.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Assortment, result["rows"])
 
 
 class DeleteAssortmentsRequest(types.ApiRequest):
-    def __init__(self, assortment_ids: typing.List[str]):
+    """
+    https://dev.moysklad.ru/doc/api/remap/1.2/dictionaries/#suschnosti-assortiment-massowoe-udalenie-pozicij-w-assortimente
+
+    Mass delete of assortment items (Массовое удаление позиций в Ассортименте)
+    """
+
+    def __init__(
+        self,
+        assortment_ids: typing.List[typing.Union[str, types.Meta]],
+    ):
+        """
+
+        :param assortment_ids: Product ids, or metas of products, services, bundles, variants
+         (id товаров, или meta товаров, услуг, комплектов, модификаций)
+        """
         self.assortment_ids = assortment_ids
 
     def to_request(self) -> RequestData:
         return RequestData(
             method="POST",
-            url=f"{helpers.BASE_URL}/entity/assortment",
+            url=f"{helpers.BASE_URL}/entity/assortment/delete",
             json=[
                 {
-                    {
-                        "meta": {
-                            "href": f"{helpers.BASE_URL}/entity/product/{x}",
-                            "metadataHref": f"{helpers.BASE_URL}/entity/product/metadata",
-                            "type": "product",
-                            "mediaType": "application/json",
-                        }
+                    "meta": {
+                        "href": f"{helpers.BASE_URL}/entity/product/{x}",
+                        "metadataHref": f"{helpers.BASE_URL}/entity/product/metadata",
+                        "type": "product",
+                        "mediaType": "application/json",
                     }
                 }
+                if isinstance(x, str)
+                else {"meta": x}
                 for x in self.assortment_ids
             ],
         )
@@ -42,6 +42,25 @@ class BonusProgram(types.MoySkladBaseClass):
     welcome_bonuses_mode: str
     welcome_bonuses_value: int
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "active": ("active", None),
+        "agent_tags": ("agentTags", None),
+        "all_agents": ("allAgents", None),
+        "all_products": ("allProducts", None),
+        "earn_rate_roubles_to_point": ("earnRateRoublesToPoint", None),
+        "earn_while_redeeming": ("earnWhileRedeeming", None),
+        "id": ("id", None),
+        "max_paid_rate_percents": ("maxPaidRatePercents", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "postponed_bonuses_delay_days": ("postponedBonusesDelayDays", None),
+        "spend_rate_points_to_rouble": ("spendRatePointsToRouble", None),
+        "welcome_bonuses_enabled": ("welcomeBonusesEnabled", None),
+        "welcome_bonuses_mode": ("welcomeBonusesMode", None),
+        "welcome_bonuses_value": ("welcomeBonusesValue", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "BonusProgram":
         instance = cls()
@@ -260,4 +279,4 @@ class GetBonusProgramsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[BonusProgram]:
-        return [BonusProgram.from_json(x) for x in result["rows"]]
+        return self.parse_rows(BonusProgram, result["rows"])
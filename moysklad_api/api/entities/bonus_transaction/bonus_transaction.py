@@ -59,6 +59,32 @@ class BonusTransaction(types.MoySkladBaseClass):
     updated: datetime.datetime
     updated_by: typing.Optional[str]
 
+    _json_fields = {
+        "meta": ("meta", None),
+        "id": ("id", None),
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "applicable": ("applicable", None),
+        "bonus_program": ("bonusProgram", helpers.get_meta),
+        "bonus_value": ("bonusValue", None),
+        "category_type": ("categoryType", None),
+        "code": ("code", None),
+        "created": ("created", helpers.parse_date),
+        "execution_date": ("executionDate", helpers.parse_date),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "parent_document": ("parentDocument", helpers.get_meta),
+        "shared": ("shared", None),
+        "transaction_status": ("transactionStatus", None),
+        "transaction_type": ("transactionType", None),
+        "updated": ("updated", helpers.parse_date),
+        "updated_by": ("updatedBy", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "BonusTransaction":
         instance = cls()
@@ -118,7 +144,7 @@ class GetBonusTransactionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List["BonusTransaction"]:
-        return [BonusTransaction.from_json(x) for x in result["rows"]]
+        return self.parse_rows(BonusTransaction, result["rows"])
 
 
 class CreateBonusTransactionRequest(types.ApiRequest):
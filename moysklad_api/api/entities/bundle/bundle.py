@@ -102,6 +102,48 @@ class Bundle(types.MoySkladBaseClass):
     volume: typing.Optional[float]
     weight: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "article": ("article", None),
+        "attributes": ("attributes", None),
+        "barcodes": ("barcodes", None),
+        "code": ("code", None),
+        "components": ("components", None),
+        "country": ("country", helpers.get_meta),
+        "description": ("description", None),
+        "discount_prohibited": ("discountProhibited", None),
+        "effective_vat": ("effectiveVat", None),
+        "effective_vat_enabled": ("effectiveVatEnabled", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "images": ("images", None),
+        "meta": ("meta", None),
+        "min_price": ("minPrice", None),
+        "name": ("name", None),
+        "overhead": ("overhead", None),
+        "owner": ("owner", helpers.get_meta),
+        "partial_disposal": ("partialDisposal", None),
+        "path_name": ("pathName", None),
+        "payment_item_type": ("paymentItemType", None),
+        "product_folder": ("productFolder", helpers.get_meta),
+        "sale_prices": ("salePrices", None),
+        "shared": ("shared", None),
+        "sync_id": ("syncId", None),
+        "tax_system": ("taxSystem", None),
+        "tnved": ("tnved", None),
+        "tracking_type": ("trackingType", None),
+        "uom": ("uom", helpers.get_meta),
+        "updated": ("updated", helpers.parse_date),
+        "use_parent_vat": ("useParentVat", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+        "volume": ("volume", None),
+        "weight": ("weight", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Bundle":
         instance = cls()
@@ -276,7 +318,7 @@ class GetBundlesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Bundle]:
-        return [Bundle.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Bundle, result["rows"])
 
 
 class CreateBundleRequest(types.ApiRequest):
@@ -555,6 +597,14 @@ class BundleComponent(types.MoySkladBaseClass):
     assortment: typing.Optional[types.Meta]
     quantity: typing.Optional[float]
 
+    _json_fields = {
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "quantity": ("quantity", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "BundleComponent":
         instance = cls()
@@ -594,7 +644,7 @@ class GetBundleComponentsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[BundleComponent]:
-        return [BundleComponent.from_json(x) for x in result["rows"]]
+        return self.parse_rows(BundleComponent, result["rows"])
 
 
 class AddBundleComponentRequest(types.ApiRequest):
@@ -21,6 +21,14 @@ class Cashier(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     retail_store: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "employee": ("employee", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "retail_store": ("retailStore", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Cashier":
         instance = cls()
@@ -60,7 +68,7 @@ class GetCashiersRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Cashier]:
-        return [Cashier.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Cashier, result["rows"])
 
 
 class GetCashierRequest(types.ApiRequest):
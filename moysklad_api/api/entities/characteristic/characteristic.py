@@ -21,6 +21,14 @@ class Characteristic(types.MoySkladBaseClass):
     required: typing.Optional[bool]
     type: typing.Optional[str]
 
+    _json_fields = {
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "required": ("required", None),
+        "type": ("type", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Characteristic":
         instance = cls()
@@ -33,6 +33,20 @@ class CompanySettings(types.MoySkladBaseClass):
     use_recycle_bin: typing.Optional[bool]
     account_country: typing.Optional[str]
 
+    _json_fields = {
+        "check_min_price": ("checkMinPrice", None),
+        "check_shipping_stock": ("checkShippingStock", None),
+        "company_address": ("companyAddress", None),
+        "currency": ("currency", None),
+        "discount_strategy": ("discountStrategy", None),
+        "global_operation_numbering": ("globalOperationNumbering", None),
+        "meta": ("meta", None),
+        "price_types": ("priceTypes", None),
+        "use_company_address": ("useCompanyAddress", None),
+        "use_recycle_bin": ("useRecycleBin", None),
+        "account_country": ("accountCountry", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CompanySettings":
         instance = cls()
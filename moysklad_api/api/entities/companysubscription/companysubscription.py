@@ -30,6 +30,13 @@ class CompanySubscription(types.MoySkladBaseClass):
     is_subscription_change_available: typing.Optional[bool]
     subscription_end_date: typing.Optional[int]
 
+    _json_fields = {
+        "role": ("role", None),
+        "tariff": ("tariff", None),
+        "is_subscription_change_available": ("isSubscriptionChangeAvailable", None),
+        "subscription_end_date": ("subscriptionEndDate", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CompanySubscription":
         instance = cls()
@@ -40,6 +40,24 @@ class Consignment(types.MoySkladBaseClass):
     name: typing.Optional[str]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "attributes": ("attributes", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "barcodes": ("barcodes", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "expiry_date": ("expiryDate", helpers.parse_date),
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "images": ("images", None),
+        "label": ("label", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Consignment":
         instance = cls()
@@ -91,7 +109,7 @@ class GetConsignmentsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Consignment]:
-        return [Consignment.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Consignment, result["rows"])
 
 
 class CreateConsignmentRequest(types.ApiRequest):
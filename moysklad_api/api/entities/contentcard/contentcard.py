@@ -29,6 +29,19 @@ class ContentCard(types.MoySkladBaseClass):
     sales_channels: typing.Optional[typing.List[dict]]
     images: typing.Optional[dict]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "card_content_name": ("cardContentName", None),
+        "description": ("description", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "sale_platform": ("salePlatform", helpers.get_meta),
+        "sales_channels": ("salesChannels", None),
+        "images": ("images", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ContentCard":
         instance = cls()
@@ -95,7 +108,7 @@ class GetContentCardsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ContentCard]:
-        return [ContentCard.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ContentCard, result["rows"])
 
 
 class CreateContentCardRequest(types.ApiRequest):
@@ -62,6 +62,35 @@ class Contract(types.MoySkladBaseClass):
     published: typing.Optional[bool]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "agent_account": ("agentAccount", helpers.get_meta),
+        "archived": ("archived", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "contract_type": ("contractType", None),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "name": ("name", None),
+        "organization_account": ("organizationAccount", helpers.get_meta),
+        "own_agent": ("ownAgent", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "rate": ("rate", None),
+        "reward_percent": ("rewardPercent", None),
+        "reward_type": ("rewardType", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sum": ("sum", None),
+        "printed": ("printed", None),
+        "published": ("published", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Contract":
         instance = cls()
@@ -126,7 +155,7 @@ class GetContractsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Contract]:
-        return [Contract.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Contract, result["rows"])
 
 
 class CreateContractRequest(types.ApiRequest):
@@ -113,6 +113,57 @@ class Counterparty(types.MoySkladBaseClass):
     okpo: typing.Optional[str]
     sex: typing.Optional[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "accounts": ("accounts", None),
+        "actual_address": ("actualAddress", None),
+        "actual_address_full": ("actualAddressFull", None),
+        "archived": ("archived", None),
+        "attributes": ("attributes", None),
+        "bonus_points": ("bonusPoints", None),
+        "bonus_program": ("bonusProgram", helpers.get_meta),
+        "code": ("code", None),
+        "company_type": ("companyType", None),
+        "contactpersons": ("contactpersons", None),
+        "created": ("created", helpers.parse_date),
+        "description": ("description", None),
+        "discount_card_number": ("discountCardNumber", None),
+        "discounts": ("discounts", None),
+        "email": ("email", None),
+        "external_code": ("externalCode", None),
+        "fax": ("fax", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "notes": ("notes", None),
+        "owner": ("owner", helpers.get_meta),
+        "phone": ("phone", None),
+        "price_type": ("priceType", None),
+        "sales_amount": ("salesAmount", None),
+        "shared": ("shared", None),
+        "state": ("state", helpers.get_meta),
+        "sync_id": ("syncId", None),
+        "tags": ("tags", None),
+        "updated": ("updated", helpers.parse_date),
+        "birth_date": ("birthDate", helpers.parse_date),
+        "certificate_date": ("certificateDate", helpers.parse_date),
+        "certificate_number": ("certificateNumber", None),
+        "inn": ("inn", None),
+        "kpp": ("kpp", None),
+        "legal_address": ("legalAddress", None),
+        "legal_address_full": ("legalAddressFull", None),
+        "legal_first_name": ("legalFirstName", None),
+        "legal_last_name": ("legalLastName", None),
+        "legal_middle_name": ("legalMiddleName", None),
+        "legal_title": ("legalTitle", None),
+        "ogrn": ("ogrn", None),
+        "ogrnip": ("ogrnip", None),
+        "okpo": ("okpo", None),
+        "sex": ("sex", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Counterparty":
         instance = cls()
@@ -255,7 +306,7 @@ class GetCounterpartiesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Counterparty]:
-        return [Counterparty.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Counterparty, result["rows"])
 
 
 class CreateCounterpartyRequest(types.ApiRequest):
@@ -359,6 +410,19 @@ class CounterpartyAccount(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "account_number": ("accountNumber", None),
+        "bank_location": ("bankLocation", None),
+        "bank_name": ("bankName", None),
+        "bic": ("bic", None),
+        "correspondent_account": ("correspondentAccount", None),
+        "id": ("id", None),
+        "is_default": ("isDefault", None),
+        "meta": ("meta", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CounterpartyAccount":
         instance = cls()
@@ -390,7 +454,7 @@ class GetCounterpartyAccountsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CounterpartyAccount]:
-        return [CounterpartyAccount.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CounterpartyAccount, result["rows"])
 
 
 class CreateCounterpartyAccountRequest(types.ApiRequest):
@@ -524,6 +588,20 @@ class ContactPerson(types.MoySkladBaseClass):
     position: typing.Optional[str]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "description": ("description", None),
+        "email": ("email", None),
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "phone": ("phone", None),
+        "position": ("position", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ContactPerson":
         instance = cls()
@@ -569,7 +647,7 @@ class GetContactPersonsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ContactPerson]:
-        return [ContactPerson.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ContactPerson, result["rows"])
 
 
 class CreateContactPersonRequest(types.ApiRequest):
@@ -697,6 +775,17 @@ class CounterpartyNote(types.MoySkladBaseClass):
     id: typing.Optional[str]
     meta: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "author": ("author", helpers.get_meta),
+        "author_application": ("authorApplication", helpers.get_meta),
+        "created": ("created", helpers.parse_date),
+        "description": ("description", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CounterpartyNote":
         instance = cls()
@@ -741,7 +830,7 @@ class GetCounterpartyNotesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CounterpartyNote]:
-        return [CounterpartyNote.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CounterpartyNote, result["rows"])
 
 
 class AddCounterpartyNoteRequest(types.ApiRequest):
@@ -822,6 +911,12 @@ class CounterpartySettings(types.MoySkladBaseClass):
     unique_code_rules: typing.Optional[dict]
     create_shared: typing.Optional[bool]
 
+    _json_fields = {
+        "meta": ("meta", None),
+        "unique_code_rules": ("uniqueCodeRules", None),
+        "create_shared": ("createShared", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CounterpartySettings":
         instance = cls()
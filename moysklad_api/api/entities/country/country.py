@@ -32,6 +32,20 @@ class Country(types.MoySkladBaseClass):
     shared: typing.Optional[bool]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "shared": ("shared", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Country":
         instance = cls()
@@ -79,7 +93,7 @@ class GetCountriesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Country]:
-        return [Country.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Country, result["rows"])
 
 
 class CreateCountryRequest(types.ApiRequest):
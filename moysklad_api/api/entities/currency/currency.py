@@ -42,6 +42,25 @@ class Currency(types.MoySkladBaseClass):
     rate_update_type: typing.Optional[str]
     system: bool
 
+    _json_fields = {
+        "archived": ("archived", None),
+        "code": ("code", None),
+        "default": ("default", None),
+        "full_name": ("fullName", None),
+        "id": ("id", None),
+        "indirect": ("indirect", None),
+        "iso_code": ("isoCode", None),
+        "major_unit": ("majorUnit", None),
+        "margin": ("margin", None),
+        "meta": ("meta", None),
+        "minor_unit": ("minorUnit", None),
+        "multiplicity": ("multiplicity", None),
+        "name": ("name", None),
+        "rate": ("rate", None),
+        "rate_update_type": ("rateUpdateType", None),
+        "system": ("system", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Currency":
         instance = cls()
@@ -254,4 +273,4 @@ class GetCurrenciesRequest(types.ApiRequest):
         )
 
     def from_response(self, response: dict) -> typing.List[Currency]:
-        return [Currency.from_json(x) for x in response["rows"]]
+        return self.parse_rows(Currency, response["rows"])
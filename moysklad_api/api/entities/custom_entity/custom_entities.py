@@ -20,6 +20,12 @@ class CustomEntity(types.MoySkladBaseClass):
     meta: types.Meta
     name: str
 
+    _json_fields = {
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CustomEntity":
         instance = cls()
@@ -63,6 +69,20 @@ class CustomEntityElement(types.MoySkladBaseClass):
     owner: types.Meta
     shared: bool
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "updated": ("updated", helpers.parse_date),
+        "group": ("group", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "shared": ("shared", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CustomEntityElement":
         instance = cls()
@@ -409,4 +429,4 @@ class GetCustomEntityElementsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List["CustomEntityElement"]:
-        return [CustomEntityElement.from_json(i) for i in result["rows"]]
+        return self.parse_rows(CustomEntityElement, result["rows"])
@@ -19,6 +19,13 @@ class CustomRole(types.MoySkladBaseClass):
     name: typing.Optional[str]
     permissions: typing.Optional[dict]
 
+    _json_fields = {
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "permissions": ("permissions", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CustomRole":
         instance = cls()
@@ -55,7 +62,7 @@ class GetCustomRolesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CustomRole]:
-        return [CustomRole.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CustomRole, result["rows"])
 
 
 class CreateCustomRoleRequest(types.ApiRequest):
@@ -45,6 +45,23 @@ class Discount(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     name: typing.Optional[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "active": ("active", None),
+        "agent_tags": ("agentTags", None),
+        "all_agents": ("allAgents", None),
+        "all_products": ("allProducts", None),
+        "assortment": ("assortment", None),
+        "product_folders": ("productFolders", None),
+        "discount": ("discount", None),
+        "special_price": ("specialPrice", None),
+        "levels": ("levels", None),
+        "use_price_type": ("usePriceType", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Discount":
         instance = cls()
@@ -91,7 +108,7 @@ class GetDiscountsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Discount]:
-        return [Discount.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Discount, result["rows"])
 
 
 class UpdateRoundingDiscountRequest(types.ApiRequest):
@@ -142,6 +159,20 @@ class AccumulationDiscount(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     name: typing.Optional[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "active": ("active", None),
+        "agent_tags": ("agentTags", None),
+        "all_agents": ("allAgents", None),
+        "all_products": ("allProducts", None),
+        "assortment": ("assortment", None),
+        "product_folders": ("productFolders", None),
+        "levels": ("levels", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "AccumulationDiscount":
         instance = cls()
@@ -308,6 +339,20 @@ class PersonalDiscount(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     name: typing.Optional[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "active": ("active", None),
+        "agent_tags": ("agentTags", None),
+        "all_agents": ("allAgents", None),
+        "all_products": ("allProducts", None),
+        "assortment": ("assortment", None),
+        "product_folders": ("productFolders", None),
+        "discount": ("discount", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "PersonalDiscount":
         instance = cls()
@@ -476,6 +521,21 @@ class SpecialPriceDiscount(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     name: typing.Optional[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "active": ("active", None),
+        "agent_tags": ("agentTags", None),
+        "all_agents": ("allAgents", None),
+        "all_products": ("allProducts", None),
+        "assortment": ("assortment", None),
+        "product_folders": ("productFolders", None),
+        "use_price_type": ("usePriceType", None),
+        "special_price": ("specialPrice", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "SpecialPriceDiscount":
         instance = cls()
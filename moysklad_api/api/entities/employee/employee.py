@@ -62,6 +62,35 @@ class Employee(types.MoySkladBaseClass):
     uid: typing.Optional[str]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "attributes": ("attributes", None),
+        "cashiers": ("cashiers", None),
+        "created": ("created", helpers.parse_date),
+        "description": ("description", None),
+        "email": ("email", None),
+        "external_code": ("externalCode", None),
+        "first_name": ("firstName", None),
+        "full_name": ("fullName", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "image": ("image", None),
+        "inn": ("inn", None),
+        "last_name": ("lastName", None),
+        "meta": ("meta", None),
+        "middle_name": ("middleName", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "phone": ("phone", None),
+        "position": ("position", None),
+        "salary": ("salary", None),
+        "shared": ("shared", None),
+        "short_fio": ("shortFio", None),
+        "uid": ("uid", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Employee":
         instance = cls()
@@ -124,7 +153,7 @@ class GetEmployeesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Employee]:
-        return [Employee.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Employee, result["rows"])
 
 
 class GetEmployeeRequest(types.ApiRequest):
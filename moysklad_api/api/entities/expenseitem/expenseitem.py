@@ -26,6 +26,17 @@ class ExpenseItem(types.MoySkladBaseClass):
     name: typing.Optional[str]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ExpenseItem":
         instance = cls()
@@ -70,7 +81,7 @@ class GetExpenseItemsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ExpenseItem]:
-        return [ExpenseItem.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ExpenseItem, result["rows"])
 
 
 class GetExpenseItemRequest(types.ApiRequest):
@@ -28,6 +28,17 @@ class File(types.MoySkladBaseClass):
     tiny: typing.Optional[types.Meta]
     title: typing.Optional[str]
 
+    _json_fields = {
+        "created": ("created", helpers.parse_date),
+        "created_by": ("createdBy", helpers.get_meta),
+        "filename": ("filename", None),
+        "meta": ("meta", None),
+        "miniature": ("miniature", None),
+        "size": ("size", None),
+        "tiny": ("tiny", None),
+        "title": ("title", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "File":
         instance = cls()
@@ -72,7 +83,7 @@ class GetFilesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[File]:
-        return [File.from_json(x) for x in result["rows"]]
+        return self.parse_rows(File, result["rows"])
 
 
 class AddFilesRequest(types.ApiRequest):
@@ -19,6 +19,14 @@ class Group(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     name: typing.Optional[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "id": ("id", None),
+        "index": ("index", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Group":
         instance = cls()
@@ -56,7 +64,7 @@ class GetGroupsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Group]:
-        return [Group.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Group, result["rows"])
 
 
 class CreateGroupRequest(types.ApiRequest):
@@ -26,6 +26,16 @@ class Image(types.MoySkladBaseClass):
     title: typing.Optional[str]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "filename": ("filename", None),
+        "meta": ("meta", None),
+        "miniature": ("miniature", None),
+        "size": ("size", None),
+        "tiny": ("tiny", None),
+        "title": ("title", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Image":
         instance = cls()
@@ -73,7 +83,7 @@ class GetImagesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Image]:
-        return [Image.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Image, result["rows"])
 
 
 class AddImageRequest(types.ApiRequest):
@@ -21,6 +21,14 @@ class NamedFilter(types.MoySkladBaseClass):
     name: typing.Optional[str]
     owner: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "NamedFilter":
         instance = cls()
@@ -68,7 +76,7 @@ class GetNamedFiltersRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[NamedFilter]:
-        return [NamedFilter.from_json(x) for x in result["rows"]]
+        return self.parse_rows(NamedFilter, result["rows"])
 
 
 class GetNamedFilterRequest(types.ApiRequest):
@@ -55,6 +55,31 @@ class Organization(types.MoySkladBaseClass):
     tracking_contract_number: typing.Optional[str]
     updated: datetime.datetime
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "actual_address": ("actualAddress", None),
+        "actual_address_full": ("actualAddressFull", None),
+        "archived": ("archived", None),
+        "attributes": ("attributes", None),
+        "bonus_points": ("bonusPoints", None),
+        "bonus_program": ("bonusProgram", helpers.get_meta),
+        "code": ("code", None),
+        "company_type": ("companyType", None),
+        "created": ("created", helpers.parse_date),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "shared": ("shared", None),
+        "sync_id": ("syncId", None),
+        "tracking_contract_date": ("trackingContractDate", helpers.parse_date),
+        "tracking_contract_number": ("trackingContractNumber", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Organization":
         instance = cls()
@@ -125,7 +150,7 @@ class GetOrganizationsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Organization]:
-        return [Organization.from_json(org) for org in result["rows"]]
+        return self.parse_rows(Organization, result["rows"])
 
 
 class CreateOrganizationRequest(types.ApiRequest):
@@ -22,6 +22,13 @@ class PriceType(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     name: typing.Optional[str]
 
+    _json_fields = {
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "PriceType":
         instance = cls()
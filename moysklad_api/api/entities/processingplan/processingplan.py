@@ -50,6 +50,28 @@ class ProcessingPlan(types.MoySkladBaseClass):
     shared: typing.Optional[bool]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "code": ("code", None),
+        "cost": ("cost", None),
+        "cost_distribution_type": ("costDistributionType", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "stages": ("stages", None),
+        "materials": ("materials", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "parent": ("parent", helpers.get_meta),
+        "path_name": ("pathName", None),
+        "processing_process": ("processingProcess", helpers.get_meta),
+        "products": ("products", None),
+        "shared": ("shared", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProcessingPlan":
         instance = cls()
@@ -102,6 +124,17 @@ class ProcessingPlanStage(types.MoySkladBaseClass):
     processing_process_position: typing.Optional[types.Meta]
     standard_hour_cost: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "enable_hour_accounting": ("enableHourAccounting", None),
+        "id": ("id", None),
+        "cost": ("cost", None),
+        "labour_cost": ("labourCost", None),
+        "standard_hour": ("standardHour", None),
+        "processing_process_position": ("processingProcessPosition", helpers.get_meta),
+        "standard_hour_cost": ("standardHourCost", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProcessingPlanStage":
         instance = cls()
@@ -141,6 +174,16 @@ class ProcessingPlanMaterial(types.MoySkladBaseClass):
     processing_process_position: typing.Optional[types.Meta]
     material_processing_plan: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "product": ("product", helpers.get_meta),
+        "quantity": ("quantity", None),
+        "processing_process_position": ("processingProcessPosition", helpers.get_meta),
+        "material_processing_plan": ("materialProcessingPlan", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProcessingPlanMaterial":
         instance = cls()
@@ -177,6 +220,14 @@ class ProcessingPlanProduct(types.MoySkladBaseClass):
     product: typing.Optional[types.Meta]
     quantity: typing.Optional[float]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "assortment": ("assortment", helpers.get_meta),
+        "id": ("id", None),
+        "product": ("product", helpers.get_meta),
+        "quantity": ("quantity", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProcessingPlanProduct":
         instance = cls()
@@ -260,7 +311,7 @@ class GetProcessingPlansRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProcessingPlan]:
-        return [ProcessingPlan.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProcessingPlan, result["rows"])
 
 
 class CreateProcessingPlanRequest(types.ApiRequest):
@@ -429,7 +480,7 @@ class GetProcessingPlanStagesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProcessingPlanStage]:
-        return [ProcessingPlanStage.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProcessingPlanStage, result["rows"])
 
 
 class GetProcessingPlanStageRequest(types.ApiRequest):
@@ -507,7 +558,7 @@ class GetProcessingPlanMaterialsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProcessingPlanMaterial]:
-        return [ProcessingPlanMaterial.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProcessingPlanMaterial, result["rows"])
 
 
 class GetProcessingPlanMaterialRequest(types.ApiRequest):
@@ -632,7 +683,7 @@ class GetProcessingPlanProductsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProcessingPlanProduct]:
-        return [ProcessingPlanProduct.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProcessingPlanProduct, result["rows"])
 
 
 class GetProcessingPlanProductRequest(types.ApiRequest):
@@ -36,6 +36,22 @@ class ProcessingPlanFolder(types.MoySkladBaseClass):
     shared: typing.Optional[bool]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "external_code": ("externalCode", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "path_name": ("pathName", None),
+        "shared": ("shared", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProcessingPlanFolder":
         instance = cls()
@@ -81,7 +97,7 @@ class GetProcessingPlanFoldersRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProcessingPlanFolder]:
-        return [ProcessingPlanFolder.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProcessingPlanFolder, result["rows"])
 
 
 class CreateProcessingPlanFolderRequest(types.ApiRequest):
@@ -34,6 +34,21 @@ class ProcessingProcess(types.MoySkladBaseClass):
     shared: typing.Optional[bool]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "positions": ("positions", helpers.get_expanded),
+        "shared": ("shared", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProcessingProcess":
         instance = cls()
@@ -46,7 +61,7 @@ class ProcessingProcess(types.MoySkladBaseClass):
         instance.meta = dict_data.get("meta")
         instance.name = dict_data.get("name")
         instance.owner = helpers.get_meta(dict_data.get("owner"))
-        instance.positions = dict_data.get("positions")
+        instance.positions = helpers.get_expanded(dict_data.get("positions"))
         instance.shared = dict_data.get("shared")
         instance.updated = helpers.parse_date(dict_data.get("updated"))
         return instance
@@ -71,6 +86,14 @@ class ProcessingProcessPosition(types.MoySkladBaseClass):
     processingstage: typing.Optional[types.Meta]
     next_positions: typing.Optional[dict]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "processingstage": ("processingstage", helpers.get_meta),
+        "next_positions": ("nextPositions", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProcessingProcessPosition":
         instance = cls()
@@ -138,7 +161,7 @@ class GetProcessingProcessesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProcessingProcess]:
-        return [ProcessingProcess.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProcessingProcess, result["rows"])
 
 
 class CreateProcessingProcessRequest(types.ApiRequest):
@@ -280,7 +303,7 @@ class GetProcessingProcessPositionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProcessingProcessPosition]:
-        return [ProcessingProcessPosition.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProcessingProcessPosition, result["rows"])
 
 
 class CreateProcessingProcessPositionsRequest(types.ApiRequest):
@@ -42,6 +42,25 @@ class ProcessingStage(types.MoySkladBaseClass):
     standard_hour_cost: typing.Optional[float]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "all_performers": ("allPerformers", None),
+        "archived": ("archived", None),
+        "description": ("description", None),
+        "distribution_required": ("distributionRequired", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "material_store": ("materialStore", helpers.get_meta),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "performers": ("performers", None),
+        "shared": ("shared", None),
+        "standard_hour_cost": ("standardHourCost", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProcessingStage":
         instance = cls()
@@ -129,7 +148,7 @@ class GetProcessingStagesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ProcessingStage]:
-        return [ProcessingStage.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProcessingStage, result["rows"])
 
 
 class CreateProcessingStageRequest(types.ApiRequest):
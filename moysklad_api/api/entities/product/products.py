@@ -105,6 +105,54 @@ class Product(types.MoySkladBaseClass):
     volume: int
     weight: int
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "alcoholic": ("alcoholic", None),
+        "archived": ("archived", None),
+        "article": ("article", None),
+        "attributes": ("attributes", None),
+        "barcodes": ("barcodes", None),
+        "buy_price": ("buyPrice", None),
+        "code": ("code", None),
+        "country": ("country", helpers.get_meta),
+        "description": ("description", None),
+        "discount_prohibited": ("discountProhibited", None),
+        "effective_vat": ("effectiveVat", None),
+        "effective_vat_enabled": ("effectiveVatEnabled", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "images": ("images", None),
+        "is_serial_trackable": ("isSerialTrackable", None),
+        "meta": ("meta", None),
+        "min_price": ("minPrice", None),
+        "minimum_balance": ("minimumBalance", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "packs": ("packs", None),
+        "partial_disposal": ("partialDisposal", None),
+        "path_name": ("pathName", None),
+        "payment_item_type": ("paymentItemType", None),
+        "ppe_type": ("ppeType", None),
+        "product_folder": ("productFolder", helpers.get_meta),
+        "sale_prices": ("salePrices", None),
+        "supplier": ("supplier", helpers.get_meta),
+        "sync_id": ("syncId", None),
+        "tax_system": ("taxSystem", None),
+        "things": ("things", None),
+        "tnved": ("tnved", None),
+        "tracking_type": ("trackingType", None),
+        "uom": ("uom", helpers.get_meta),
+        "updated": ("updated", helpers.parse_date),
+        "use_parent_vat": ("useParentVat", None),
+        "variants_count": ("variantsCount", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+        "volume": ("volume", None),
+        "weight": ("weight", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Product":
         instance = cls()
@@ -166,11 +214,11 @@ class GetProductListRequest(types.ApiRequest):
     Запрос на получение всех Товаров для данной учетной записи.
     """
 
-    def __init__(self, limit=0, offset=1000):
+    def __init__(self, limit=1000, offset=0):
         """
 
-        :param limit: int, default 0 - start from first element (номер первого элемента в выдаче)
-        :param offset: int, default 1000 - count of elements in response (количество элементов в выдаче)
+        :param limit: int, default 1000 - count of elements in response (количество элементов в выдаче)
+        :param offset: int, default 0 - start from first element (номер первого элемента в выдаче)
         """
         self.limit = limit
         self.offset = offset
@@ -191,7 +239,7 @@ class GetProductListRequest(types.ApiRequest):
         )
 
     def from_response(self, response: dict) -> typing.List[Product]:
-        return [Product.from_json(product) for product in response["rows"]]
+        return self.parse_rows(Product, response["rows"])
 
 
 class CreateProductRequest(types.ApiRequest):
@@ -76,6 +76,29 @@ class ProductFolder(types.MoySkladBaseClass):
     vat_enabled: typing.Optional[bool]
     product_folder: types.Meta
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "effective_vat": ("effectiveVat", None),
+        "effective_vat_enabled": ("effectiveVatEnabled", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "path_name": ("pathName", None),
+        "shared": ("shared", None),
+        "tax_system": ("taxSystem", None),
+        "updated": ("updated", helpers.parse_date),
+        "use_parent_vat": ("useParentVat", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+        "product_folder": ("productFolder", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProductFolder":
         instance = cls()
@@ -139,7 +162,7 @@ class GetProductFoldersRequest(types.ApiRequest):
         )
 
     def from_response(self, response: dict) -> typing.List[ProductFolder]:
-        return [ProductFolder.from_json(item) for item in response["rows"]]
+        return self.parse_rows(ProductFolder, response["rows"])
 
 
 class CreateProductFolderRequest(types.ApiRequest):
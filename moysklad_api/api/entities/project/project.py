@@ -36,6 +36,22 @@ class Project(types.MoySkladBaseClass):
     shared: typing.Optional[bool]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "shared": ("shared", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Project":
         instance = cls()
@@ -85,7 +101,7 @@ class GetProjectsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Project]:
-        return [Project.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Project, result["rows"])
 
 
 class CreateProjectRequest(types.ApiRequest):
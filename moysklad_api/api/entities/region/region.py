@@ -28,6 +28,17 @@ class Region(types.MoySkladBaseClass):
     updated: typing.Optional[datetime.datetime]
     version: typing.Optional[int]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "code": ("code", None),
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "updated": ("updated", helpers.parse_date),
+        "version": ("version", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Region":
         instance = cls()
@@ -68,7 +79,7 @@ class GetRegionsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Region]:
-        return [Region.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Region, result["rows"])
 
 
 class GetRegionRequest(types.ApiRequest):
@@ -92,6 +92,89 @@ class RetailStore(types.MoySkladBaseClass):
     tobacco_mrc_control_type: typing.Optional[str]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "acquire": ("acquire", helpers.get_meta),
+        "active": ("active", None),
+        "address": ("address", None),
+        "address_full": ("addressFull", None),
+        "allow_create_products": ("allowCreateProducts", None),
+        "allow_custom_price": ("allowCustomPrice", None),
+        "allow_delete_receipt_positions": ("allowDeleteReceiptPositions", None),
+        "allow_sell_tobacco_without_mrc": ("allowSellTobaccoWithoutMRC", None),
+        "archived": ("archived", None),
+        "auth_token_attached": ("authTokenAttached", None),
+        "bank_percent": ("bankPercent", None),
+        "cashiers": ("cashiers", helpers.get_meta),
+        "control_cashier_choice": ("controlCashierChoice", None),
+        "control_shipping_stock": ("controlShippingStock", None),
+        "create_agents_tags": ("createAgentsTags", None),
+        "create_cash_in_on_retail_shift_closing": (
+            "createCashInOnRetailShiftClosing",
+            None,
+        ),
+        "create_order_with_state": ("createOrderWithState", helpers.get_meta),
+        "create_payment_in_on_retail_shift_closing": (
+            "createPaymentInOnRetailShiftClosing",
+            None,
+        ),
+        "customer_order_states": ("customerOrderStates", None),
+        "default_tax_system": ("defaultTaxSystem", None),
+        "demand_prefix": ("demandPrefix", None),
+        "description": ("description", None),
+        "discount_enable": ("discountEnable", None),
+        "discount_max_percent": ("discountMaxPercent", None),
+        "enable_returns_with_no_reason": ("enableReturnsWithNoReason", None),
+        "environment": ("environment", None),
+        "external_code": ("externalCode", None),
+        "filter_agents_tags": ("filterAgentsTags", None),
+        "fiscal_type": ("fiscalType", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "id_qr": ("idQR", None),
+        "issue_orders": ("issueOrders", None),
+        "last_operation_names": ("lastOperationNames", None),
+        "marking_selling_mode": ("markingSellingMode", None),
+        "marks_check_mode": ("marksCheckMode", None),
+        "master_retail_stores": ("masterRetailStores", None),
+        "meta": ("meta", None),
+        "minion_to_master_type": ("minionToMasterType", None),
+        "name": ("name", None),
+        "ofd_enabled": ("ofdEnabled", None),
+        "only_in_stock": ("onlyInStock", None),
+        "order_tax_system": ("orderTaxSystem", None),
+        "order_to_state": ("orderToState", helpers.get_meta),
+        "organization": ("organization", helpers.get_meta),
+        "owner": ("owner", helpers.get_meta),
+        "price_type": ("priceType", None),
+        "print_always": ("printAlways", None),
+        "priority_ofd_send": ("priorityOfdSend", None),
+        "product_folders": ("productFolders", None),
+        "qr_acquire": ("qrAcquire", helpers.get_meta),
+        "qr_bank_percent": ("qrBankPercent", None),
+        "qr_pay_enabled": ("qrPayEnabled", None),
+        "qr_terminal_id": ("qrTerminalId", None),
+        "receipt_template": ("receiptTemplate", helpers.get_meta),
+        "required_fio": ("requiredFio", None),
+        "required_phone": ("requiredPhone", None),
+        "required_email": ("requiredEmail", None),
+        "required_birthdate": ("requiredBirthdate", None),
+        "required_sex": ("requiredSex", None),
+        "required_discount_card_number": ("requiredDiscountCardNumber", None),
+        "reserve_prepaid_goods": ("reservePrepaidGoods", None),
+        "return_from_closed_shift_enabled": ("returnFromClosedShiftEnabled", None),
+        "sell_reserves": ("sellReserves", None),
+        "send_marks_for_check": ("sendMarksForCheck", None),
+        "send_marks_to_chestny_znak_on_cloud": ("sendMarksToChestnyZnakOnCloud", None),
+        "sync_agents": ("syncAgents", None),
+        "shared": ("shared", None),
+        "show_beer_on_tap": ("showBeerOnTap", None),
+        "state": ("state", None),
+        "store": ("store", helpers.get_meta),
+        "tobacco_mrc_control_type": ("tobaccoMrcControlType", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "RetailStore":
         instance = cls()
@@ -308,7 +391,7 @@ class GetRetailStoresRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[RetailStore]:
-        return [RetailStore.from_json(x) for x in result["rows"]]
+        return self.parse_rows(RetailStore, result["rows"])
 
 
 class CreateRetailStoreRequest(types.ApiRequest):
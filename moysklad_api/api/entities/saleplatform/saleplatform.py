@@ -27,6 +27,13 @@ class SalePlatform(types.MoySkladBaseClass):
     name: typing.Optional[str]
     sale_platform_group: typing.Optional[SalePlatformGroup]
 
+    _json_fields = {
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "sale_platform_group": ("salePlatformGroup", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "SalePlatform":
         instance = cls()
@@ -63,7 +70,7 @@ class GetSalePlatformsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[SalePlatform]:
-        return [SalePlatform.from_json(x) for x in result["rows"]]
+        return self.parse_rows(SalePlatform, result["rows"])
 
 
 class GetSalePlatformRequest(types.ApiRequest):
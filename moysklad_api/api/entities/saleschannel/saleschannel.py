@@ -47,6 +47,22 @@ class SalesChannel(types.MoySkladBaseClass):
     type: typing.Optional[SalesChannelType]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "shared": ("shared", None),
+        "type": ("type", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "SalesChannel":
         instance = cls()
@@ -96,7 +112,7 @@ class GetSalesChannelsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[SalesChannel]:
-        return [SalesChannel.from_json(x) for x in result["rows"]]
+        return self.parse_rows(SalesChannel, result["rows"])
 
 
 class CreateSalesChannelRequest(types.ApiRequest):
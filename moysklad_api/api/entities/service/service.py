@@ -88,6 +88,39 @@ class Service(types.MoySkladBaseClass):
     vat: typing.Optional[int]
     vat_enabled: typing.Optional[bool]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "attributes": ("attributes", None),
+        "barcodes": ("barcodes", None),
+        "buy_price": ("buyPrice", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "discount_prohibited": ("discountProhibited", None),
+        "effective_vat": ("effectiveVat", None),
+        "effective_vat_enabled": ("effectiveVatEnabled", None),
+        "external_code": ("externalCode", None),
+        "files": ("files", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "min_price": ("minPrice", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "path_name": ("pathName", None),
+        "payment_item_type": ("paymentItemType", None),
+        "product_folder": ("productFolder", helpers.get_meta),
+        "sale_prices": ("salePrices", None),
+        "shared": ("shared", None),
+        "sync_id": ("syncId", None),
+        "tax_system": ("taxSystem", None),
+        "uom": ("uom", helpers.get_meta),
+        "updated": ("updated", helpers.parse_date),
+        "use_parent_vat": ("useParentVat", None),
+        "vat": ("vat", None),
+        "vat_enabled": ("vatEnabled", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Service":
         instance = cls()
@@ -229,7 +262,7 @@ class GetServicesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Service]:
-        return [Service.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Service, result["rows"])
 
 
 class CreateServiceRequest(types.ApiRequest):
@@ -23,6 +23,16 @@ class State(types.MoySkladBaseClass):
     name: typing.Optional[str]
     state_type: typing.Optional[typing.Literal["Regular", "Successful", "Unsuccessful"]]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "color": ("color", None),
+        "entity_type": ("entityType", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "state_type": ("stateType", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "State":
         instance = cls()
@@ -51,6 +51,28 @@ class Store(types.MoySkladBaseClass):
     zones: typing.Optional[types.MetaArray]
     slots: typing.Optional[types.MetaArray]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "address": ("address", None),
+        "address_full": ("addressFull", None),
+        "archived": ("archived", None),
+        "attributes": ("attributes", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "external_code": ("externalCode", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "owner": ("owner", helpers.get_meta),
+        "parent": ("parent", helpers.get_meta),
+        "path_name": ("pathName", None),
+        "shared": ("shared", None),
+        "updated": ("updated", helpers.parse_date),
+        "zones": ("zones", None),
+        "slots": ("slots", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Store":
         instance = cls()
@@ -101,6 +123,15 @@ class StoreZone(types.MoySkladBaseClass):
     name: str
     updated: datetime.datetime
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "StoreZone":
         instance = cls()
@@ -137,7 +168,17 @@ class StoreSlot(types.MoySkladBaseClass):
     meta: types.Meta
     name: str
     updated: datetime.datetime
-    zone: typing.Optional[types.Meta] = None
+    zone: typing.Optional[types.Meta]
+
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "updated": ("updated", helpers.parse_date),
+        "zone": ("zone", helpers.get_meta),
+    }
 
     @classmethod
     def from_json(cls, dict_data: dict) -> "StoreSlot":
@@ -194,7 +235,7 @@ class GetStoresRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Store]:
-        return [Store.from_json(item) for item in result["rows"]]
+        return self.parse_rows(Store, result["rows"])
 
 
 class CreateStoreRequest(types.ApiRequest):
@@ -545,7 +586,7 @@ class GetStoreZonesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List["StoreZone"]:
-        return [StoreZone.from_json(item) for item in result.get("rows", [])]
+        return self.parse_rows(StoreZone, result.get("rows", []))
 
 
 class CreateStoreZoneRequest(types.ApiRequest):
@@ -743,7 +784,7 @@ class GetStoreSlotsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[StoreSlot]:
-        return [StoreSlot.from_json(item) for item in result["rows"]]
+        return self.parse_rows(StoreSlot, result["rows"])
 
 
 class CreateStoreSlotRequest(types.ApiRequest):
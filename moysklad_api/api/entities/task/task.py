@@ -46,6 +46,27 @@ class Task(types.MoySkladBaseClass):
     operation: typing.Optional[types.Meta]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "agent": ("agent", helpers.get_meta),
+        "assignee": ("assignee", helpers.get_meta),
+        "author": ("author", helpers.get_meta),
+        "author_application": ("authorApplication", helpers.get_meta),
+        "completed": ("completed", helpers.parse_date),
+        "created": ("created", helpers.parse_date),
+        "description": ("description", None),
+        "done": ("done", None),
+        "due_to_date": ("dueToDate", helpers.parse_date),
+        "files": ("files", None),
+        "id": ("id", None),
+        "implementer": ("implementer", helpers.get_meta),
+        "meta": ("meta", None),
+        "state": ("state", helpers.get_meta),
+        "notes": ("notes", None),
+        "operation": ("operation", helpers.get_meta),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Task":
         instance = cls()
@@ -93,6 +114,16 @@ class TaskNote(types.MoySkladBaseClass):
     text: typing.Optional[str]
     files: typing.Optional[dict]
 
+    _json_fields = {
+        "author": ("author", helpers.get_meta),
+        "author_application": ("authorApplication", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "moment": ("moment", helpers.parse_date),
+        "text": ("text", None),
+        "files": ("files", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "TaskNote":
         instance = cls()
@@ -132,7 +163,7 @@ class GetTasksRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Task]:
-        return [Task.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Task, result["rows"])
 
 
 class CreateTaskRequest(types.ApiRequest):
@@ -279,7 +310,7 @@ class GetTaskNotesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[TaskNote]:
-        return [TaskNote.from_json(x) for x in result["rows"]]
+        return self.parse_rows(TaskNote, result["rows"])
 
 
 class CreateTaskNoteRequest(types.ApiRequest):
@@ -30,6 +30,19 @@ class TaxRate(types.MoySkladBaseClass):
     shared: typing.Optional[bool]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "comment": ("comment", None),
+        "group": ("group", helpers.get_meta),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "rate": ("rate", None),
+        "owner": ("owner", helpers.get_meta),
+        "shared": ("shared", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "TaxRate":
         instance = cls()
@@ -76,7 +89,7 @@ class GetTaxRatesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[TaxRate]:
-        return [TaxRate.from_json(x) for x in result["rows"]]
+        return self.parse_rows(TaxRate, result["rows"])
 
 
 class CreateTaxRateRequest(types.ApiRequest):
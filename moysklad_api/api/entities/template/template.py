@@ -22,6 +22,14 @@ class Template(types.MoySkladBaseClass):
     name: typing.Optional[str]
     type: typing.Optional[str]
 
+    _json_fields = {
+        "content": ("content", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "type": ("type", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Template":
         instance = cls()
@@ -48,7 +56,7 @@ class GetEmbeddedTemplatesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Template]:
-        return [Template.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Template, result["rows"])
 
 
 class GetEmbeddedTemplateRequest(types.ApiRequest):
@@ -77,7 +85,7 @@ class GetCustomTemplatesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Template]:
-        return [Template.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Template, result["rows"])
 
 
 class GetCustomTemplateRequest(types.ApiRequest):
@@ -21,6 +21,14 @@ class Thing(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     name: typing.Optional[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "description": ("description", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Thing":
         instance = cls()
@@ -58,7 +66,7 @@ class GetThingsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Thing]:
-        return [Thing.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Thing, result["rows"])
 
 
 class GetThingRequest(types.ApiRequest):
@@ -21,6 +21,14 @@ class TrackingCode(types.MoySkladBaseClass):
     type: typing.Optional[str]
     tracking_codes: typing.Optional[typing.List[dict]]
 
+    _json_fields = {
+        "id": ("id", None),
+        "cis": ("cis", None),
+        "cis_1162": ("cis_1162", None),
+        "type": ("type", None),
+        "tracking_codes": ("trackingCodes", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "TrackingCode":
         instance = cls()
@@ -68,7 +76,7 @@ class GetTrackingCodesRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[TrackingCode]:
-        return [TrackingCode.from_json(x) for x in result["rows"]]
+        return self.parse_rows(TrackingCode, result["rows"])
 
 
 class SetTrackingCodesRequest(types.ApiRequest):
@@ -33,6 +33,27 @@ class UserSettings(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     print_format: typing.Optional[str]
 
+    _json_fields = {
+        "auto_show_reports": ("autoShowReports", None),
+        "default_company": ("defaultCompany", helpers.get_meta),
+        "default_customer_counterparty": (
+            "defaultCustomerCounterparty",
+            helpers.get_meta,
+        ),
+        "default_place": ("defaultPlace", helpers.get_meta),
+        "default_project": ("defaultProject", helpers.get_meta),
+        "default_purchase_counterparty": (
+            "defaultPurchaseCounterparty",
+            helpers.get_meta,
+        ),
+        "default_screen": ("defaultScreen", None),
+        "fields_per_row": ("fieldsPerRow", None),
+        "locale": ("locale", None),
+        "mail_footer": ("mailFooter", None),
+        "meta": ("meta", None),
+        "print_format": ("printFormat", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "UserSettings":
         instance = cls()
@@ -52,6 +52,30 @@ class Variant(types.MoySkladBaseClass):
     things: typing.Optional[typing.List[str]]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "archived": ("archived", None),
+        "article": ("article", None),
+        "barcodes": ("barcodes", None),
+        "buy_price": ("buyPrice", None),
+        "characteristics": ("characteristics", None),
+        "code": ("code", None),
+        "description": ("description", None),
+        "discount_prohibited": ("discountProhibited", None),
+        "external_code": ("externalCode", None),
+        "id": ("id", None),
+        "images": ("images", None),
+        "meta": ("meta", None),
+        "min_price": ("minPrice", None),
+        "minimum_stock": ("minimumStock", None),
+        "name": ("name", None),
+        "packs": ("packs", None),
+        "product": ("product", helpers.get_meta),
+        "sale_prices": ("salePrices", None),
+        "things": ("things", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Variant":
         instance = cls()
@@ -163,7 +187,7 @@ class GetVariantsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Variant]:
-        return [Variant.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Variant, result["rows"])
 
 
 class CreateVariantRequest(types.ApiRequest):
@@ -31,6 +31,18 @@ class Webhook(types.MoySkladBaseClass):
     enabled: bool
     action: str
 
+    _json_fields = {
+        "meta": ("meta", None),
+        "author_application": ("authorApplication", helpers.get_meta),
+        "id": ("id", None),
+        "account_id": ("accountId", None),
+        "entity_type": ("entityType", None),
+        "url": ("url", None),
+        "method": ("method", None),
+        "enabled": ("enabled", None),
+        "action": ("action", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "Webhook":
         instance = cls()
@@ -69,7 +81,7 @@ class GetWebhooksRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Webhook]:
-        return [Webhook.from_json(item) for item in result["rows"]]
+        return self.parse_rows(Webhook, result["rows"])
 
 
 class CreateWebhookRequest(types.ApiRequest):
@@ -28,6 +28,17 @@ class WebhookStock(types.MoySkladBaseClass):
     meta: typing.Optional[types.Meta]
     url: typing.Optional[str]
 
+    _json_fields = {
+        "account_id": ("accountId", None),
+        "author_application": ("authorApplication", helpers.get_meta),
+        "enabled": ("enabled", None),
+        "stock_type": ("stockType", None),
+        "report_type": ("reportType", None),
+        "id": ("id", None),
+        "meta": ("meta", None),
+        "url": ("url", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "WebhookStock":
         instance = cls()
@@ -70,7 +81,7 @@ class GetWebhookStocksRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[WebhookStock]:
-        return [WebhookStock.from_json(x) for x in result["rows"]]
+        return self.parse_rows(WebhookStock, result["rows"])
 
 
 class CreateWebhookStockRequest(types.ApiRequest):
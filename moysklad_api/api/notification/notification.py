@@ -74,6 +74,19 @@ class NotificationSettings(types.MoySkladBaseClass):
     online_stores: typing.Optional[dict]
     followed_events: typing.Optional[dict]
 
+    _json_fields = {
+        "customer_order": ("customerOrder", None),
+        "data_exchange": ("dataExchange", None),
+        "invoice": ("invoice", None),
+        "retail": ("retail", None),
+        "scripts": ("scripts", None),
+        "stock": ("stock", None),
+        "task": ("task", None),
+        "mentions": ("mentions", None),
+        "online_stores": ("onlineStores", None),
+        "followed_events": ("followedEvents", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "NotificationSettings":
         instance = cls()
@@ -114,7 +127,7 @@ class GetNotificationsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[Notification]:
-        return [Notification.from_json(x) for x in result["rows"]]
+        return self.parse_rows(Notification, result["rows"])
 
 
 class GetNotificationRequest(types.ApiRequest):
@@ -9,6 +9,12 @@ class PeriodMetric(types.MoySkladBaseClass):
     amount: typing.Optional[int]
     movement_amount: typing.Optional[int]
 
+    _json_fields = {
+        "count": ("count", None),
+        "amount": ("amount", None),
+        "movement_amount": ("movementAmount", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "PeriodMetric":
         instance = cls()
@@ -29,6 +35,14 @@ class MoneyMetric(types.MoySkladBaseClass):
     today_movement: typing.Optional[float]
     movement: typing.Optional[float]
 
+    _json_fields = {
+        "income": ("income", None),
+        "outcome": ("outcome", None),
+        "balance": ("balance", None),
+        "today_movement": ("todayMovement", None),
+        "movement": ("movement", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "MoneyMetric":
         instance = cls()
@@ -51,6 +65,33 @@ class DashboardMetrics(types.MoySkladBaseClass):
     orders: typing.Optional[PeriodMetric]
     money: typing.Optional[MoneyMetric]
 
+    _json_fields = {
+        "sales": (
+            None,
+            lambda dict_data: (
+                PeriodMetric.from_json(dict_data["sales"])
+                if dict_data.get("sales") is not None
+                else None
+            ),
+        ),
+        "orders": (
+            None,
+            lambda dict_data: (
+                PeriodMetric.from_json(dict_data["orders"])
+                if dict_data.get("orders") is not None
+                else None
+            ),
+        ),
+        "money": (
+            None,
+            lambda dict_data: (
+                MoneyMetric.from_json(dict_data["money"])
+                if dict_data.get("money") is not None
+                else None
+            ),
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "DashboardMetrics":
         instance = cls()
@@ -15,6 +15,17 @@ class StockByOperationRow(types.MoySkladBaseClass):
     store: typing.Optional[types.Meta]
     sum_cost: typing.Optional[float]
 
+    _json_fields = {
+        "assortment": ("assortment", helpers.get_meta),
+        "avg_stock_days": ("avgStockDays", None),
+        "cost_per_unit": ("costPerUnit", None),
+        "moment": ("moment", helpers.parse_date),
+        "operation": ("operation", helpers.get_meta),
+        "stock": ("stock", None),
+        "store": ("store", helpers.get_meta),
+        "sum_cost": ("sumCost", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "StockByOperationRow":
         instance = cls()
@@ -40,6 +51,14 @@ class ReserveByOperationRow(types.MoySkladBaseClass):
     reserve: typing.Optional[float]
     store: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "assortment": ("assortment", helpers.get_meta),
+        "moment": ("moment", helpers.parse_date),
+        "operation": ("operation", helpers.get_meta),
+        "reserve": ("reserve", None),
+        "store": ("store", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ReserveByOperationRow":
         instance = cls()
@@ -62,6 +81,14 @@ class InTransitByOperationRow(types.MoySkladBaseClass):
     operation: typing.Optional[types.Meta]
     store: typing.Optional[types.Meta]
 
+    _json_fields = {
+        "assortment": ("assortment", helpers.get_meta),
+        "in_transit": ("inTransit", None),
+        "moment": ("moment", helpers.parse_date),
+        "operation": ("operation", helpers.get_meta),
+        "store": ("store", helpers.get_meta),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "InTransitByOperationRow":
         instance = cls()
@@ -101,7 +128,7 @@ class GetByOperationsStockRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[StockByOperationRow]:
-        return [StockByOperationRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(StockByOperationRow, result["rows"])
 
 
 class GetByOperationsReserveRequest(types.ApiRequest):
@@ -128,7 +155,7 @@ class GetByOperationsReserveRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[ReserveByOperationRow]:
-        return [ReserveByOperationRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ReserveByOperationRow, result["rows"])
 
 
 class GetByOperationsInTransitRequest(types.ApiRequest):
@@ -155,4 +182,4 @@ class GetByOperationsInTransitRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[InTransitByOperationRow]:
-        return [InTransitByOperationRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(InTransitByOperationRow, result["rows"])
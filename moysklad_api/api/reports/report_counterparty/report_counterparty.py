@@ -23,6 +23,25 @@ class CounterpartyReportEntry(types.MoySkladBaseClass):
     returns_sum: typing.Optional[float]
     updated: typing.Optional[datetime.datetime]
 
+    _json_fields = {
+        "meta": ("meta", None),
+        "counterparty": ("counterparty", None),
+        "average_receipt": ("averageReceipt", None),
+        "balance": ("balance", None),
+        "bonus_balance": ("bonusBalance", None),
+        "demands_count": ("demandsCount", None),
+        "demands_sum": ("demandsSum", None),
+        "discounts_sum": ("discountsSum", None),
+        "first_demand_date": ("firstDemandDate", helpers.parse_date),
+        "last_demand_date": ("lastDemandDate", helpers.parse_date),
+        "last_event_date": ("lastEventDate", helpers.parse_date),
+        "last_event_text": ("lastEventText", None),
+        "profit": ("profit", None),
+        "returns_count": ("returnsCount", None),
+        "returns_sum": ("returnsSum", None),
+        "updated": ("updated", helpers.parse_date),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "CounterpartyReportEntry":
         instance = cls()
@@ -75,7 +94,7 @@ class GetCounterpartyReportsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CounterpartyReportEntry]:
-        return [CounterpartyReportEntry.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CounterpartyReportEntry, result["rows"])
 
 
 class GetSelectedCounterpartyReportsRequest(types.ApiRequest):
@@ -95,7 +114,7 @@ class GetSelectedCounterpartyReportsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[CounterpartyReportEntry]:
-        return [CounterpartyReportEntry.from_json(x) for x in result["rows"]]
+        return self.parse_rows(CounterpartyReportEntry, result["rows"])
 
 
 class GetCounterpartyReportRequest(types.ApiRequest):
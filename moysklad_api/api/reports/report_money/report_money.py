@@ -11,6 +11,13 @@ class MoneyPlotSeriesPoint(types.MoySkladBaseClass):
     debit: typing.Optional[float]
     balance: typing.Optional[float]
 
+    _json_fields = {
+        "date": ("date", helpers.parse_date),
+        "credit": ("credit", None),
+        "debit": ("debit", None),
+        "balance": ("balance", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "MoneyPlotSeriesPoint":
         instance = cls()
@@ -30,6 +37,17 @@ class MoneyPlotSeries(types.MoySkladBaseClass):
     debit: typing.Optional[float]
     series: typing.Optional[typing.List[MoneyPlotSeriesPoint]]
 
+    _json_fields = {
+        "credit": ("credit", None),
+        "debit": ("debit", None),
+        "series": (
+            None,
+            lambda dict_data: [
+                MoneyPlotSeriesPoint.from_json(x) for x in dict_data.get("series", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "MoneyPlotSeries":
         instance = cls()
@@ -50,6 +68,12 @@ class MoneyByAccountRow(types.MoySkladBaseClass):
     organization: typing.Optional[dict]
     balance: typing.Optional[float]
 
+    _json_fields = {
+        "account": ("account", None),
+        "organization": ("organization", None),
+        "balance": ("balance", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "MoneyByAccountRow":
         instance = cls()
@@ -108,4 +132,4 @@ class GetMoneyByAccountRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[MoneyByAccountRow]:
-        return [MoneyByAccountRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(MoneyByAccountRow, result["rows"])
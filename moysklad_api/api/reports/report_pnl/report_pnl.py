@@ -21,6 +21,23 @@ class ProfitByProductRow(types.MoySkladBaseClass):
     sell_quantity: typing.Optional[float]
     sell_sum: typing.Optional[float]
 
+    _json_fields = {
+        "assortment": ("assortment", None),
+        "margin": ("margin", None),
+        "sales_margin": ("salesMargin", None),
+        "profit": ("profit", None),
+        "return_cost": ("returnCost", None),
+        "return_cost_sum": ("returnCostSum", None),
+        "return_price": ("returnPrice", None),
+        "return_quantity": ("returnQuantity", None),
+        "return_sum": ("returnSum", None),
+        "sell_cost": ("sellCost", None),
+        "sell_cost_sum": ("sellCostSum", None),
+        "sell_price": ("sellPrice", None),
+        "sell_quantity": ("sellQuantity", None),
+        "sell_sum": ("sellSum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "ProfitByProductRow":
         instance = cls()
@@ -210,7 +227,7 @@ class GetProfitByProductRequest(_BaseProfitRequest):
         return "byproduct"
 
     def from_response(self, result: dict) -> typing.List[ProfitByProductRow]:
-        return [ProfitByProductRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProfitByProductRow, result["rows"])
 
 
 class GetProfitByVariantRequest(_BaseProfitRequest):
@@ -218,7 +235,7 @@ class GetProfitByVariantRequest(_BaseProfitRequest):
         return "byvariant"
 
     def from_response(self, result: dict) -> typing.List[ProfitByProductRow]:
-        return [ProfitByProductRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(ProfitByProductRow, result["rows"])
 
 
 class GetProfitByEmployeeRequest(_BaseProfitRequest):
@@ -10,6 +10,12 @@ class SalesOrdersSeriesPoint(types.MoySkladBaseClass):
     quantity: typing.Optional[int]
     sum: typing.Optional[float]
 
+    _json_fields = {
+        "date": ("date", helpers.parse_date),
+        "quantity": ("quantity", None),
+        "sum": ("sum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "SalesOrdersSeriesPoint":
         instance = cls()
@@ -26,6 +32,15 @@ class SalesOrdersSeriesPoint(types.MoySkladBaseClass):
 class SalesOrdersPlotSeries(types.MoySkladBaseClass):
     series: typing.Optional[typing.List[SalesOrdersSeriesPoint]]
 
+    _json_fields = {
+        "series": (
+            None,
+            lambda dict_data: [
+                SalesOrdersSeriesPoint.from_json(x) for x in dict_data.get("series", [])
+            ],
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "SalesOrdersPlotSeries":
         instance = cls()
@@ -9,6 +9,11 @@ class TurnoverMetric(types.MoySkladBaseClass):
     sum: typing.Optional[float]
     quantity: typing.Optional[float]
 
+    _json_fields = {
+        "sum": ("sum", None),
+        "quantity": ("quantity", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "TurnoverMetric":
         instance = cls()
@@ -28,6 +33,42 @@ class TurnoverByProductRow(types.MoySkladBaseClass):
     income: typing.Optional[TurnoverMetric]
     outcome: typing.Optional[TurnoverMetric]
 
+    _json_fields = {
+        "assortment": ("assortment", None),
+        "on_period_start": (
+            None,
+            lambda dict_data: (
+                TurnoverMetric.from_json(dict_data["onPeriodStart"])
+                if dict_data.get("onPeriodStart") is not None
+                else None
+            ),
+        ),
+        "on_period_end": (
+            None,
+            lambda dict_data: (
+                TurnoverMetric.from_json(dict_data["onPeriodEnd"])
+                if dict_data.get("onPeriodEnd") is not None
+                else None
+            ),
+        ),
+        "income": (
+            None,
+            lambda dict_data: (
+                TurnoverMetric.from_json(dict_data["income"])
+                if dict_data.get("income") is not None
+                else None
+            ),
+        ),
+        "outcome": (
+            None,
+            lambda dict_data: (
+                TurnoverMetric.from_json(dict_data["outcome"])
+                if dict_data.get("outcome") is not None
+                else None
+            ),
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "TurnoverByProductRow":
         instance = cls()
@@ -66,6 +107,42 @@ class TurnoverStoreDetail(types.MoySkladBaseClass):
     income: typing.Optional[TurnoverMetric]
     outcome: typing.Optional[TurnoverMetric]
 
+    _json_fields = {
+        "store": ("store", None),
+        "on_period_start": (
+            None,
+            lambda dict_data: (
+                TurnoverMetric.from_json(dict_data["onPeriodStart"])
+                if dict_data.get("onPeriodStart") is not None
+                else None
+            ),
+        ),
+        "on_period_end": (
+            None,
+            lambda dict_data: (
+                TurnoverMetric.from_json(dict_data["onPeriodEnd"])
+                if dict_data.get("onPeriodEnd") is not None
+                else None
+            ),
+        ),
+        "income": (
+            None,
+            lambda dict_data: (
+                TurnoverMetric.from_json(dict_data["income"])
+                if dict_data.get("income") is not None
+                else None
+            ),
+        ),
+        "outcome": (
+            None,
+            lambda dict_data: (
+                TurnoverMetric.from_json(dict_data["outcome"])
+                if dict_data.get("outcome") is not None
+                else None
+            ),
+        ),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "TurnoverStoreDetail":
         instance = cls()
@@ -126,6 +203,15 @@ class TurnoverByOperationRow(types.MoySkladBaseClass):
     cost: typing.Optional[float]
     sum: typing.Optional[float]
 
+    _json_fields = {
+        "assortment": ("assortment", None),
+        "store": ("store", None),
+        "operation": ("operation", None),
+        "quantity": ("quantity", None),
+        "cost": ("cost", None),
+        "sum": ("sum", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "TurnoverByOperationRow":
         instance = cls()
@@ -261,7 +347,7 @@ class GetTurnoverAllRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[TurnoverByProductRow]:
-        return [TurnoverByProductRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(TurnoverByProductRow, result["rows"])
 
 
 class GetTurnoverByStoreRequest(types.ApiRequest):
@@ -322,7 +408,7 @@ class GetTurnoverByStoreRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[TurnoverByStoreRow]:
-        return [TurnoverByStoreRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(TurnoverByStoreRow, result["rows"])
 
 
 class GetTurnoverByOperationsRequest(types.ApiRequest):
@@ -383,4 +469,4 @@ class GetTurnoverByOperationsRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[TurnoverByOperationRow]:
-        return [TurnoverByOperationRow.from_json(x) for x in result["rows"]]
+        return self.parse_rows(TurnoverByOperationRow, result["rows"])
@@ -2,6 +2,8 @@ from .stocks import (
     SmallStockReport,
     FullStockReport,
     GetSmallStockReportCurrentRequest,
+    GetSmallStockReportByStoreCurrentRequest,
+    GetSmallStockReportByUrlRequest,
     GetFullStockReportRequest,
 )
 
@@ -9,5 +11,7 @@ __all__ = [
     "SmallStockReport",
     "FullStockReport",
     "GetSmallStockReportCurrentRequest",
+    "GetSmallStockReportByStoreCurrentRequest",
+    "GetSmallStockReportByUrlRequest",
     "GetFullStockReportRequest",
 ]
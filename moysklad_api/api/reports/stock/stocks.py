@@ -1,5 +1,7 @@
 import typing
 import datetime
+import re
+import urllib.parse
 from .... import types, helpers
 from ....types import Unset, RequestData
 
@@ -45,6 +47,24 @@ class FullStockReport(types.MoySkladBaseClass):
     stock_days: int
     uom: dict
 
+    _json_fields = {
+        "article": ("article", None),
+        "code": ("code", None),
+        "external_code": ("externalCode", None),
+        "folder": ("folder", None),
+        "image": ("image", helpers.get_meta),
+        "in_transit": ("inTransit", None),
+        "meta": ("meta", None),
+        "name": ("name", None),
+        "price": ("price", None),
+        "quantity": ("quantity", None),
+        "reserve": ("reserve", None),
+        "sale_price": ("salePrice", None),
+        "stock": ("stock", None),
+        "stock_days": ("stockDays", None),
+        "uom": ("uom", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "FullStockReport":
         """
@@ -84,6 +104,12 @@ class SmallStockReport(types.MoySkladBaseClass):
     store_id: typing.Optional[str]
     stock: int
 
+    _json_fields = {
+        "assortment_id": ("assortmentId", None),
+        "store_id": ("storeId", None),
+        "stock": ("stock", None),
+    }
+
     @classmethod
     def from_json(cls, dict_data: dict) -> "SmallStockReport":
         """
@@ -166,7 +192,7 @@ class GetFullStockReportRequest(types.ApiRequest):
         )
 
     def from_response(self, result: dict) -> typing.List[FullStockReport]:
-        return [FullStockReport.from_json(item) for item in result["rows"]]
+        return self.parse_rows(FullStockReport, result["rows"])
 
 
 class GetSmallStockReportCurrentRequest(types.ApiRequest):
@@ -257,8 +283,56 @@ class GetSmallStockReportCurrentRequest(types.ApiRequest):
             params=params,
         )
 
-    def from_response(self, result: dict) -> typing.List[SmallStockReport]:
-        return [SmallStockReport.from_json(item) for item in result]
+    def from_response(self, result: list) -> typing.List[SmallStockReport]:
+        return self.parse_rows(SmallStockReport, result)
+
+
+class GetSmallStockReportByStoreCurrentRequest(GetSmallStockReportCurrentRequest):
+    """
+    /report/stock/bystore/current - current stock by stores, one row per (assortmentId, storeId).
+    Parameters are the same as of GetSmallStockReportCurrentRequest.
+    (Текущие остатки по складам, одна строка на (assortmentId, storeId).
+    Параметры такие же, как у GetSmallStockReportCurrentRequest.)
+    """
+
+    def to_request(self) -> RequestData:
+        request = super().to_request()
+        request.url = f"{helpers.BASE_URL}/report/stock/bystore/current"
+        return request
+
+
+class GetSmallStockReportByUrlRequest(types.ApiRequest):
+    """
+    Current stock report by the reportUrl of a stock webhook (WebhookStock), for example
+    .../report/stock/all/current?changedSince=2024-01-01 12:00:00.
+    The request is always sent to helpers.BASE_URL, only the report type and the parameters are taken from the url.
+    (Отчет о текущих остатках по reportUrl вебхука на остатки (WebhookStock).
+    Запрос всегда отправляется на helpers.BASE_URL, из url берутся только тип отчета и параметры.)
+    """
+
+    _PATH_RE = re.compile(r"/report/stock/(all|bystore)/current/?$")
+
+    def __init__(self, report_url: str):
+        """
+
+        :param report_url: reportUrl from the webhook request body (reportUrl из тела запроса вебхука)
+        """
+        parsed = urllib.parse.urlsplit(report_url)
+        found = self._PATH_RE.search(parsed.path)
+        if found is None:
+            raise ValueError(f"Not a current stock report url: {report_url}")
+        self.report_type = found.group(1)
+        self.params = dict(urllib.parse.parse_qsl(parsed.query))
+
+    def to_request(self) -> RequestData:
+        return RequestData(
+            method="GET",
+            url=f"{helpers.BASE_URL}/report/stock/{self.report_type}/current",
+            params=dict(self.params),
+        )
+
+    def from_response(self, result: list) -> typing.List[SmallStockReport]:
+        return self.parse_rows(SmallStockReport, result)
 
 
 # TODO: implement full reports
@@ -1,3 +1,22 @@
 from .client import MoySkladClient
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .codec import JsonCodec, OrjsonCodec, UjsonCodec, default_codec
+from .offload import DecodeStats
+from .loader import BatchLoader
+from .refcache import ReferenceCache
+from .keyset import KeysetCursor
 
-__all__ = ["MoySkladClient"]
+__all__ = [
+    "MoySkladClient",
+    "RateLimiter",
+    "RetryPolicy",
+    "JsonCodec",
+    "OrjsonCodec",
+    "UjsonCodec",
+    "default_codec",
+    "DecodeStats",
+    "BatchLoader",
+    "ReferenceCache",
+    "KeysetCursor",
+]
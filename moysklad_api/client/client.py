@@ -1,15 +1,24 @@
 import typing
 import base64
+import concurrent.futures
+import contextlib
 import datetime
-import json
+import functools
+import time
 
 import aiohttp
 import asyncio
-import aiohttp.client_exceptions
 
 from ..errors import MoySkladError
-from .. import types
+from .. import types, helpers, query
 from ..types import Unset
+from .ratelimit import RateLimiter, get_retry_after
+from .retry import RetryPolicy
+from .codec import JsonCodec, default_codec
+from .offload import DecodeStats, decode_response
+from .loader import BatchLoader
+from .refcache import ReferenceCache
+from .keyset import KeysetCursor, KEYSET_ORDER, row_key
 
 from ..api.entities import (
     product as product_api,
@@ -22,6 +31,7 @@ from ..api.entities import (
     assortment as assortment_api,
     bonus_transaction as bonustransaction_api,  # TODO
 )
+from ..api import bulk as bulk_api
 from ..api.reports import (
     stock as stock_api,
 )
@@ -36,6 +46,13 @@ from ..api.documents import (
 )
 
 
+def _freeze(mapping) -> str:
+    if mapping is None:
+        return ""
+    items = mapping.items() if hasattr(mapping, "items") else mapping
+    return repr(sorted(items, key=repr))
+
+
 class MoySkladClient:
     def __init__(
         self,
@@ -45,6 +62,17 @@ class MoySkladClient:
         debug: bool = False,
         auto_retry_count: int = 5,
         auto_retry_delay: float = 1.0,
+        persistent_session: bool = True,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: typing.Optional[int] = 300,
+        rate_limiter: typing.Union[Unset, None, RateLimiter] = Unset,
+        retry_policy: typing.Union[Unset, RetryPolicy] = Unset,
+        json_codec: typing.Union[Unset, JsonCodec] = Unset,
+        offload_threshold: typing.Optional[int] = None,
+        offload_executor: typing.Optional[concurrent.futures.Executor] = None,
+        coalesce_gets: bool = True,
     ):
         """
         Create a MoySkladClient instance. Converts login and password to api_token, if needed.
@@ -56,8 +84,42 @@ class MoySkladClient:
         :param password:  Optional password (Пароль)
         :param api_token:  Optional api_token (Токен)
         :param debug:  If True, prints all requests and responses (Если True, печатает все запросы и ответы)
-        :param auto_retry_count:  Number of times to retry a request if it fails (ClientConnectError, errorcode > 500, etc) (Количество попыток повторить запрос, если он не удался (ClientConnectError, errorcode> 500 и т. Д.))
-        :param auto_retry_delay:  Delay between retries (Задержка между повторами)
+        :param auto_retry_count:  Number of times to retry a request if it fails (ClientConnectError, errorcode > 500, etc). Ignored if retry_policy is passed (Количество попыток повторить запрос, если он не удался (ClientConnectError, errorcode> 500 и т. Д.). Игнорируется, если передан retry_policy)
+        :param auto_retry_delay:  Base delay between retries. Ignored if retry_policy is passed (Базовая задержка между повторами. Игнорируется, если передан retry_policy)
+        :param persistent_session: If True, one pooled aiohttp session is reused for all requests until close() is called.
+         If False, a new session is opened for every request (old behaviour).
+         (Если True, одна сессия aiohttp с пулом соединений используется для всех запросов до вызова close().
+         Если False, для каждого запроса открывается новая сессия (старое поведение).)
+        :param connection_limit: Total number of simultaneous connections in the pool, 0 - unlimited (Общее количество одновременных соединений в пуле, 0 - без ограничений)
+        :param connection_limit_per_host: Number of simultaneous connections to one host, 0 - unlimited (Количество одновременных соединений к одному хосту, 0 - без ограничений)
+        :param keepalive_timeout: How long an idle connection is kept open, in seconds (Сколько секунд держать открытым неактивное соединение)
+        :param dns_cache_ttl: How long resolved DNS entries are cached, in seconds. None - forever (Сколько секунд кешировать DNS, None - навсегда)
+        :param rate_limiter: Scheduler shared by all requests of this client. By default a RateLimiter with MoySklad limits
+         (45 requests per 3 seconds, 5 parallel requests) is created. Pass None to disable it, or pass one RateLimiter
+         to several clients of the same account.
+         (Планировщик для всех запросов клиента. По умолчанию создается RateLimiter с ограничениями MoySklad
+         (45 запросов за 3 секунды, 5 параллельных запросов). None - отключить, либо можно передать один RateLimiter
+         нескольким клиентам одного аккаунта.)
+        :param retry_policy: Which failed requests to retry and how long to wait, used by request() and raw_request().
+         By default built from auto_retry_count and auto_retry_delay.
+         (Какие неудачные запросы повторять и сколько ждать, используется в request() и raw_request().
+         По умолчанию создается из auto_retry_count и auto_retry_delay.)
+        :param json_codec: Encoder/decoder of request and response bodies. By default orjson or ujson is used if installed,
+         otherwise the standard json module.
+         (Кодек тел запросов и ответов. По умолчанию используется orjson или ujson, если установлены,
+         иначе стандартный модуль json.)
+        :param offload_threshold: Responses of at least this many bytes are decoded and converted (from_response)
+         in offload_executor instead of the event loop thread. None - never offload
+         (Ответы размером от этого количества байт декодируются и преобразуются (from_response)
+         в offload_executor, а не в потоке цикла событий. None - не выносить)
+        :param offload_executor: Thread or process pool for offload_threshold, None - the default executor of the loop.
+         With a process pool the request objects and their results must be picklable (the "namedtuple" output is not)
+         (Пул потоков или процессов для offload_threshold, None - исполнитель цикла по умолчанию.
+         С пулом процессов объекты запросов и их результаты должны сериализоваться pickle ("namedtuple" - нет))
+        :param coalesce_gets: If True, identical GET requests (same URL, params and headers) made while one of them
+         is in flight share that one HTTP request. Each caller still gets its own result objects. Other methods are never coalesced
+         (Если True, одинаковые GET запросы (тот же URL, параметры и заголовки), сделанные, пока один из них
+         выполняется, используют этот один HTTP запрос. Каждый вызывающий получает свои объекты результата. Другие методы не объединяются)
         """
         if not (login and password) and not api_token:
             raise ValueError("Either login and password or api_token must be provided")
@@ -75,10 +137,114 @@ class MoySkladClient:
 
         self._api_token = api_token
         self._debug = debug
-        self._auto_retry_count = auto_retry_count if auto_retry_count > 0 else 0
-        if auto_retry_delay < 0:
-            raise ValueError("auto_retry_delay must be >= 0")
-        self._auto_retry_delay = auto_retry_delay
+        if retry_policy is Unset:
+            if auto_retry_delay < 0:
+                raise ValueError("auto_retry_delay must be >= 0")
+            retry_policy = RetryPolicy(
+                max_attempts=max(auto_retry_count, 1),
+                base_delay=auto_retry_delay,
+            )
+        self._retry_policy = retry_policy
+        self._json_codec = default_codec() if json_codec is Unset else json_codec
+        if offload_threshold is not None and offload_threshold < 0:
+            raise ValueError("offload_threshold must be >= 0 or None")
+        self._offload_threshold = offload_threshold
+        self._offload_executor = offload_executor
+        self._decode_stats = DecodeStats()
+        self._coalesce_gets = coalesce_gets
+        self._in_flight: typing.Dict[tuple, asyncio.Future] = {}
+        self._loader: typing.Optional[BatchLoader] = None
+        self._references: typing.Optional[ReferenceCache] = None
+
+        if connection_limit < 0 or connection_limit_per_host < 0:
+            raise ValueError("connection limits must be >= 0")
+        if keepalive_timeout < 0:
+            raise ValueError("keepalive_timeout must be >= 0")
+        self._persistent_session = persistent_session
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        self._rate_limiter = RateLimiter() if rate_limiter is Unset else rate_limiter
+
+    @property
+    def rate_limiter(self) -> typing.Optional[RateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    @property
+    def references(self) -> ReferenceCache:
+        """
+        Cache of reference entities (currencies, units, price types, stores, ...) with default settings,
+        created on first use. See ReferenceCache.
+        (Кэш справочников (валюты, единицы измерения, типы цен, склады, ...) с настройками по умолчанию,
+        создается при первом использовании. См. ReferenceCache.)
+        """
+        if self._references is None:
+            self._references = ReferenceCache(self)
+        return self._references
+
+    @property
+    def decode_stats(self) -> DecodeStats:
+        """
+        Time spent decoding and converting responses of __call__, iterate and iterate_parallel.
+        (Время декодирования и преобразования ответов __call__, iterate и iterate_parallel.)
+        """
+        return self._decode_stats
+
+    def _limiter_context(self) -> typing.AsyncContextManager:
+        if self._rate_limiter is None:
+            return contextlib.nullcontext()
+        return self._rate_limiter
+
+    async def __aenter__(self) -> "MoySkladClient":
+        if self._persistent_session:
+            self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _make_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self._connection_limit,
+            limit_per_host=self._connection_limit_per_host,
+            keepalive_timeout=self._keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self._dns_cache_ttl,
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the pooled session, creating it on first use.
+        (Возвращает сессию с пулом соединений, создавая ее при первом использовании.)
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=self._make_connector())
+        return self._session
+
+    @contextlib.asynccontextmanager
+    async def _session_context(self) -> typing.AsyncIterator[aiohttp.ClientSession]:
+        if self._persistent_session:
+            yield self._get_session()
+            return
+        async with aiohttp.ClientSession(connector=self._make_connector()) as session:
+            yield session
+
+    async def close(self) -> None:
+        """
+        Close the pooled session and all its connections. The client can still be used after that,
+        a new session will be opened on the next request.
+        (Закрывает сессию и все ее соединения. Клиентом можно пользоваться и после этого,
+        при следующем запросе будет открыта новая сессия.)
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def request(
         self,
@@ -101,81 +267,165 @@ class MoySkladClient:
 
         :return: JSON Response from the MoySklad API (JSON Ответ от MoySklad API)
         """
-        async with aiohttp.ClientSession() as session:
-            kwargs.setdefault("headers", {})
+        data = await self._request_body(method, url, allow_non_json, **kwargs)
+        if isinstance(data, dict):
+            return data
+        return self._json_codec.loads(data) if data else None
+
+    async def _request_body(
+        self,
+        method: typing.Literal["GET", "POST", "PUT", "DELETE"],
+        url: str,
+        allow_non_json=False,
+        **kwargs,
+    ) -> typing.Union[bytes, dict]:
+        """
+        Same as request(), but returns the undecoded body of a JSON response ({} for an allowed non-JSON response).
+        Identical concurrent GET requests share one HTTP request, see coalesce_gets.
+        (То же, что request(), но возвращает нераскодированное тело JSON ответа ({} для разрешенного не JSON ответа).
+        Одинаковые параллельные GET запросы используют один HTTP запрос, см. coalesce_gets.)
+        """
+        key = self._coalesce_key(method, url, allow_non_json, kwargs)
+        if key is None:
+            return await self._send_request(method, url, allow_non_json, **kwargs)
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._send_request(method, url, allow_non_json, **kwargs)
+            )
+            self._in_flight[key] = future
+            future.add_done_callback(functools.partial(self._forget_in_flight, key))
+        # a cancelled caller must not cancel the request of the others
+        # (отмена одного вызывающего не должна отменять запрос остальных)
+        data = await asyncio.shield(future)
+        # the body is bytes and is decoded by every caller, so each one gets its own objects
+        # (тело - bytes и декодируется каждым вызывающим, поэтому каждый получает свои объекты)
+        return {} if isinstance(data, dict) else data
+
+    def _coalesce_key(
+        self, method: str, url: str, allow_non_json: bool, kwargs: dict
+    ) -> typing.Optional[tuple]:
+        if not self._coalesce_gets or method != "GET":
+            return None
+        if not set(kwargs) <= {"params", "headers"}:
+            return None
+        return (
+            url,
+            allow_non_json,
+            _freeze(kwargs.get("params")),
+            _freeze(kwargs.get("headers")),
+        )
+
+    def _forget_in_flight(self, key: tuple, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # mark the exception as retrieved, even if all callers were cancelled
+            # (помечаем исключение как полученное, даже если все вызывающие были отменены)
+            future.exception()
+
+    async def _send_request(
+        self,
+        method: typing.Literal["GET", "POST", "PUT", "DELETE"],
+        url: str,
+        allow_non_json=False,
+        **kwargs,
+    ) -> typing.Union[bytes, dict]:
+        async with self._session_context() as session:
+            kwargs["headers"] = dict(kwargs.get("headers") or {})
             kwargs["headers"]["Authorization"] = f"Basic {self._api_token}"
-            is_json = kwargs.get("json") is not None
-            json_text = "{}"
-            if is_json:
-                if self._debug:
-                    # convert json to a body with a pretty printed json, set content-type to application/json.
-                    # This is needed for better error reading.
-                    # (конвертируем json в тело с красиво отформатированным json,
-                    # устанавливаем content-type в application/json)
-                    # (это нужно для лучшего чтения ошибок)
-                    kwargs["data"] = json.dumps(
-                        kwargs.pop("json", {}), indent=4, ensure_ascii=False
-                    )
-                else:
-                    kwargs["data"] = json.dumps(
-                        kwargs.pop("json", {}),
-                        separators=(",", ":"),
-                        ensure_ascii=False,
-                    )
-                json_text = kwargs["data"]
+            body = b"{}"
+            if kwargs.get("json") is not None:
+                # the body is encoded once and reused by all retries.
+                # In debug mode it is pretty printed, this is needed for better error reading.
+                # (тело кодируется один раз и используется во всех повторах.
+                # В режиме отладки оно красиво форматируется, это нужно для лучшего чтения ошибок)
+                body = self._json_codec.dumps(kwargs.pop("json"), pretty=self._debug)
+                kwargs["data"] = body
                 kwargs["headers"]["Content-Type"] = "application/json"
 
             # allow gzipped responses
             # (разрешаем сжатые ответы)
             kwargs["headers"]["Accept-Encoding"] = "gzip"
 
-            last_exception = None
-            for retry_num in range(1, self._auto_retry_count + 1):
-                is_last_retry = retry_num == self._auto_retry_count
+            started = time.monotonic()
+            attempt = 0
+            while True:
+                attempt += 1
+                retry_after = None
                 try:
-                    async with session.request(method, url, **kwargs) as resp:
+                    async with self._limiter_context(), session.request(
+                        method, url, **kwargs
+                    ) as resp:
                         if self._debug:
                             print(
-                                f"Request: {method} {url} {kwargs.get('json', '')} {kwargs.get('data', '')}\n"
+                                f"Request: {method} {url} {body.decode()}\n"
                                 f"Response: {resp.status} {await resp.text()}"
                             )
-                        if resp.status >= 500:
+                        if self._rate_limiter is not None:
+                            self._rate_limiter.update(resp.headers)
+                        is_json_response = resp.content_type == "application/json"
+                        if resp.status >= 400 and (
+                            is_json_response
+                            or self._retry_policy.should_retry_status(resp.status)
+                        ):
                             try:
-                                json_resp = await resp.json()
-                            except (aiohttp.ContentTypeError, json.JSONDecodeError):
+                                json_resp = self._json_codec.loads(await resp.read())
+                            except ValueError:
+                                json_resp = {}
+                            items = None
+                            if isinstance(json_resp, list):
+                                # array requests answer with an element per object (запросы с массивом отвечают элементом на объект)
+                                items = json_resp
+                                json_resp = next(
+                                    (
+                                        x
+                                        for x in items
+                                        if isinstance(x, dict) and x.get("errors")
+                                    ),
+                                    {},
+                                )
+                            elif not isinstance(json_resp, dict):
                                 json_resp = {}
+                            errors = json_resp.get("errors") or [
+                                {"error": f"Server returned {resp.status}"}
+                            ]
                             last_exception = MoySkladError(
-                                json_resp.get(
-                                    "errors",
-                                    {"error": f"Server returned {resp.status}"},
-                                ),
-                                json_text,
+                                errors[0], body.decode(), items
                             )
-                            if is_last_retry:
+                            if not self._retry_policy.should_retry_status(
+                                resp.status, last_exception.code
+                            ):
                                 raise last_exception
-                            await asyncio.sleep(self._auto_retry_delay)
-                            continue
-                        if resp.content_type != "application/json":
-                            if allow_non_json:
-                                return {}
-                            raise ValueError(
-                                f"Response is not JSON: `{resp.content_type}` : {await resp.text()}"
-                            )
-                        json_resp = await resp.json()
-                        if resp.status >= 400:
-                            raise MoySkladError(json_resp["errors"][0], json_text)
-                        return json_resp
-                except (
-                    aiohttp.client_exceptions.ClientConnectorError,
-                    asyncio.TimeoutError,
-                ) as e:
-                    if is_last_retry:
-                        raise e
-                    await asyncio.sleep(self._auto_retry_delay)
+                            if resp.status == 429:
+                                # the server tells how long to wait, RateLimiter pauses all requests for that time
+                                # (сервер сообщает, сколько ждать, RateLimiter приостанавливает все запросы на это время)
+                                if self._rate_limiter is not None:
+                                    retry_after = self._rate_limiter.block(resp.headers)
+                                else:
+                                    retry_after = get_retry_after(resp.headers)
+                        else:
+                            if not is_json_response:
+                                if allow_non_json:
+                                    return {}
+                                raise ValueError(
+                                    f"Response is not JSON: `{resp.content_type}` : {await resp.text()}"
+                                )
+                            return await resp.read()
+                except Exception as e:
+                    if not self._retry_policy.should_retry_exception(e):
+                        raise
                     last_exception = e
-        if last_exception is not None:
-            raise last_exception
-        raise ValueError("This should never happen")
+                delay = self._retry_policy.next_delay(
+                    attempt, time.monotonic() - started, retry_after
+                )
+                if delay is None:
+                    raise last_exception
+                if retry_after is not None and self._rate_limiter is not None:
+                    # RateLimiter already waits before the next request
+                    # (RateLimiter уже подождет перед следующим запросом)
+                    delay = 0
+                await asyncio.sleep(delay)
 
     async def raw_request(
         self,
@@ -188,21 +438,421 @@ class MoySkladClient:
 
         :returns (status, body, headers): status code, body and headers of the response
         """
-        async with aiohttp.ClientSession() as session:
-            kwargs.setdefault("headers", {})
+        async with self._session_context() as session:
+            kwargs["headers"] = dict(kwargs.get("headers") or {})
             kwargs["headers"]["Authorization"] = f"Basic {self._api_token}"
             kwargs["headers"]["Accept-Encoding"] = "gzip"
 
-            async with session.request(*args, **kwargs) as resp:
-                return resp.status, await resp.read(), resp.headers
+            started = time.monotonic()
+            attempt = 0
+            while True:
+                attempt += 1
+                retry_after = None
+                try:
+                    async with self._limiter_context(), session.request(
+                        *args, **kwargs
+                    ) as resp:
+                        if self._rate_limiter is not None:
+                            self._rate_limiter.update(resp.headers)
+                        result = resp.status, await resp.read(), resp.headers
+                        if not self._retry_policy.should_retry_status(resp.status):
+                            return result
+                        if resp.status == 429:
+                            if self._rate_limiter is not None:
+                                retry_after = self._rate_limiter.block(resp.headers)
+                            else:
+                                retry_after = get_retry_after(resp.headers)
+                        delay = self._retry_policy.next_delay(
+                            attempt, time.monotonic() - started, retry_after
+                        )
+                        if delay is None:
+                            return result
+                except Exception as e:
+                    if not self._retry_policy.should_retry_exception(e):
+                        raise
+                    delay = self._retry_policy.next_delay(
+                        attempt, time.monotonic() - started
+                    )
+                    if delay is None:
+                        raise
+                if retry_after is not None and self._rate_limiter is not None:
+                    delay = 0
+                await asyncio.sleep(delay)
 
     # function that allows us to use MoySkladClient as a caller
     # (функция, которая позволяет нам использовать MoySkladClient как вызывающий)
     async def __call__(self, request):
         if not isinstance(request, types.ApiRequest):
             raise TypeError("request must be an ApiRequest")
-        result = await self.request(**request.to_request().to_kwargs())
-        return request.from_response(result)
+        _, result = await self._call(request, request.build_request().to_kwargs())
+        return result
+
+    async def _call(
+        self, request: types.ApiRequest, kwargs: dict
+    ) -> typing.Tuple[typing.Optional[types.MetaArrayMeta], typing.Any]:
+        """
+        Makes the request and converts the response with request.from_response,
+        in offload_executor if the body is large enough.
+        (Делает запрос и преобразует ответ с помощью request.from_response,
+        в offload_executor, если тело ответа достаточно большое.)
+
+        :return: (meta, result) - meta is None if the response has no meta (meta равно None, если в ответе нет meta)
+        """
+        data = await self._request_body(**kwargs)
+        size = 0 if isinstance(data, dict) else len(data)
+        if self._offload_threshold is None or size < self._offload_threshold:
+            meta, result, seconds = decode_response(self._json_codec, request, data)
+            self._decode_stats.add_inline(size, seconds)
+            return meta, result
+        # the bytes object itself is passed, a thread pool uses it without copying
+        # (передается сам объект bytes, пул потоков использует его без копирования)
+        started = time.perf_counter()
+        meta, result, seconds = await asyncio.get_running_loop().run_in_executor(
+            self._offload_executor, decode_response, self._json_codec, request, data
+        )
+        self._decode_stats.add_offloaded(
+            size, seconds, time.perf_counter() - started
+        )
+        return meta, result
+
+    async def _request_page(
+        self,
+        request: types.ApiRequest,
+        offset: int,
+        limit: int,
+        filter_: typing.Optional[str] = None,
+        order: typing.Optional[str] = None,
+    ) -> typing.Tuple[typing.Optional[types.MetaArrayMeta], list]:
+        """
+        Requests one page of a list request, overriding its limit and offset.
+        (Запрашивает одну страницу списка, подменяя limit и offset запроса.)
+
+        :param filter_: Added to the filter of the request (Добавляется к фильтру запроса)
+        :param order: Replaces the order of the request (Заменяет сортировку запроса)
+        :return: (meta, items) - meta is None if the response is not a MetaArray (meta равно None, если ответ не MetaArray)
+        """
+        kwargs = request.build_request().to_kwargs()
+        if kwargs["method"] != "GET":
+            raise ValueError("Only GET requests can be paginated")
+        if request.expand_paths:
+            limit = min(limit, types.MAX_EXPAND_LIMIT)
+        params = dict(kwargs.get("params") or {})
+        params["limit"] = limit
+        params["offset"] = offset
+        if filter_:
+            types.merge_param(params, "filter", filter_)
+        if order:
+            params["order"] = order
+        kwargs["params"] = params
+        return await self._call(request, kwargs)
+
+    async def iterate(
+        self,
+        request: types.ApiRequest,
+        page_size: int = helpers.MAX_PAGE_SIZE,
+        max_items: typing.Optional[int] = None,
+        cursor: typing.Optional[KeysetCursor] = None,
+    ) -> typing.AsyncIterator[typing.Any]:
+        """
+        Iterate over all objects of a list request, requesting pages one by one.
+        Only one page (at most page_size objects) is held in memory at a time.
+        limit and offset of the request are overridden, the request's offset (if set) is used as the starting offset.
+        (Итерирует по всем объектам списка, запрашивая страницы по одной.
+        В памяти одновременно хранится только одна страница (не больше page_size объектов).
+        limit и offset запроса подменяются, offset запроса (если указан) используется как начальный.)
+
+        Example:
+        async for product in client.iterate(product_api.GetProductListRequest()):
+            ...
+
+        :param request: Any GET ApiRequest whose response is a MetaArray (Любой GET ApiRequest, ответ которого - MetaArray)
+        :param page_size: Number of objects per page, 1 - 1000 (Количество объектов на странице, 1 - 1000)
+        :param max_items: Stop after this many objects (Остановиться после такого количества объектов)
+        :param cursor: Iterate by key instead of offset, see KeysetCursor. Objects are returned ordered by updated, id,
+         starting after the cursor, and the cursor follows the last returned object
+         (Итерировать по ключу вместо offset, см. KeysetCursor. Объекты возвращаются по порядку updated, id,
+         начиная после курсора, и курсор указывает на последний возвращенный объект)
+        """
+        if not 1 <= page_size <= helpers.MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {helpers.MAX_PAGE_SIZE}")
+        if cursor is not None:
+            async for item in self._iterate_keyset(
+                request, page_size, max_items, cursor
+            ):
+                yield item
+            return
+        start_offset = (request.to_request().params or {}).get("offset")
+        offset = start_offset if isinstance(start_offset, int) else 0
+        yielded = 0
+        while True:
+            meta, items = await self._request_page(request, offset, page_size)
+            for item in items:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+            if meta is None or not items:
+                return
+            offset += len(items)
+            if not meta.get("nextHref") or offset >= meta.get("size", 0):
+                return
+
+    async def _iterate_keyset(
+        self,
+        request: types.ApiRequest,
+        page_size: int,
+        max_items: typing.Optional[int],
+        cursor: KeysetCursor,
+    ) -> typing.AsyncIterator[typing.Any]:
+        """
+        Pages are requested with order=updated,id and filter updated>=<cursor second>, so deep offsets are not needed
+        and rows changed during the iteration are not lost. Rows up to the cursor are skipped. If a whole page
+        lies within one second, the next page is requested with an offset inside that second
+        (with an overlap, repeats are skipped).
+        (Страницы запрашиваются с order=updated,id и фильтром updated>=<секунда курсора>, поэтому большие offset
+        не нужны и строки, измененные во время итерации, не теряются. Строки до курсора пропускаются. Если вся страница
+        попадает в одну секунду, следующая запрашивается со смещением внутри этой секунды (с перекрытием, повторы пропускаются).)
+        """
+        if "order" in (request.to_request().params or {}) or (
+            request.query is not None and request.query.order
+        ):
+            raise ValueError("Keyset iteration can not be used with a custom order")
+        overlap = page_size // 10
+        boundary = cursor.boundary()
+        offset = 0
+        yielded = 0
+        while True:
+            meta, items = await self._request_page(
+                request,
+                offset,
+                page_size,
+                filter_=f"updated>={query.format_value(boundary)}"
+                if boundary is not None
+                else None,
+                order=KEYSET_ORDER,
+            )
+            for item in items:
+                key = row_key(item)
+                if cursor.is_after(key):
+                    continue
+                cursor.move(key)
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+            if meta is None or len(items) < (meta.get("limit") or page_size):
+                return
+            if cursor.boundary() == boundary:
+                # the whole page is within one second (вся страница в пределах одной секунды)
+                offset += max(len(items) - overlap, 1)
+            else:
+                boundary = cursor.boundary()
+                offset = 0
+
+    async def iterate_parallel(
+        self,
+        request: types.ApiRequest,
+        page_size: int = helpers.MAX_PAGE_SIZE,
+        concurrency: int = 5,
+        ordered: bool = True,
+    ) -> typing.AsyncIterator[typing.Any]:
+        """
+        Like iterate(), but after the first page (which gives meta.size) the remaining pages
+        are requested concurrently, at most `concurrency` pages at a time.
+        At most `concurrency` + 1 pages are held in memory.
+        (Как iterate(), но после первой страницы (из которой известен meta.size) остальные страницы
+        запрашиваются параллельно, не больше `concurrency` страниц одновременно.
+        В памяти хранится не больше `concurrency` + 1 страниц.)
+
+        MoySklad allows at most 5 parallel requests per user, so concurrency should not be higher than that,
+        unless requests are made with different users.
+        (MoySklad разрешает не больше 5 параллельных запросов от одного пользователя.)
+
+        :param request: Any GET ApiRequest whose response is a MetaArray (Любой GET ApiRequest, ответ которого - MetaArray)
+        :param page_size: Number of objects per page, 1 - 1000 (Количество объектов на странице, 1 - 1000)
+        :param concurrency: Maximum number of pages requested at once (Максимальное количество одновременно запрашиваемых страниц)
+        :param ordered: If True, objects are yielded in order. If False, (index, object) tuples are yielded
+         in order of page arrival, where index is the position of the object in the whole list.
+         (Если True, объекты выдаются по порядку. Если False, выдаются кортежи (индекс, объект)
+         в порядке получения страниц, где индекс - позиция объекта во всем списке.)
+        """
+        if not 1 <= page_size <= helpers.MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {helpers.MAX_PAGE_SIZE}")
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        start_offset = (request.to_request().params or {}).get("offset")
+        start_offset = start_offset if isinstance(start_offset, int) else 0
+
+        meta, items = await self._request_page(request, start_offset, page_size)
+        for index, item in enumerate(items, start_offset):
+            yield item if ordered else (index, item)
+        if meta is None or not items or not meta.get("nextHref"):
+            return
+
+        # the server may lower the limit (for example, when expand is used)
+        # (сервер может уменьшить limit (например, при использовании expand))
+        step = meta.get("limit") or page_size
+        offsets = iter(range(start_offset + len(items), meta.get("size", 0), step))
+        pending: typing.Dict[asyncio.Future, int] = {}
+
+        def launch() -> None:
+            offset = next(offsets, None)
+            if offset is not None:
+                task = asyncio.ensure_future(self._request_page(request, offset, step))
+                pending[task] = offset
+
+        try:
+            for _ in range(concurrency):
+                launch()
+            while pending:
+                if ordered:
+                    # dicts keep insertion order, so the first task is the lowest offset
+                    # (словари сохраняют порядок вставки, первая задача - с наименьшим offset)
+                    task = next(iter(pending))
+                    await asyncio.wait([task])
+                    done = [task]
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                for task in done:
+                    offset = pending.pop(task)
+                    _, items = task.result()
+                    launch()
+                    for index, item in enumerate(items, offset):
+                        yield item if ordered else (index, item)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def load(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        id_: str,
+    ) -> types.MoySkladBaseClass:
+        """
+        Get an object by id. Calls made at the same time are batched into list requests
+        filtered by id, see BatchLoader.
+        (Получить объект по id. Одновременные вызовы объединяются в запросы списка
+        с фильтром по id, см. BatchLoader.)
+
+        Example:
+        products = await asyncio.gather(*(client.load(product_api.Product, x) for x in ids))
+
+        :raises MoySkladError: if the object is not found (code 1021) or the request failed
+         (если объект не найден (код 1021) или запрос не удался)
+        """
+        if self._loader is None:
+            self._loader = BatchLoader(self)
+        return await self._loader.load(entity, id_)
+
+    async def _send_bulk(self, request: types.ApiRequest, size: int) -> list:
+        try:
+            return await self(request)
+        except MoySkladError as e:
+            # the objects that failed are reported in the response array, the others are saved
+            # (несохраненные объекты указаны в массиве ответа, остальные сохранены)
+            if e.items is None or len(e.items) != size:
+                raise
+            return request.parse_response(e.items)
+
+    async def bulk_upsert(
+        self,
+        requests: typing.Sequence[types.ApiRequest],
+        chunk_size: int = helpers.MAX_BULK_SIZE,
+    ) -> typing.List[typing.Any]:
+        """
+        https://dev.moysklad.ru/doc/api/remap/1.2/#mojsklad-json-api-obschie-swedeniq-sozdanie-i-obnowlenie-neskol-kih-ob-ektow
+
+        Create and update many objects with array POST requests.
+        Requests are grouped by entity type and split into chunks of chunk_size objects,
+        chunks are sent concurrently (the rate limiter still applies).
+        (Создание и обновление множества объектов массовыми POST запросами.
+        Запросы группируются по типу сущности и разбиваются на части по chunk_size объектов,
+        части отправляются параллельно (с учетом ограничений RateLimiter).)
+
+        Example:
+        results = await client.bulk_upsert(
+            [product_api.UpdateProductRequest(id_=id_, sale_prices=prices) for id_, prices in new_prices.items()]
+        )
+
+        :param requests: Single-object Create*Request / Update*Request instances (Запросы Create*Request / Update*Request)
+        :param chunk_size: Objects per request, 1 - 1000 (Объектов в одном запросе, 1 - 1000)
+        :return: For each request, in the same order: its parsed result, MoySkladError if that object failed
+         (also when the response status is 4xx), or the exception the whole chunk failed with
+         (Для каждого запроса, в том же порядке: его результат, MoySkladError, если объект не сохранен
+         (в том числе при статусе ответа 4xx), или исключение, с которым не удалась вся часть)
+        """
+        if not 1 <= chunk_size <= helpers.MAX_BULK_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {helpers.MAX_BULK_SIZE}")
+        groups: typing.Dict[str, typing.List[int]] = {}
+        for index, request in enumerate(requests):
+            url = bulk_api.BulkUpsertRequest.collection_url(request)
+            groups.setdefault(url, []).append(index)
+
+        results: typing.List[typing.Any] = [None] * len(requests)
+
+        async def send_chunk(indexes: typing.List[int]) -> None:
+            try:
+                request = bulk_api.BulkUpsertRequest([requests[i] for i in indexes])
+                chunk_results = await self._send_bulk(request, len(indexes))
+            except Exception as e:
+                chunk_results = [e] * len(indexes)
+            for index, result in zip(indexes, chunk_results):
+                results[index] = result
+
+        await asyncio.gather(
+            *(
+                send_chunk(indexes[i : i + chunk_size])
+                for indexes in groups.values()
+                for i in range(0, len(indexes), chunk_size)
+            )
+        )
+        return results
+
+    async def bulk_delete(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        ids: typing.Sequence[typing.Union[str, types.Meta]],
+        chunk_size: int = helpers.MAX_BULK_SIZE,
+    ) -> typing.List[typing.Optional[Exception]]:
+        """
+        https://dev.moysklad.ru/doc/api/remap/1.2/#mojsklad-json-api-obschie-swedeniq-massowoe-udalenie
+
+        Delete many objects of one type with POST /entity/<type>/delete requests.
+        ids are split into chunks of chunk_size, chunks are sent concurrently (the rate limiter still applies).
+        (Удаление множества объектов одного типа запросами POST /entity/<type>/delete.
+        id разбиваются на части по chunk_size, части отправляются параллельно (с учетом ограничений RateLimiter).)
+
+        :param entity: Entity type name ("product") or model class (Product) (Тип сущности ("product") или класс модели (Product))
+        :param ids: Object ids or metas, for "assortment" only metas (id или meta объектов, для "assortment" только meta)
+        :param chunk_size: Objects per request, 1 - 1000 (Объектов в одном запросе, 1 - 1000)
+        :return: For each id, in the same order: None if it was deleted, MoySkladError if it was not,
+         or the exception the whole chunk failed with
+         (Для каждого id, в том же порядке: None, если объект удален, MoySkladError, если нет,
+         или исключение, с которым не удалась вся часть)
+        """
+        if not 1 <= chunk_size <= helpers.MAX_BULK_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {helpers.MAX_BULK_SIZE}")
+        if not ids:
+            return []
+        chunks = [
+            bulk_api.BulkDeleteRequest(entity, list(ids[i : i + chunk_size]))
+            for i in range(0, len(ids), chunk_size)
+        ]
+
+        async def send_chunk(
+            request: bulk_api.BulkDeleteRequest,
+        ) -> typing.List[typing.Optional[Exception]]:
+            try:
+                return await self._send_bulk(request, len(request.ids))
+            except Exception as e:
+                return [e] * len(request.ids)
+
+        results = []
+        for chunk_results in await asyncio.gather(*map(send_chunk, chunks)):
+            results.extend(chunk_results)
+        return results
 
     # internal orders (внутренние заказы)
 
@@ -1980,6 +2630,40 @@ class MoySkladClient:
             )
         )
 
+    async def get_small_stock_bystore_current_report(
+        self,
+        include: typing.Union[Unset, str] = Unset,
+        changed_since: typing.Union[Unset, datetime.datetime] = Unset,
+        stock_type: typing.Union[
+            Unset, typing.Literal["stock", "freeStock", "quantity"]
+        ] = Unset,
+        filter_assortment_id: typing.Union[Unset, typing.List[str]] = Unset,
+        filter_store_id: typing.Union[Unset, typing.List[str]] = Unset,
+    ) -> typing.List[stock_api.SmallStockReport]:
+        """
+        https://dev.moysklad.ru/doc/api/remap/1.2/reports/#otchety-otchet-ostatki-kratkij-otchet-ob-ostatkah
+
+        Current stock by stores (/report/stock/bystore/current), one row per (assortmentId, storeId).
+        (Текущие остатки по складам (/report/stock/bystore/current), одна строка на (assortmentId, storeId).)
+
+        :param include: Include related entities (Включить связанные сущности)
+        :param changed_since: Changed since (Изменено с)
+        :param stock_type: Stock type (Тип остатка)
+        :param filter_assortment_id: Filter by assortment id (Фильтр по id товара)
+        :param filter_store_id: Filter by store id (Фильтр по id склада)
+        :return: List of small stock reports by store (Список отчетов по остаткам по складам)
+        """
+
+        return await self(
+            stock_api.GetSmallStockReportByStoreCurrentRequest(
+                include=include,
+                changed_since=changed_since,
+                stock_type=stock_type,
+                filter_assortment_id=filter_assortment_id,
+                filter_store_id=filter_store_id,
+            )
+        )
+
     # custom entities
     async def create_custom_entity(
         self,
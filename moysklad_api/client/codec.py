@@ -0,0 +1,77 @@
+import json
+import typing
+
+try:
+    import orjson
+except ImportError:  # optional dependency (необязательная зависимость)
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # optional dependency (необязательная зависимость)
+    ujson = None
+
+
+class JsonCodec:
+    """
+    Encodes request bodies to bytes and decodes response bodies from bytes.
+    Decoding errors must be ValueError subclasses (json.JSONDecodeError, orjson.JSONDecodeError, ...).
+    (Кодирует тела запросов в bytes и декодирует тела ответов из bytes.
+    Ошибки декодирования должны быть подклассами ValueError (json.JSONDecodeError, orjson.JSONDecodeError, ...).)
+    """
+
+    name = "json"
+
+    def dumps(self, obj: typing.Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=4, ensure_ascii=False).encode()
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data: bytes) -> typing.Any:
+        return json.loads(data)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def dumps(self, obj: typing.Any, pretty: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    def loads(self, data: bytes) -> typing.Any:
+        return orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("ujson is not installed")
+
+    def dumps(self, obj: typing.Any, pretty: bool = False) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, indent=4 if pretty else 0).encode()
+
+    def loads(self, data: bytes) -> typing.Any:
+        return ujson.loads(data)
+
+
+def default_codec() -> JsonCodec:
+    """
+    Returns the fastest available codec: orjson, then ujson, then the standard json module.
+    (Возвращает самый быстрый доступный кодек: orjson, затем ujson, затем стандартный модуль json.)
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if ujson is not None:
+        return UjsonCodec()
+    return JsonCodec()
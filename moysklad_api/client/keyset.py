@@ -0,0 +1,88 @@
+import datetime
+import typing
+
+from .. import helpers
+
+# order of keyset iteration (порядок при итерации по ключу)
+KEYSET_ORDER = "updated,id"
+
+
+def row_key(item: typing.Any) -> typing.Tuple[datetime.datetime, str]:
+    """
+    Returns (updated, id) of a row: a model, a lazy view, a raw dict or a namedtuple with these fields.
+    (Возвращает (updated, id) строки: модели, ленивого представления, словаря или namedtuple с этими полями.)
+    """
+    if isinstance(item, dict):
+        updated, id_ = helpers.parse_date(item.get("updated")), item.get("id")
+    else:
+        updated, id_ = getattr(item, "updated", None), getattr(item, "id", None)
+    if not isinstance(updated, datetime.datetime) or not id_:
+        raise ValueError(
+            "Keyset iteration needs the updated and id fields of every row "
+            "(Итерации по ключу нужны поля updated и id каждой строки)"
+        )
+    return updated, id_
+
+
+class KeysetCursor:
+    """
+    Position of a keyset iteration: (updated, id) of the last returned row.
+    Pass it to MoySkladClient.iterate(cursor=...) to iterate by key instead of offset. The cursor is moved
+    as rows are returned, so it can be saved (to_dict) and used later to continue from the same place.
+    (Позиция итерации по ключу: (updated, id) последней возвращенной строки.
+    Передайте его в MoySkladClient.iterate(cursor=...), чтобы итерировать по ключу вместо offset. Курсор сдвигается
+    по мере возврата строк, поэтому его можно сохранить (to_dict) и позже продолжить с того же места.)
+    """
+
+    __slots__ = ("updated", "id")
+
+    def __init__(
+        self,
+        updated: typing.Optional[datetime.datetime] = None,
+        id_: typing.Optional[str] = None,
+    ):
+        """
+
+        :param updated: updated of the last seen row, None - from the beginning (updated последней строки, None - с начала)
+        :param id_: id of the last seen row (id последней строки)
+        """
+        self.updated = updated
+        self.id = id_
+
+    def is_after(self, key: typing.Tuple[datetime.datetime, str]) -> bool:
+        """
+        True if the row with this key was already returned before the cursor position.
+        (True, если строка с этим ключом уже была возвращена до позиции курсора.)
+        """
+        if self.updated is None:
+            return False
+        return key <= (self.updated, self.id or "")
+
+    def move(self, key: typing.Tuple[datetime.datetime, str]) -> None:
+        self.updated, self.id = key
+
+    def boundary(self) -> typing.Optional[datetime.datetime]:
+        """
+        Value of the updated>= filter: the cursor time rounded down to a second, the rows of that second
+        that were already returned are skipped by is_after.
+        (Значение фильтра updated>=: время курсора, округленное вниз до секунды, уже возвращенные строки
+        этой секунды пропускаются по is_after.)
+        """
+        if self.updated is None:
+            return None
+        return self.updated.replace(microsecond=0)
+
+    def to_dict(self) -> dict:
+        return {
+            "updated": self.updated.isoformat(sep=" ", timespec="milliseconds")
+            if self.updated is not None
+            else None,
+            "id": self.id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KeysetCursor":
+        return cls(helpers.parse_date(data.get("updated")), data.get("id"))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(updated={self.updated!r}, id={self.id!r})"
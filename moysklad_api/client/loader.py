@@ -0,0 +1,176 @@
+import asyncio
+import typing
+import urllib.parse
+
+from ..errors import MoySkladError
+from .. import types, helpers
+from ..api import bulk as bulk_api
+
+if typing.TYPE_CHECKING:
+    from .client import MoySkladClient
+
+# conservative limit of the request URL length, longer URLs may be rejected by proxies and servers
+# (консервативное ограничение длины URL запроса, более длинные URL могут отклоняться прокси и серверами)
+DEFAULT_MAX_URL_LENGTH = 4000
+# MoySklad error code "object not found" (код ошибки MoySklad "объект не найден")
+NOT_FOUND_ERROR_CODE = 1021
+
+
+class BatchLoader:
+    """
+    Collects get-by-id calls made within one event loop iteration (or within window seconds)
+    and resolves them per entity type with a few list requests filtered by id=...;id=...
+    Useful to avoid one HTTP request per id (N+1).
+    Calls for the same id in one batch share the result object.
+    (Собирает запросы объектов по id, сделанные в одной итерации цикла событий (или в течение window секунд),
+    и выполняет их для каждого типа сущности несколькими запросами списка с фильтром id=...;id=...
+    Позволяет не делать отдельный HTTP запрос на каждый id (N+1).
+    Запросы одного id в одной пачке получают один и тот же объект результата.)
+
+    Example:
+    loader = BatchLoader(client)
+    products = await asyncio.gather(*(loader.load("product", x) for x in ids))
+    """
+
+    def __init__(
+        self,
+        client: "MoySkladClient",
+        window: float = 0.0,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+    ):
+        """
+
+        :param client: Client used for the requests (Клиент для запросов)
+        :param window: How long to collect calls before sending, seconds. 0 - until the end of the current loop iteration
+         (Сколько собирать запросы перед отправкой, секунды. 0 - до конца текущей итерации цикла)
+        :param max_url_length: Maximum length of one request URL, ids are split into several requests to fit it
+         (Максимальная длина URL одного запроса, id разбиваются на несколько запросов, чтобы уложиться в нее)
+        """
+        if window < 0:
+            raise ValueError("window must be >= 0")
+        self._client = client
+        self._window = window
+        self._max_url_length = max_url_length
+        self._pending: typing.Dict[str, typing.Dict[str, asyncio.Future]] = {}
+        self._tasks: typing.Set[asyncio.Task] = set()
+
+    async def load(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        id_: str,
+    ) -> types.MoySkladBaseClass:
+        """
+        Get one object by id, batched with other calls.
+        (Получить один объект по id, вместе с другими запросами.)
+
+        :param entity: Entity type name ("product") or model class (Product) (Тип сущности ("product") или класс модели (Product))
+        :param id_: Object id (id объекта)
+
+        :raises MoySkladError: if the object is not found (code 1021) or the request failed
+         (если объект не найден (код 1021) или запрос не удался)
+        """
+        entity_type = helpers.get_entity_type(entity)
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(entity_type)
+        if pending is None:
+            pending = self._pending[entity_type] = {}
+            if self._window > 0:
+                loop.call_later(self._window, self._dispatch, entity_type)
+            else:
+                loop.call_soon(self._dispatch, entity_type)
+        future = pending.get(id_)
+        if future is None:
+            future = pending[id_] = loop.create_future()
+        # a cancelled caller must not cancel the result of the others
+        # (отмена одного вызывающего не должна отменять результат остальных)
+        return await asyncio.shield(future)
+
+    async def load_many(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        ids: typing.Iterable[str],
+    ) -> typing.List[typing.Union[types.MoySkladBaseClass, MoySkladError]]:
+        """
+        Get several objects by id.
+        (Получить несколько объектов по id.)
+
+        :return: For each id, in the same order: the object, or MoySkladError (Для каждого id, в том же порядке: объект, или MoySkladError)
+        """
+        results = await asyncio.gather(
+            *(self.load(entity, x) for x in ids), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, MoySkladError
+            ):
+                raise result
+        return results
+
+    def _dispatch(self, entity_type: str) -> None:
+        pending = self._pending.pop(entity_type)
+        task = asyncio.ensure_future(self._fetch(entity_type, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _chunks(self, entity_type: str, ids: typing.List[str]) -> typing.List[list]:
+        base_length = len(
+            f"{helpers.BASE_URL}/entity/{entity_type}?filter=&limit={helpers.MAX_PAGE_SIZE}"
+        )
+        chunks = []
+        chunk = []
+        length = base_length
+        for id_ in ids:
+            # escaped "id=<id>;" (экранированный "id=<id>;")
+            id_length = len(urllib.parse.quote(f"id={id_};", safe=""))
+            if chunk and (
+                length + id_length > self._max_url_length
+                or len(chunk) >= helpers.MAX_PAGE_SIZE
+            ):
+                chunks.append(chunk)
+                chunk = []
+                length = base_length
+            chunk.append(id_)
+            length += id_length
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    async def _fetch(
+        self, entity_type: str, pending: typing.Dict[str, asyncio.Future]
+    ) -> None:
+        await asyncio.gather(
+            *(
+                self._fetch_chunk(entity_type, chunk, pending)
+                for chunk in self._chunks(entity_type, list(pending))
+            )
+        )
+
+    async def _fetch_chunk(
+        self,
+        entity_type: str,
+        ids: typing.List[str],
+        pending: typing.Dict[str, asyncio.Future],
+    ) -> None:
+        try:
+            items = await self._client(bulk_api.GetByIdsRequest(entity_type, ids))
+        except Exception as e:
+            for id_ in ids:
+                if not pending[id_].done():
+                    pending[id_].set_exception(e)
+            return
+        found = {item.id: item for item in items}
+        for id_ in ids:
+            future = pending[id_]
+            if future.done():
+                continue
+            if id_ in found:
+                future.set_result(found[id_])
+            else:
+                future.set_exception(
+                    MoySkladError(
+                        {
+                            "error": f"Object {entity_type} with id {id_} not found",
+                            "code": NOT_FOUND_ERROR_CODE,
+                        }
+                    )
+                )
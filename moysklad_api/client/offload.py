@@ -0,0 +1,68 @@
+import time
+import typing
+
+from .. import types
+from .codec import JsonCodec
+
+
+class DecodeStats:
+    """
+    Time spent decoding responses and converting them with from_response, collected by MoySkladClient.
+    "inline" - on the event loop thread, "offloaded" - in the executor.
+    offloaded_seconds is the time spent in the executor, offloaded_wait_seconds - the time the caller waited for it.
+    (Время, затраченное на декодирование ответов и их преобразование в from_response, собирается MoySkladClient.
+    "inline" - в потоке цикла событий, "offloaded" - в исполнителе.
+    offloaded_seconds - время работы в исполнителе, offloaded_wait_seconds - сколько вызывающий код его ждал.)
+    """
+
+    def __init__(self):
+        self.inline_count = 0
+        self.inline_bytes = 0
+        self.inline_seconds = 0.0
+        self.offloaded_count = 0
+        self.offloaded_bytes = 0
+        self.offloaded_seconds = 0.0
+        self.offloaded_wait_seconds = 0.0
+
+    def add_inline(self, size: int, seconds: float) -> None:
+        self.inline_count += 1
+        self.inline_bytes += size
+        self.inline_seconds += seconds
+
+    def add_offloaded(self, size: int, seconds: float, wait_seconds: float) -> None:
+        self.offloaded_count += 1
+        self.offloaded_bytes += size
+        self.offloaded_seconds += seconds
+        self.offloaded_wait_seconds += wait_seconds
+
+    def reset(self) -> None:
+        self.__init__()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            + ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+            + ")"
+        )
+
+
+def decode_response(
+    codec: JsonCodec, request: types.ApiRequest, data: typing.Union[bytes, dict]
+) -> typing.Tuple[typing.Optional[types.MetaArrayMeta], typing.Any, float]:
+    """
+    Decodes a response body and converts it with request.parse_response.
+    Module level, so it can be sent to a process pool (codec and request must be picklable then).
+    (Декодирует тело ответа и преобразует его с помощью request.parse_response.
+    Функция уровня модуля, чтобы ее можно было отправить в пул процессов (тогда codec и request должны сериализоваться pickle).)
+
+    :return: (meta, result, seconds) - meta of a MetaArray response or None, converted result and time spent
+     (meta ответа-MetaArray или None, преобразованный результат и затраченное время)
+    """
+    started = time.perf_counter()
+    if isinstance(data, dict):
+        result = data
+    else:
+        result = codec.loads(data) if data else None
+    meta = result.get("meta") if isinstance(result, dict) else None
+    converted = request.parse_response(result)
+    return meta, converted, time.perf_counter() - started
@@ -0,0 +1,177 @@
+import asyncio
+import time
+import typing
+
+
+# https://dev.moysklad.ru/doc/api/remap/1.2/#mojsklad-json-api-obschie-swedeniq-ogranicheniq
+# Ограничения:
+#   Не более 45 запросов за 3 секундный период от аккаунта
+#   Не более 5 параллельных запросов от одного пользователя
+#
+# Заголовки ответа:
+#   X-RateLimit-Limit               Количество запросов, которые равномерно можно сделать в течение интервала
+#   X-RateLimit-Remaining           Число запросов, которые можно отправить до получения 429 ошибки
+#   X-Lognex-Retry-TimeInterval     Интервал в миллисекундах, в течение которого можно сделать эти запросы
+#   X-Lognex-Retry-After            Время в миллисекундах, через которое можно повторить запрос (только с 429)
+
+DEFAULT_REQUESTS_PER_WINDOW = 45
+DEFAULT_WINDOW = 3.0
+DEFAULT_MAX_PARALLEL = 5
+
+
+def _int_header(headers: typing.Mapping[str, str], name: str) -> typing.Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def get_retry_after(headers: typing.Mapping[str, str]) -> typing.Optional[float]:
+    """
+    Returns the time in seconds after which the request can be retried, from the X-Lognex-Retry-After header.
+    (Возвращает время в секундах, через которое можно повторить запрос, из заголовка X-Lognex-Retry-After.)
+    """
+    retry_after = _int_header(headers, "X-Lognex-Retry-After")
+    if retry_after is None:
+        return None
+    return max(retry_after, 0) / 1000
+
+
+class RateLimiter:
+    """
+    Client-wide scheduler for the MoySklad per-account request budget.
+    Combines a token bucket (requests per window) and a semaphore (parallel requests).
+    The budget is corrected with the X-RateLimit-* / X-Lognex-* headers of every response,
+    and all requests are paused for X-Lognex-Retry-After after a 429 response.
+    (Планировщик запросов с учетом ограничений MoySklad для аккаунта.
+    Объединяет token bucket (запросы за интервал) и семафор (параллельные запросы).
+    Бюджет корректируется по заголовкам X-RateLimit-* / X-Lognex-* каждого ответа,
+    а после ответа 429 все запросы приостанавливаются на X-Lognex-Retry-After.)
+
+    Usage (Использование):
+    async with limiter:
+        ...  # make the request (делаем запрос)
+    """
+
+    def __init__(
+        self,
+        requests_per_window: int = DEFAULT_REQUESTS_PER_WINDOW,
+        window: float = DEFAULT_WINDOW,
+        max_parallel: typing.Optional[int] = DEFAULT_MAX_PARALLEL,
+    ):
+        """
+
+        :param requests_per_window: Requests allowed per window (Количество запросов за интервал)
+        :param window: Window length in seconds (Длина интервала в секундах)
+        :param max_parallel: Maximum number of parallel requests, None - unlimited (Максимум параллельных запросов, None - без ограничений)
+        """
+        if requests_per_window < 1:
+            raise ValueError("requests_per_window must be >= 1")
+        if window <= 0:
+            raise ValueError("window must be > 0")
+        if max_parallel is not None and max_parallel < 1:
+            raise ValueError("max_parallel must be >= 1 or None")
+        self._requests_per_window = requests_per_window
+        self._window = window
+        self._tokens = float(requests_per_window)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._parallel = (
+            asyncio.Semaphore(max_parallel) if max_parallel is not None else None
+        )
+        self._lock = asyncio.Lock()
+
+    @property
+    def requests_per_window(self) -> int:
+        return self._requests_per_window
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    def _refill(self, now: float) -> None:
+        rate = self._requests_per_window / self._window
+        self._tokens = min(
+            float(self._requests_per_window),
+            self._tokens + (now - self._updated_at) * rate,
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """
+        Waits until a request can be made without exceeding the budget.
+        (Ждет, пока можно будет сделать запрос, не превысив ограничения.)
+        """
+        if self._parallel is not None:
+            await self._parallel.acquire()
+        try:
+            # the lock makes waiters take tokens in FIFO order
+            # (блокировка заставляет ожидающих получать токены по очереди)
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    wait = self._blocked_until - now
+                    if wait <= 0:
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            return
+                        wait = (
+                            (1 - self._tokens)
+                            * self._window
+                            / self._requests_per_window
+                        )
+                    await asyncio.sleep(wait)
+        except BaseException:
+            if self._parallel is not None:
+                self._parallel.release()
+            raise
+
+    def release(self) -> None:
+        if self._parallel is not None:
+            self._parallel.release()
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def update(self, headers: typing.Mapping[str, str]) -> None:
+        """
+        Corrects the budget with the rate limit headers of a response.
+        (Корректирует бюджет по заголовкам ответа.)
+        """
+        limit = _int_header(headers, "X-RateLimit-Limit")
+        interval = _int_header(headers, "X-Lognex-Retry-TimeInterval")
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        self._refill(time.monotonic())
+        if limit is not None and limit > 0:
+            self._requests_per_window = limit
+        if interval is not None and interval > 0:
+            self._window = interval / 1000
+        if remaining is not None:
+            self._tokens = min(self._tokens, float(max(remaining, 0)))
+
+    def block(self, headers: typing.Mapping[str, str]) -> float:
+        """
+        Called on a 429 response: pauses all requests for the time given by the server
+        (X-Lognex-Retry-After), or for one window if the header is missing.
+        (Вызывается при ответе 429: приостанавливает все запросы на время, указанное сервером
+        (X-Lognex-Retry-After), или на один интервал, если заголовка нет.)
+
+        :return: Pause in seconds (Пауза в секундах)
+        """
+        self.update(headers)
+        retry_after = get_retry_after(headers)
+        if retry_after is None:
+            retry_after = self._window
+        now = time.monotonic()
+        self._blocked_until = max(self._blocked_until, now + retry_after)
+        self._tokens = 0.0
+        self._updated_at = now
+        return retry_after
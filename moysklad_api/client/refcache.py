@@ -0,0 +1,286 @@
+import asyncio
+import collections
+import time
+import typing
+
+from ..errors import MoySkladError
+from .. import types, helpers
+from ..api.entities import (
+    currency as currency_api,
+    uom as uom_api,
+    pricetypes as pricetypes_api,
+    states as states_api,
+    taxrate as taxrate_api,
+    country as country_api,
+    region as region_api,
+    store as store_api,
+    organization as organization_api,
+    saleschannel as saleschannel_api,
+    expenseitem as expenseitem_api,
+)
+from .loader import NOT_FOUND_ERROR_CODE
+
+if typing.TYPE_CHECKING:
+    from .client import MoySkladClient
+
+# list requests of the cached /entity/<type> types (запросы списков кэшируемых типов /entity/<type>)
+_LIST_REQUESTS = {
+    "currency": currency_api.GetCurrenciesRequest,
+    "uom": uom_api.GetUomsRequest,
+    "taxrate": taxrate_api.GetTaxRatesRequest,
+    "country": country_api.GetCountriesRequest,
+    "region": region_api.GetRegionsRequest,
+    "store": store_api.GetStoresRequest,
+    "organization": organization_api.GetOrganizationsRequest,
+    "saleschannel": saleschannel_api.GetSalesChannelsRequest,
+    "expenseitem": expenseitem_api.GetExpenseItemsRequest,
+}
+REFERENCE_TYPES = tuple(_LIST_REQUESTS) + ("pricetype", "state")
+# documents whose states are loaded for the "state" type (документы, статусы которых загружаются для типа "state")
+DEFAULT_STATE_ENTITY_TYPES = (
+    "customerorder",
+    "demand",
+    "supply",
+    "purchaseorder",
+    "invoicein",
+    "invoiceout",
+    "move",
+    "internalorder",
+)
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_SIZE = 10000
+
+
+def _split_href(href: str) -> typing.Tuple[str, str]:
+    """
+    Returns (type, id) for an href of a cached type, for example
+    .../entity/currency/<id>, .../context/companysettings/pricetype/<id> or .../entity/demand/metadata/states/<id>.
+    (Возвращает (тип, id) для href кэшируемого типа.)
+    """
+    parts = href.split("?", 1)[0].rstrip("/").rsplit("/", 2)
+    if len(parts) != 3:
+        raise ValueError(f"Can not parse href: {href}")
+    entity_type = "state" if parts[1] == "states" else parts[1]
+    return entity_type, parts[2]
+
+
+class ReferenceCache:
+    """
+    Cache of rarely changing reference entities: currencies, units, price types, states, tax rates, countries,
+    regions, stores, organizations, sales channels and expense items.
+    Every type has its own TTL and its own LRU-bounded dict, so lookups by id or href are O(1).
+    (Кэш редко меняющихся справочников: валюты, единицы измерения, типы цен, статусы, ставки НДС, страны,
+    регионы, склады, юрлица, каналы продаж и статьи расходов.
+    Для каждого типа свой TTL и свой словарь с вытеснением LRU, поэтому поиск по id или href - O(1).)
+
+    Example:
+    cache = client.references
+    await cache.warm_up()
+    currency = await cache.get("currency", currency_id)
+    """
+
+    def __init__(
+        self,
+        client: "MoySkladClient",
+        ttl: float = DEFAULT_TTL,
+        ttls: typing.Optional[typing.Dict[str, float]] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        state_entity_types: typing.Iterable[str] = DEFAULT_STATE_ENTITY_TYPES,
+    ):
+        """
+
+        :param client: Client used for the requests (Клиент для запросов)
+        :param ttl: How long objects are kept, seconds (Сколько хранить объекты, секунды)
+        :param ttls: TTL per type, for example {"store": 600} (TTL для отдельных типов, например {"store": 600})
+        :param max_size: Maximum number of objects of one type, least recently used are evicted
+         (Максимальное количество объектов одного типа, вытесняются давно не использованные)
+        :param state_entity_types: Documents whose states are loaded by warm_up (Документы, статусы которых загружает warm_up)
+        """
+        if ttl < 0:
+            raise ValueError("ttl must be >= 0")
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        ttls = dict(ttls or {})
+        unknown = set(ttls) - set(REFERENCE_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown reference types: {', '.join(sorted(unknown))}")
+        self._client = client
+        self._ttls = {
+            entity_type: ttls.get(entity_type, ttl) for entity_type in REFERENCE_TYPES
+        }
+        self._max_size = max_size
+        self._state_entity_types = tuple(state_entity_types)
+        # type -> id -> (expires at, object), in LRU order (тип -> id -> (истекает в, объект), в порядке LRU)
+        self._entries: typing.Dict[
+            str, "collections.OrderedDict[str, typing.Tuple[float, types.MoySkladBaseClass]]"
+        ] = {entity_type: collections.OrderedDict() for entity_type in REFERENCE_TYPES}
+        # type -> when the full list expires (тип -> когда истекает полный список)
+        self._loaded_until: typing.Dict[str, float] = {}
+        self._refreshing: typing.Dict[str, asyncio.Future] = {}
+
+    def _check_type(
+        self, entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]]
+    ) -> str:
+        entity_type = helpers.get_entity_type(entity)
+        if entity_type not in self._entries:
+            raise ValueError(
+                f"{entity_type} is not cached, cached types: {', '.join(REFERENCE_TYPES)}"
+            )
+        return entity_type
+
+    def put(self, entity_type: str, obj: types.MoySkladBaseClass) -> None:
+        entries = self._entries[entity_type]
+        entries[obj.id] = (time.monotonic() + self._ttls[entity_type], obj)
+        entries.move_to_end(obj.id)
+        while len(entries) > self._max_size:
+            entries.popitem(last=False)
+
+    def get_cached(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        id_: str,
+    ) -> typing.Optional[types.MoySkladBaseClass]:
+        """
+        Returns the cached object, or None if it is not cached or expired. Makes no requests.
+        (Возвращает объект из кэша, или None, если его нет или он устарел. Не делает запросов.)
+        """
+        entity_type = self._check_type(entity)
+        entries = self._entries[entity_type]
+        entry = entries.get(id_)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del entries[id_]
+            return None
+        entries.move_to_end(id_)
+        return entry[1]
+
+    def get_cached_by_href(
+        self, href: str
+    ) -> typing.Optional[types.MoySkladBaseClass]:
+        return self.get_cached(*_split_href(href))
+
+    async def get(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        id_: str,
+    ) -> types.MoySkladBaseClass:
+        """
+        Returns the object from the cache, loading its type (or the object) if needed.
+        (Возвращает объект из кэша, при необходимости загружая его тип (или сам объект).)
+
+        :raises MoySkladError: if the object is not found (code 1021) (если объект не найден (код 1021))
+        """
+        entity_type = self._check_type(entity)
+        obj = self.get_cached(entity_type, id_)
+        if obj is not None:
+            return obj
+        if self._loaded_until.get(entity_type, 0) < time.monotonic():
+            await self.refresh(entity_type)
+            obj = self.get_cached(entity_type, id_)
+            if obj is not None:
+                return obj
+        if entity_type in _LIST_REQUESTS:
+            # created after the list was loaded, or evicted (создан после загрузки списка, или вытеснен)
+            obj = await self._client.load(entity_type, id_)
+            self.put(entity_type, obj)
+            return obj
+        raise MoySkladError(
+            {
+                "error": f"Object {entity_type} with id {id_} not found",
+                "code": NOT_FOUND_ERROR_CODE,
+            }
+        )
+
+    async def get_by_href(self, href: str) -> types.MoySkladBaseClass:
+        return await self.get(*_split_href(href))
+
+    async def refresh(
+        self, entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]]
+    ) -> None:
+        """
+        Loads all objects of the type. Concurrent calls for the same type share one load.
+        (Загружает все объекты типа. Одновременные вызовы для одного типа используют одну загрузку.)
+        """
+        entity_type = self._check_type(entity)
+        future = self._refreshing.get(entity_type)
+        if future is None:
+            future = asyncio.ensure_future(self._load(entity_type))
+            self._refreshing[entity_type] = future
+            future.add_done_callback(
+                lambda _: self._refreshing.pop(entity_type, None)
+            )
+        await asyncio.shield(future)
+
+    async def _load(self, entity_type: str) -> None:
+        if entity_type in _LIST_REQUESTS:
+            objects = [
+                x async for x in self._client.iterate(_LIST_REQUESTS[entity_type]())
+            ]
+        elif entity_type == "pricetype":
+            objects = await self._client(pricetypes_api.GetPriceTypesRequest())
+        else:
+            objects = []
+            for states in await asyncio.gather(
+                *(
+                    self._client(states_api.GetStatesRequest(x))
+                    for x in self._state_entity_types
+                )
+            ):
+                objects.extend(states)
+        self._entries[entity_type].clear()
+        for obj in objects:
+            self.put(entity_type, obj)
+        self._loaded_until[entity_type] = time.monotonic() + self._ttls[entity_type]
+
+    async def warm_up(
+        self,
+        entity_types: typing.Optional[
+            typing.Iterable[typing.Union[str, typing.Type[types.MoySkladBaseClass]]]
+        ] = None,
+    ) -> None:
+        """
+        Loads all (or the given) types concurrently.
+        (Загружает все (или указанные) типы параллельно.)
+        """
+        if entity_types is None:
+            entity_types = REFERENCE_TYPES
+        await asyncio.gather(*(self.refresh(x) for x in entity_types))
+
+    def invalidate(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        id_: typing.Optional[str] = None,
+    ) -> None:
+        """
+        Removes one object, or the whole type if id_ is None. Types that are not cached are ignored.
+        Types that can only be loaded as a whole (pricetype, state) are reloaded on the next get.
+        (Удаляет один объект, или весь тип, если id_ равен None. Некэшируемые типы игнорируются.
+        Типы, которые загружаются только целиком (pricetype, state), перезагружаются при следующем get.)
+        """
+        entity_type = helpers.get_entity_type(entity)
+        if entity_type not in self._entries:
+            return
+        if id_ is None:
+            self._entries[entity_type].clear()
+            self._loaded_until.pop(entity_type, None)
+        else:
+            self._entries[entity_type].pop(id_, None)
+            if entity_type not in _LIST_REQUESTS:
+                # the object can not be loaded by id (объект нельзя загрузить по id)
+                self._loaded_until.pop(entity_type, None)
+
+    def invalidate_webhook(self, payload: dict) -> None:
+        """
+        Invalidation hook for webhook handlers: removes the objects of UPDATE and DELETE events.
+        Accepts the whole webhook request body ({"events": [...]}) or one event.
+        (Хук инвалидации для обработчиков вебхуков: удаляет объекты событий UPDATE и DELETE.
+        Принимает все тело запроса вебхука ({"events": [...]}) или одно событие.)
+        """
+        events = payload["events"] if "events" in payload else [payload]
+        for event in events:
+            if event.get("action") not in ("UPDATE", "DELETE"):
+                continue
+            meta = event.get("meta") or {}
+            if meta.get("type") in self._entries and meta.get("href"):
+                self.invalidate(meta["type"], _split_href(meta["href"])[1])
@@ -0,0 +1,117 @@
+import asyncio
+import random
+import typing
+
+import aiohttp.client_exceptions
+
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRY_EXCEPTIONS = (
+    aiohttp.client_exceptions.ClientConnectorError,
+    # a pooled keep-alive connection may be closed by the server between requests
+    # (соединение из пула может быть закрыто сервером между запросами)
+    aiohttp.client_exceptions.ServerDisconnectedError,
+    asyncio.TimeoutError,
+)
+# 1049 - Превышено ограничение на количество запросов
+# 1073 - Превышено ограничение на количество параллельных запросов
+DEFAULT_RETRY_ERROR_CODES = frozenset({1049, 1073})
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to wait before the next attempt.
+    Delays grow exponentially (base_delay * 2 ** (attempt - 1), capped by max_delay),
+    with full jitter - a random delay between 0 and that value, so that workers that failed together
+    do not retry together.
+    (Определяет, какие неудачные запросы повторять и сколько ждать перед следующей попыткой.
+    Задержка растет экспоненциально (base_delay * 2 ** (attempt - 1), не больше max_delay),
+    с полным джиттером - случайная задержка от 0 до этого значения, чтобы одновременно упавшие
+    запросы не повторялись одновременно.)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_elapsed: typing.Optional[float] = 120.0,
+        jitter: bool = True,
+        retry_statuses: typing.Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: typing.Tuple[
+            typing.Type[BaseException], ...
+        ] = DEFAULT_RETRY_EXCEPTIONS,
+        retry_error_codes: typing.Iterable[int] = DEFAULT_RETRY_ERROR_CODES,
+    ):
+        """
+
+        :param max_attempts: Total number of attempts, including the first one (Общее количество попыток, включая первую)
+        :param base_delay: Delay before the second attempt, seconds (Задержка перед второй попыткой, секунды)
+        :param max_delay: Maximum delay between attempts, seconds (Максимальная задержка между попытками, секунды)
+        :param max_elapsed: Do not retry if the total time would exceed this, seconds. None - no limit
+         (Не повторять, если общее время превысит это значение, секунды. None - без ограничений)
+        :param jitter: Use full jitter (Использовать полный джиттер)
+        :param retry_statuses: HTTP statuses to retry (HTTP статусы, при которых запрос повторяется)
+        :param retry_exceptions: Exception types to retry (Типы исключений, при которых запрос повторяется)
+        :param retry_error_codes: MoySklad error codes to retry, regardless of the status (Коды ошибок MoySklad, при которых запрос повторяется)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("delays must be >= 0")
+        if max_elapsed is not None and max_elapsed < 0:
+            raise ValueError("max_elapsed must be >= 0 or None")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.retry_error_codes = frozenset(retry_error_codes)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            + ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+            + ")"
+        )
+
+    def should_retry_status(
+        self, status: int, error_code: typing.Optional[int] = None
+    ) -> bool:
+        return status in self.retry_statuses or error_code in self.retry_error_codes
+
+    def should_retry_exception(self, exception: BaseException) -> bool:
+        return isinstance(exception, self.retry_exceptions)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay after the given (1-based) failed attempt.
+        (Задержка после указанной (нумерация с 1) неудачной попытки.)
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        elapsed: float,
+        retry_after: typing.Optional[float] = None,
+    ) -> typing.Optional[float]:
+        """
+        Returns the delay before the next attempt, or None if the request should not be retried.
+        (Возвращает задержку перед следующей попыткой, или None, если запрос не нужно повторять.)
+
+        :param attempt: Number of the failed attempt, 1-based (Номер неудачной попытки, с 1)
+        :param elapsed: Seconds since the first attempt (Секунд с первой попытки)
+        :param retry_after: Delay requested by the server, used instead of backoff (Задержка, указанная сервером, используется вместо backoff)
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = retry_after if retry_after is not None else self.backoff(attempt)
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+        return delay
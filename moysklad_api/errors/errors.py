@@ -6,6 +6,7 @@ class MoySkladError(Exception):
         self,
         json_error: dict,
         requested_json: typing.Optional[str] = None,
+        items: typing.Optional[list] = None,
     ):
         self.error = json_error.get("error", "Unknown error")
         self.code = json_error.get("code", "Unknown code")
@@ -13,6 +14,9 @@ class MoySkladError(Exception):
         self.line = json_error.get("line")
         self.column = json_error.get("column")
         self.requested_json = requested_json
+        # response array of a failed array request, one element per object, with "errors" for the failed ones
+        # (массив ответа неудачного запроса с массивом, по элементу на объект, с "errors" у несохраненных)
+        self.items = items
         self.message = (
             f"Error: {self.error} (Code {self.code})\n" f"More info: {self.more_info}\n"
         )
@@ -1,17 +1,27 @@
 from .helpers import (
     get_meta,
+    get_expanded,
     parse_date,
     date_to_str,
     BASE_URL,
+    MAX_PAGE_SIZE,
+    MAX_BULK_SIZE,
+    MAX_AUDIT_PAGE_SIZE,
     guess_constructor_by_href,
     construct_or_meta,
+    get_entity_type,
 )
 
 __all__ = [
     "parse_date",
     "get_meta",
+    "get_expanded",
     "date_to_str",
     "BASE_URL",
+    "MAX_PAGE_SIZE",
+    "MAX_BULK_SIZE",
+    "MAX_AUDIT_PAGE_SIZE",
     "guess_constructor_by_href",
     "construct_or_meta",
+    "get_entity_type",
 ]
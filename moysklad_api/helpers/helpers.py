@@ -1,4 +1,5 @@
 import datetime
+import functools
 import re
 import typing
 
@@ -18,38 +19,86 @@ def date_to_str(date: datetime.datetime) -> typing.Optional[str]:
 def get_meta(
     meta_data: typing.Optional[dict], must=False
 ) -> typing.Optional[types.Meta]:
+    """
+    Returns the meta of a reference. If the reference was expanded (see ApiRequest.set_expand),
+    returns its model instead, see construct_or_meta.
+    (Возвращает meta ссылки. Если ссылка раскрыта (см. ApiRequest.set_expand),
+    возвращает ее модель, см. construct_or_meta.)
+    """
+    if (
+        meta_data
+        and len(meta_data) > 1
+        and "meta" in meta_data
+        and types.build_expanded.get()
+    ):
+        return construct_or_meta(meta_data)
     if must:
         return meta_data["meta"]
     return meta_data.get("meta") if meta_data else None
 
 
+def get_expanded(data: typing.Any) -> typing.Any:
+    """
+    Returns data as is, or models if the field was expanded (see ApiRequest.set_expand), for example positions.
+    (Возвращает data как есть, или модели, если поле раскрыто (см. ApiRequest.set_expand), например позиции.)
+    """
+    if (
+        isinstance(data, dict)
+        and len(data) > 1
+        and "meta" in data
+        and types.build_expanded.get()
+    ):
+        return construct_or_meta(data)
+    return data
+
+
+# https://api.moysklad.ru/api/remap/1.2/<entity|report|...>/<name>[/<uuid>][/<subname>]
+_HREF_RE = re.compile(
+    r"https://api\.moysklad\.ru/api/remap/\d+\.\d+/\w+/(\w+)/?"
+    r"(?:[a-z0-9-]{8}-[a-z0-9-]{4}-[a-z0-9-]{4}-[a-z0-9-]{4}-[a-z0-9-]{12})?"
+    r"/?(\w+)?"
+)
+
+
+_ID_RE = re.compile(
+    r"/[a-z0-9-]{8}-[a-z0-9-]{4}-[a-z0-9-]{4}-[a-z0-9-]{4}-[a-z0-9-]{12}(?=/|$)"
+)
+
+
+def _ms_name_by_href(href: str) -> typing.Tuple[str, ...]:
+    # ids and the query are removed, so the cache has one entry per type path (/entity/supply/positions)
+    # (id и параметры удаляются, поэтому в кэше одна запись на путь типа (/entity/supply/positions))
+    return _ms_name_by_path(_ID_RE.sub("", href.split("?", 1)[0]))
+
+
+@functools.lru_cache(maxsize=1024)
+def _ms_name_by_path(path: str) -> typing.Tuple[str, ...]:
+    found = _HREF_RE.search(path)
+    if not found:
+        return ()
+    return tuple(elem for elem in found.groups() if elem)
+
+
 def guess_constructor_by_href(
     href: str,
 ) -> typing.Optional[typing.Type[types.MoySkladBaseClass]]:
-    uuid_group = (
-        r"(?:[a-z0-9-]{8}-[a-z0-9-]{4}-[a-z0-9-]{4}-[a-z0-9-]{4}-[a-z0-9-]{12})?"
-    )
-    found = re.findall(
-        r"https://api\.moysklad\.ru/api/remap/\d+\.\d+/\w+/(\w+)/?"
-        + uuid_group
-        + "/?(\w+)?",
-        href,
-    )
-    if not found:
-        return None
-    what_to_find = tuple()
-    for elem in found[0]:
-        if elem:
-            what_to_find += (elem,)
-    if not what_to_find:
+    ms_name = _ms_name_by_href(href)
+    if not ms_name:
         return None
-    for subclass in types.MoySkladBaseClass.__subclasses__():
-        if subclass.ms_name() == what_to_find:
-            return subclass
-    return None
+    return types.get_model_class(ms_name)
 
 
 def construct_or_meta(data: dict):
+    """
+    Converts an expanded reference to the model of its type, found by meta.href,
+    and an expanded list ({"meta": ..., "rows": [...]}) to a list of models.
+    Returns the meta if the type is unknown or the reference is not expanded.
+    (Преобразует раскрытую ссылку в модель ее типа, найденного по meta.href,
+    а раскрытый список ({"meta": ..., "rows": [...]}) - в список моделей.
+    Возвращает meta, если тип неизвестен или ссылка не раскрыта.)
+    """
+    if "rows" in data:
+        return [construct_or_meta(x) for x in data["rows"]]
     if len(data) == 1 and "meta" in data:
         return types.Meta(**data["meta"])
     constructor = guess_constructor_by_href(data["meta"]["href"])
@@ -58,7 +107,31 @@ def construct_or_meta(data: dict):
     return constructor.from_json(data)
 
 
+def get_entity_type(
+    entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]]
+) -> str:
+    """
+    Returns the entity type name for a name ("product") or a top-level model class (Product).
+    (Возвращает имя типа сущности по имени ("product") или классу модели верхнего уровня (Product).)
+    """
+    if isinstance(entity, str):
+        return entity
+    name = entity.ms_name()
+    if not name or len(name) != 1:
+        raise ValueError(f"{entity.__name__} is not a top-level entity")
+    return name[0]
+
+
 BASE_URL = "https://api.moysklad.ru/api/remap/1.2"
+# maximum value of the limit parameter for list requests
+# (максимальное значение параметра limit для списков)
+MAX_PAGE_SIZE = 1000
+# maximum number of objects in one mass create/update/delete request
+# (максимальное количество объектов в одном массовом запросе)
+MAX_BULK_SIZE = 1000
+# maximum value of the limit parameter for audit requests
+# (максимальное значение параметра limit для запросов аудита)
+MAX_AUDIT_PAGE_SIZE = 100
 
 
 if __name__ == "__main__":
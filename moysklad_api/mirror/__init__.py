@@ -0,0 +1,13 @@
+from .mirror import SqliteMirror
+from .lookup import AssortmentIndex, ASSORTMENT_TYPES, LOOKUP_FIELDS
+from .stock import StockTable, StockTracker, StockChange
+
+__all__ = [
+    "SqliteMirror",
+    "AssortmentIndex",
+    "ASSORTMENT_TYPES",
+    "LOOKUP_FIELDS",
+    "StockTable",
+    "StockTracker",
+    "StockChange",
+]
@@ -0,0 +1,372 @@
+import array
+import bisect
+import heapq
+import typing
+
+from .. import helpers
+from ..api import bulk as bulk_api
+from ..sync import SyncEvent, UPSERT, DELETE
+from .mirror import _barcodes
+
+if typing.TYPE_CHECKING:
+    from ..client import MoySkladClient
+
+LookupField = typing.Literal["barcode", "code", "article", "external_code"]
+LOOKUP_FIELDS: typing.Tuple[str, ...] = typing.get_args(LookupField)
+ASSORTMENT_TYPES = ("product", "variant", "bundle", "service")
+# (entity type, id) of an indexed object ((тип сущности, id) проиндексированного объекта)
+IndexHit = typing.Tuple[str, str]
+
+
+def _get(obj: typing.Any, api_name: str, attr_name: str) -> typing.Any:
+    if isinstance(obj, dict):
+        return obj.get(api_name)
+    return getattr(obj, attr_name, None)
+
+
+def _object_keys(obj: typing.Any) -> typing.Dict[str, typing.Set[str]]:
+    """
+    Keys of a raw object or a model, per lookup field.
+    (Ключи словаря или модели, по полям поиска.)
+    """
+    keys = {
+        "barcode": _barcodes(
+            {
+                "barcodes": _get(obj, "barcodes", "barcodes"),
+                "packs": _get(obj, "packs", "packs"),
+            }
+        )
+    }
+    for field, api_name in (
+        ("code", "code"),
+        ("article", "article"),
+        ("external_code", "externalCode"),
+    ):
+        value = _get(obj, api_name, field)
+        keys[field] = {value} if value else set()
+    return keys
+
+
+class _FieldIndex:
+    """
+    Keys of one field: a sorted list of keys with a parallel array of slots, plus a small dict of recent
+    additions that is merged into the sorted part when it grows. Entries of removed objects stay until
+    the merge and are skipped by the lookups.
+    (Ключи одного поля: отсортированный список ключей с параллельным массивом слотов, плюс небольшой словарь
+    последних добавлений, который сливается с отсортированной частью, когда разрастается. Записи удаленных объектов
+    остаются до слияния и пропускаются при поиске.)
+    """
+
+    __slots__ = ("keys", "slots", "recent", "recent_count")
+
+    def __init__(self):
+        self.keys: typing.List[str] = []
+        self.slots = array.array("i")
+        self.recent: typing.Dict[str, typing.List[int]] = {}
+        self.recent_count = 0
+
+    def add(self, key: str, slot: int) -> None:
+        self.recent.setdefault(key, []).append(slot)
+        self.recent_count += 1
+
+    def build(self, entries: typing.List[typing.Tuple[str, int]]) -> None:
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.slots = array.array("i", (slot for _, slot in entries))
+        self.recent = {}
+        self.recent_count = 0
+
+    def merge(self, alive: typing.Callable[[int], bool]) -> None:
+        recent = sorted(
+            (key, slot) for key, slots in self.recent.items() for slot in slots
+        )
+        self.build(
+            [
+                entry
+                for entry in heapq.merge(zip(self.keys, self.slots), recent)
+                if alive(entry[1])
+            ]
+        )
+
+    def exact(self, key: str) -> typing.List[int]:
+        start = bisect.bisect_left(self.keys, key)
+        end = bisect.bisect_right(self.keys, key, start)
+        return list(self.slots[start:end]) + self.recent.get(key, [])
+
+    def prefix(self, prefix: str) -> typing.Iterator[typing.Tuple[str, int]]:
+        start = bisect.bisect_left(self.keys, prefix)
+        for i in range(start, len(self.keys)):
+            if not self.keys[i].startswith(prefix):
+                break
+            yield self.keys[i], self.slots[i]
+        for key, slots in self.recent.items():
+            if key.startswith(prefix):
+                for slot in slots:
+                    yield key, slot
+
+    def items(self) -> typing.Iterator[typing.Tuple[str, int]]:
+        yield from zip(self.keys, self.slots)
+        for key, slots in self.recent.items():
+            for slot in slots:
+                yield key, slot
+
+
+class AssortmentIndex:
+    """
+    In-memory index of barcodes (including pack barcodes), codes, articles and external codes of products,
+    variants, bundles and services. Exact lookups are a binary search over a sorted list of keys
+    (plus a dict of recent changes), prefix lookups scan a range of it.
+    Keys are kept in a plain sorted list and objects are referenced by 4-byte slots in arrays, without a dict
+    entry per key, so a 13-digit barcode takes about 80 bytes (plus the id of every object). Loaded with load() and kept up to date with apply_event().
+    (Индекс в памяти по штрихкодам (включая штрихкоды упаковок), кодам, артикулам и внешним кодам товаров,
+    модификаций, комплектов и услуг. Точный поиск - двоичный поиск по отсортированному списку ключей
+    (плюс словарь последних изменений), поиск по префиксу просматривает его диапазон.
+    Ключи хранятся в обычном отсортированном списке, объекты указываются 4-байтовыми слотами в массивах, без записи
+    словаря на каждый ключ, поэтому 13-значный штрихкод занимает около 80 байт (плюс id каждого объекта). Загружается load() и обновляется apply_event().)
+
+    Example:
+    index = AssortmentIndex()
+    await index.load(client)
+    hits = index.lookup("4600000000001")  # [("product", "<id>")]
+    """
+
+    def __init__(
+        self,
+        entity_types: typing.Iterable[str] = ASSORTMENT_TYPES,
+        merge_threshold: int = 4096,
+    ):
+        """
+
+        :param entity_types: Indexed types (Индексируемые типы)
+        :param merge_threshold: Recent changes of a field merged into its sorted keys after at least this many,
+         or after 1/8 of its size (Последние изменения поля сливаются с его отсортированными ключами после стольких
+         изменений, или после 1/8 его размера)
+        """
+        self.entity_types = tuple(entity_types)
+        self._merge_threshold = merge_threshold
+        self._fields = {field: _FieldIndex() for field in LOOKUP_FIELDS}
+        # slot -> id (None - free), type code (слот -> id (None - свободен), код типа)
+        self._ids: typing.List[typing.Optional[str]] = []
+        self._type_codes = bytearray()
+        self._types: typing.List[str] = []
+        self._slot_by_id: typing.Dict[str, int] = {}
+        self._free: typing.List[int] = []
+        # slots removed since the last merge, still referenced by keys (слоты, удаленные после последнего слияния)
+        self._dead: typing.List[int] = []
+        # changes made while load() runs, (entity type, object) or (None, id) of a removal
+        # (изменения, сделанные во время load(), (тип сущности, объект) или (None, id) удаления)
+        self._changes_during_load: typing.Optional[
+            typing.List[typing.Tuple[typing.Optional[str], typing.Any]]
+        ] = None
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    def _type_code(self, entity_type: str) -> int:
+        try:
+            return self._types.index(entity_type)
+        except ValueError:
+            self._types.append(entity_type)
+            return len(self._types) - 1
+
+    def _alive(self, slot: int) -> bool:
+        return self._ids[slot] is not None
+
+    def _hit(self, slot: int) -> IndexHit:
+        return self._types[self._type_codes[slot]], self._ids[slot]
+
+    def _new_slot(self, entity_type: str, id_: str) -> int:
+        code = self._type_code(entity_type)
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot] = id_
+            self._type_codes[slot] = code
+        else:
+            slot = len(self._ids)
+            self._ids.append(id_)
+            self._type_codes.append(code)
+        self._slot_by_id[id_] = slot
+        return slot
+
+    def _remove_slot(self, id_: str) -> None:
+        slot = self._slot_by_id.pop(id_, None)
+        if slot is not None:
+            self._ids[slot] = None
+            self._dead.append(slot)
+
+    def clear(self) -> None:
+        self.__init__(self.entity_types, self._merge_threshold)
+
+    def _feed(
+        self,
+        entries: typing.Dict[str, typing.List[typing.Tuple[str, int]]],
+        entity_type: str,
+        obj: typing.Any,
+    ) -> None:
+        id_ = _get(obj, "id", "id")
+        if id_ in self._slot_by_id:
+            # repeated by an overlapping page, the newest wins (повтор из-за перекрытия страниц, побеждает новый)
+            self._remove_slot(id_)
+        slot = self._new_slot(entity_type, id_)
+        for field, keys in _object_keys(obj).items():
+            entries[field].extend((key, slot) for key in keys)
+
+    def _finish_build(
+        self, entries: typing.Dict[str, typing.List[typing.Tuple[str, int]]]
+    ) -> None:
+        for field, field_entries in entries.items():
+            self._fields[field].build(
+                [entry for entry in field_entries if self._alive(entry[1])]
+            )
+        self._free.extend(self._dead)
+        self._dead = []
+
+    def build(self, objects: typing.Iterable[typing.Tuple[str, typing.Any]]) -> None:
+        """
+        Replaces the index with the given (entity type, raw object or model) pairs, sorting every field once.
+        Only the keys are kept, so objects can be a generator.
+        (Заменяет индекс указанными парами (тип сущности, словарь или модель), сортируя каждое поле один раз.
+        Сохраняются только ключи, поэтому objects может быть генератором.)
+        """
+        self.clear()
+        entries = {field: [] for field in LOOKUP_FIELDS}
+        for entity_type, obj in objects:
+            self._feed(entries, entity_type, obj)
+        self._finish_build(entries)
+
+    async def load(
+        self,
+        client: "MoySkladClient",
+        page_size: int = helpers.MAX_PAGE_SIZE,
+    ) -> None:
+        """
+        Full load of the indexed types, page by page. Only the keys of each page are kept,
+        the current index answers lookups until the load is finished. Changes applied while loading
+        (apply_event, upsert, remove) are applied again to the loaded index before it replaces the current one.
+        (Полная загрузка индексируемых типов по страницам. Сохраняются только ключи каждой страницы,
+        текущий индекс отвечает на запросы, пока загрузка не закончится. Изменения, примененные во время загрузки
+        (apply_event, upsert, remove), повторно применяются к загруженному индексу, прежде чем он заменит текущий.)
+        """
+        loaded = AssortmentIndex(self.entity_types, self._merge_threshold)
+        entries = {field: [] for field in LOOKUP_FIELDS}
+        self._changes_during_load = changes = []
+        try:
+            for entity_type in self.entity_types:
+                request = bulk_api.GetEntityListRequest(entity_type).set_output("raw")
+                async for obj in client.iterate(request, page_size):
+                    loaded._feed(entries, entity_type, obj)
+        finally:
+            self._changes_during_load = None
+        loaded._finish_build(entries)
+        for entity_type, obj in changes:
+            if entity_type is None:
+                loaded.remove(obj)
+            else:
+                loaded.upsert(entity_type, obj)
+        vars(self).update(vars(loaded))
+
+    def upsert(self, entity_type: str, obj: typing.Any) -> None:
+        """
+        Adds or replaces an object (raw dict or model).
+        (Добавляет или заменяет объект (словарь или модель).)
+        """
+        if self._changes_during_load is not None:
+            self._changes_during_load.append((entity_type, obj))
+        id_ = _get(obj, "id", "id")
+        self._remove_slot(id_)
+        slot = self._new_slot(entity_type, id_)
+        for field, keys in _object_keys(obj).items():
+            for key in keys:
+                self._fields[field].add(key, slot)
+        self._maybe_merge()
+
+    def remove(self, id_: str) -> None:
+        if self._changes_during_load is not None:
+            self._changes_during_load.append((None, id_))
+        self._remove_slot(id_)
+        self._maybe_merge()
+
+    def apply_event(self, event: SyncEvent) -> None:
+        """
+        Sink for SyncEngine (or a callback of it): upserts and deletes of the indexed types are applied.
+        (Получатель событий SyncEngine: применяются изменения и удаления индексируемых типов.)
+        """
+        if event.action == UPSERT and event.entity_type in self.entity_types:
+            self.upsert(event.entity_type, event.obj)
+        elif event.action == DELETE:
+            self.remove(event.id)
+
+    def _maybe_merge(self) -> None:
+        pending = max(x.recent_count for x in self._fields.values())
+        pending = max(pending, len(self._dead))
+        if pending >= max(self._merge_threshold, len(self._slot_by_id) // 8):
+            self.merge()
+
+    def merge(self) -> None:
+        """
+        Merges recent changes into the sorted keys and frees the slots of removed objects.
+        (Сливает последние изменения с отсортированными ключами и освобождает слоты удаленных объектов.)
+        """
+        for field_index in self._fields.values():
+            field_index.merge(self._alive)
+        self._free.extend(self._dead)
+        self._dead = []
+
+    def lookup(self, key: str, field: LookupField = "barcode") -> typing.List[IndexHit]:
+        """
+        Objects with exactly this key.
+        (Объекты с точно таким ключом.)
+
+        :param key: Barcode, code, article or external code (Штрихкод, код, артикул или внешний код)
+        :param field: "barcode", "code", "article" or "external_code"
+        """
+        seen = set()
+        result = []
+        for slot in self._fields[field].exact(key):
+            if self._alive(slot) and slot not in seen:
+                seen.add(slot)
+                result.append(self._hit(slot))
+        return result
+
+    def lookup_prefix(
+        self, prefix: str, field: LookupField = "barcode", limit: int = 100
+    ) -> typing.List[typing.Tuple[str, IndexHit]]:
+        """
+        Up to limit (key, object) pairs whose key starts with prefix.
+        (До limit пар (ключ, объект), ключ которых начинается с prefix.)
+        """
+        result = []
+        seen = set()
+        for key, slot in self._fields[field].prefix(prefix):
+            if not self._alive(slot) or (key, slot) in seen:
+                continue
+            seen.add((key, slot))
+            result.append((key, self._hit(slot)))
+            if len(result) >= limit:
+                break
+        return result
+
+    def collisions(
+        self, field: LookupField = "barcode"
+    ) -> typing.Dict[str, typing.List[IndexHit]]:
+        """
+        Keys shared by several objects, for example one barcode on two products.
+        (Ключи, общие для нескольких объектов, например один штрихкод у двух товаров.)
+        """
+        by_key: typing.Dict[str, typing.Set[int]] = {}
+        previous_key = None
+        for key, slot in sorted(self._fields[field].items()):
+            if not self._alive(slot):
+                continue
+            if key == previous_key:
+                by_key.setdefault(key, set()).add(slot)
+            else:
+                previous_key = key
+                first_slot = slot
+                continue
+            by_key[key].add(first_slot)
+        return {
+            key: [self._hit(slot) for slot in sorted(slots)]
+            for key, slots in by_key.items()
+            if len(slots) > 1
+        }
@@ -0,0 +1,400 @@
+import datetime
+import os
+import sqlite3
+import typing
+
+from .. import types, helpers
+from ..api import bulk as bulk_api
+from ..client.codec import JsonCodec, default_codec
+from ..sync import SyncEngine, SyncEvent, SqliteCheckpointStore, UPSERT, DELETE
+
+if typing.TYPE_CHECKING:
+    from ..client import MoySkladClient
+
+MirrorOutput = typing.Literal["model", "lazy", "raw"]
+# ids per request when a webhook is applied (id на один запрос при применении вебхука)
+_WEBHOOK_CHUNK_SIZE = 100
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS objects ("
+    "entity_type TEXT NOT NULL, id TEXT NOT NULL, updated TEXT, name TEXT, code TEXT, article TEXT, "
+    "external_code TEXT, folder_id TEXT, data BLOB NOT NULL, PRIMARY KEY (entity_type, id)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS barcodes ("
+    "barcode TEXT NOT NULL, entity_type TEXT NOT NULL, id TEXT NOT NULL, "
+    "PRIMARY KEY (barcode, entity_type, id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS barcodes_object ON barcodes (entity_type, id)",
+    "CREATE INDEX IF NOT EXISTS objects_code ON objects (entity_type, code)",
+    "CREATE INDEX IF NOT EXISTS objects_article ON objects (entity_type, article)",
+    "CREATE INDEX IF NOT EXISTS objects_external_code ON objects (entity_type, external_code)",
+    "CREATE INDEX IF NOT EXISTS objects_updated ON objects (entity_type, updated)",
+    "CREATE INDEX IF NOT EXISTS objects_folder ON objects (entity_type, folder_id)",
+)
+_ORDER_COLUMNS = {
+    "updated": "updated",
+    "name": "name",
+    "code": "code",
+    "article": "article",
+    "external_code": "external_code",
+    "externalCode": "external_code",
+    "id": "id",
+}
+
+
+def _href_id(href: str) -> str:
+    return href.split("?", 1)[0].rstrip("/").rsplit("/", 1)[1]
+
+
+def _reference_id(value: typing.Any) -> typing.Optional[str]:
+    """
+    id of an id string, a model, a meta or a {"meta": ...} reference.
+    (id из строки id, модели, meta или ссылки {"meta": ...}.)
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, types.MoySkladBaseClass):
+        return value.id
+    if "meta" in value:
+        value = value["meta"]
+    return _href_id(value["href"])
+
+
+def _barcodes(data: dict) -> typing.Set[str]:
+    """
+    Barcodes of an object and of its packs: [{"ean13": "..."}, ...] lists.
+    (Штрихкоды объекта и его упаковок: списки [{"ean13": "..."}, ...].)
+    """
+    lists = [data.get("barcodes") or []]
+    for pack in data.get("packs") or []:
+        lists.append(pack.get("barcodes") or [])
+    result = set()
+    for barcodes in lists:
+        for barcode in barcodes:
+            result.update(x for x in barcode.values() if isinstance(x, str))
+    return result
+
+
+class SqliteMirror:
+    """
+    Local copy of objects of any /entity/<type> (products, variants, bundles, counterparties, stores, documents, ...)
+    in an SQLite database in WAL mode, so other processes can read it while it is updated.
+    Objects are stored as the API JSON, code, article, externalCode, barcodes (with pack barcodes), updated
+    and the product folder are indexed. Kept fresh by sync_engine() and apply_webhook().
+    (Локальная копия объектов любых /entity/<type> (товары, модификации, комплекты, контрагенты, склады, документы, ...)
+    в базе SQLite в режиме WAL, поэтому другие процессы могут читать ее во время обновления.
+    Объекты хранятся как JSON API, индексируются code, article, externalCode, штрихкоды (со штрихкодами упаковок),
+    updated и группа товаров. Поддерживается актуальной через sync_engine() и apply_webhook().)
+
+    Example:
+    mirror = SqliteMirror("mirror.db")
+    await mirror.sync_engine(client, ["product", "variant", "counterparty"]).sync()
+    product = mirror.find_one(product_api.Product, code="00042")
+    items = mirror.find_by_barcode("4600000000001")
+    """
+
+    def __init__(
+        self,
+        database: typing.Union[str, os.PathLike],
+        codec: typing.Optional[JsonCodec] = None,
+    ):
+        """
+
+        :param database: Path of the database file (Путь к файлу базы)
+        :param codec: JSON codec of the stored objects, by default the fastest installed
+         (JSON кодек хранимых объектов, по умолчанию самый быстрый из установленных)
+        """
+        self.connection = sqlite3.connect(os.fspath(database))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # in WAL mode a crash can not corrupt the database with NORMAL, only lose the last commits
+        # (в режиме WAL сбой не может повредить базу при NORMAL, только потерять последние коммиты)
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            for statement in _SCHEMA:
+                self.connection.execute(statement)
+        self.codec = codec if codec is not None else default_codec()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _put(self, entity_type: str, data: dict) -> None:
+        id_ = data["id"]
+        folder = data.get("productFolder")
+        self.connection.execute(
+            "INSERT OR REPLACE INTO objects "
+            "(entity_type, id, updated, name, code, article, external_code, folder_id, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entity_type,
+                id_,
+                data.get("updated"),
+                data.get("name"),
+                data.get("code"),
+                data.get("article"),
+                data.get("externalCode"),
+                _reference_id(folder) if folder else None,
+                self.codec.dumps(data),
+            ),
+        )
+        self.connection.execute(
+            "DELETE FROM barcodes WHERE entity_type = ? AND id = ?", (entity_type, id_)
+        )
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO barcodes (barcode, entity_type, id) VALUES (?, ?, ?)",
+            [(barcode, entity_type, id_) for barcode in _barcodes(data)],
+        )
+
+    def _remove(self, entity_type: str, ids: typing.Iterable[str]) -> None:
+        rows = [(entity_type, id_) for id_ in ids]
+        self.connection.executemany(
+            "DELETE FROM objects WHERE entity_type = ? AND id = ?", rows
+        )
+        self.connection.executemany(
+            "DELETE FROM barcodes WHERE entity_type = ? AND id = ?", rows
+        )
+
+    def upsert(self, objects: typing.Iterable[dict]) -> int:
+        """
+        Stores objects as returned by the API (raw dicts, see ApiRequest.set_output), in one transaction.
+        The type is taken from meta.type.
+        (Сохраняет объекты в виде, возвращаемом API (словари, см. ApiRequest.set_output), в одной транзакции.
+        Тип берется из meta.type.)
+
+        :return: Number of stored objects (Количество сохраненных объектов)
+        """
+        count = 0
+        with self.connection:
+            for data in objects:
+                self._put(data["meta"]["type"], data)
+                count += 1
+        return count
+
+    def delete(
+        self,
+        entity: typing.Union[str, typing.Type[types.MoySkladBaseClass]],
+        ids: typing.Iterable[str],
+    ) -> None:
+        with self.connection:
+            self._remove(helpers.get_entity_type(entity), ids)
+
+    def apply_event(self, event: SyncEvent) -> None:
+        """
+        Sink for SyncEngine. Changes are committed together with the checkpoint of the engine created
+        by sync_engine(), so after a crash the mirror and the checkpoint match.
+        (Получатель событий SyncEngine. Изменения фиксируются вместе с контрольной точкой движка,
+        созданного sync_engine(), поэтому после сбоя зеркало и контрольная точка соответствуют друг другу.)
+        """
+        if event.action == UPSERT:
+            if not isinstance(event.obj, dict):
+                raise TypeError(
+                    "The mirror stores raw objects, use requests with set_output('raw') "
+                    "(Зеркало хранит объекты в виде словарей, используйте запросы с set_output('raw'))"
+                )
+            self._put(event.entity_type, event.obj)
+        elif event.action == DELETE:
+            self._remove(event.entity_type, [event.id])
+
+    def sync_engine(
+        self,
+        client: "MoySkladClient",
+        entity_types: typing.Iterable[
+            typing.Union[str, typing.Type[types.MoySkladBaseClass], types.ApiRequest]
+        ],
+        **kwargs,
+    ) -> SyncEngine:
+        """
+        SyncEngine that keeps the mirror up to date, with checkpoints in the same database.
+        Given list requests are switched to the raw output.
+        (SyncEngine, поддерживающий зеркало в актуальном состоянии, с контрольными точками в той же базе.
+        Переданные запросы списков переключаются на вывод словарей.)
+
+        :param kwargs: Other SyncEngine parameters (Остальные параметры SyncEngine)
+        """
+        requests = [
+            (
+                entity
+                if isinstance(entity, types.ApiRequest)
+                else bulk_api.GetEntityListRequest(entity)
+            ).set_output("raw")
+            for entity in entity_types
+        ]
+        return SyncEngine(
+            client,
+            requests,
+            self.apply_event,
+            SqliteCheckpointStore(self.connection),
+            **kwargs,
+        )
+
+    async def apply_webhook(self, client: "MoySkladClient", payload: dict) -> None:
+        """
+        Applies a webhook request body ({"events": [...]}) or one event: deletes the objects of DELETE events
+        and loads the objects of CREATE and UPDATE events, a few list requests per type.
+        (Применяет тело запроса вебхука ({"events": [...]}) или одно событие: удаляет объекты событий DELETE
+        и загружает объекты событий CREATE и UPDATE, несколькими запросами списка на тип.)
+        """
+        events = payload["events"] if "events" in payload else [payload]
+        changed: typing.Dict[str, typing.Dict[str, None]] = {}
+        deleted: typing.Dict[str, typing.Dict[str, None]] = {}
+        for event in events:
+            meta = event.get("meta") or {}
+            if not meta.get("type") or not meta.get("href"):
+                continue
+            id_ = _href_id(meta["href"])
+            if event.get("action") == "DELETE":
+                changed.get(meta["type"], {}).pop(id_, None)
+                deleted.setdefault(meta["type"], {})[id_] = None
+            elif event.get("action") in ("CREATE", "UPDATE"):
+                changed.setdefault(meta["type"], {})[id_] = None
+        loaded = []
+        for entity_type, ids in changed.items():
+            if types.get_model_class((entity_type,)) is None:
+                continue
+            ids = list(ids)
+            for start in range(0, len(ids), _WEBHOOK_CHUNK_SIZE):
+                loaded.extend(
+                    await client(
+                        bulk_api.GetByIdsRequest(
+                            entity_type, ids[start : start + _WEBHOOK_CHUNK_SIZE]
+                        ).set_output("raw")
+                    )
+                )
+        with self.connection:
+            for entity_type, ids in deleted.items():
+                self._remove(entity_type, ids)
+            for data in loaded:
+                self._put(data["meta"]["type"], data)
+
+    def _convert(
+        self,
+        model: typing.Type[types.MoySkladBaseClass],
+        data: bytes,
+        output: MirrorOutput,
+    ) -> typing.Any:
+        data = self.codec.loads(data)
+        if output == "raw":
+            return data
+        if output == "lazy":
+            return model.lazy_from_json(data)
+        return model.from_json(data)
+
+    def get(
+        self,
+        model: typing.Type[types.MoySkladBaseClass],
+        id_: str,
+        output: MirrorOutput = "model",
+    ) -> typing.Optional[typing.Any]:
+        """
+        Returns the stored object, or None.
+        (Возвращает сохраненный объект, или None.)
+        """
+        row = self.connection.execute(
+            "SELECT data FROM objects WHERE entity_type = ? AND id = ?",
+            (helpers.get_entity_type(model), id_),
+        ).fetchone()
+        return self._convert(model, row[0], output) if row is not None else None
+
+    def find(
+        self,
+        model: typing.Type[types.MoySkladBaseClass],
+        code: typing.Optional[str] = None,
+        article: typing.Optional[str] = None,
+        external_code: typing.Optional[str] = None,
+        barcode: typing.Optional[str] = None,
+        folder: typing.Any = None,
+        name: typing.Optional[str] = None,
+        updated_since: typing.Optional[datetime.datetime] = None,
+        order_by: str = "updated",
+        limit: typing.Optional[int] = None,
+        offset: int = 0,
+        output: MirrorOutput = "model",
+    ) -> typing.List[typing.Any]:
+        """
+        Stored objects of the model matching all given conditions.
+        (Сохраненные объекты модели, соответствующие всем указанным условиям.)
+
+        :param model: Model class, for example Product (Класс модели, например Product)
+        :param code: Code (Код)
+        :param article: Article (Артикул)
+        :param external_code: External code (Внешний код)
+        :param barcode: Barcode of the object or of its pack (Штрихкод объекта или его упаковки)
+        :param folder: Product folder: id, model or meta (Группа товаров: id, модель или meta)
+        :param name: Exact name (Точное наименование)
+        :param updated_since: Objects updated at or after (Объекты, измененные не раньше)
+        :param order_by: updated, name, code, article, external_code or id, "-" for descending
+         (updated, name, code, article, external_code или id, "-" - по убыванию)
+        :param limit: Maximum number of objects (Максимальное количество объектов)
+        :param offset: Number of objects to skip (Сколько объектов пропустить)
+        :param output: "model", "lazy" or "raw" (dict) ("model", "lazy" или "raw" (словарь))
+        """
+        column = _ORDER_COLUMNS.get(order_by.lstrip("-"))
+        if column is None:
+            raise ValueError(
+                f"Can not order by {order_by}, possible: {', '.join(_ORDER_COLUMNS)}"
+            )
+        conditions = ["objects.entity_type = ?"]
+        params: typing.List[typing.Any] = [helpers.get_entity_type(model)]
+        for value, condition in (
+            (code, "code = ?"),
+            (article, "article = ?"),
+            (external_code, "external_code = ?"),
+            (name, "name = ?"),
+            (_reference_id(folder), "folder_id = ?"),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        if updated_since is not None:
+            conditions.append("updated >= ?")
+            params.append(updated_since.isoformat(sep=" ", timespec="milliseconds"))
+        if barcode is not None:
+            conditions.append(
+                "objects.id IN (SELECT id FROM barcodes "
+                "WHERE barcode = ? AND entity_type = objects.entity_type)"
+            )
+            params.append(barcode)
+        sql = (
+            f"SELECT data FROM objects WHERE {' AND '.join(conditions)} "
+            f"ORDER BY {column} {'DESC' if order_by.startswith('-') else 'ASC'}, id"
+        )
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend((-1 if limit is None else limit, offset))
+        return [
+            self._convert(model, row[0], output)
+            for row in self.connection.execute(sql, params)
+        ]
+
+    def find_one(
+        self, model: typing.Type[types.MoySkladBaseClass], **conditions
+    ) -> typing.Optional[typing.Any]:
+        """
+        First object of find(), or None.
+        (Первый объект find(), или None.)
+        """
+        found = self.find(model, limit=1, **conditions)
+        return found[0] if found else None
+
+    def find_by_barcode(
+        self, barcode: str, output: MirrorOutput = "model"
+    ) -> typing.List[typing.Any]:
+        """
+        Objects of any type with the barcode (on the object or its pack), for example a product and a variant.
+        (Объекты любого типа со штрихкодом (объекта или его упаковки), например товар и модификация.)
+        """
+        result = []
+        for entity_type, data in self.connection.execute(
+            "SELECT objects.entity_type, objects.data FROM barcodes "
+            "JOIN objects ON objects.entity_type = barcodes.entity_type AND objects.id = barcodes.id "
+            "WHERE barcodes.barcode = ?",
+            (barcode,),
+        ):
+            model = types.get_model_class((entity_type,))
+            if model is None:
+                continue
+            result.append(self._convert(model, data, output))
+        return result
+
+    def count(self, model: typing.Type[types.MoySkladBaseClass]) -> int:
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM objects WHERE entity_type = ?",
+            (helpers.get_entity_type(model),),
+        ).fetchone()[0]
@@ -0,0 +1,300 @@
+import asyncio
+import datetime
+import sys
+import typing
+
+from ..api.reports import stock as stock_api
+from ..sync import send_event
+
+if typing.TYPE_CHECKING:
+    from ..client import MoySkladClient
+
+StockType = typing.Literal["stock", "freeStock", "quantity"]
+# changedSince can not be more than 24 hours in the past (changedSince не может быть больше чем на 24 часа в прошлом)
+MAX_CHANGED_SINCE = datetime.timedelta(hours=24)
+DEFAULT_STOCK_OVERLAP = datetime.timedelta(minutes=5)
+DEFAULT_FULL_RESYNC_INTERVAL = datetime.timedelta(days=1)
+
+
+class StockChange:
+    """
+    Stock of an assortment item (on a store, or on all stores if store_id is None) changed from old to new.
+    (Остаток позиции (на складе, или на всех складах, если store_id равен None) изменился с old на new.)
+    """
+
+    __slots__ = ("assortment_id", "store_id", "old", "new")
+
+    def __init__(
+        self,
+        assortment_id: str,
+        store_id: typing.Optional[str],
+        old: float,
+        new: float,
+    ):
+        self.assortment_id = assortment_id
+        self.store_id = store_id
+        self.old = old
+        self.new = new
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(assortment_id={self.assortment_id!r}, "
+            f"store_id={self.store_id!r}, old={self.old!r}, new={self.new!r})"
+        )
+
+
+class StockTable:
+    """
+    (assortmentId, storeId) -> stock table. Only non-zero cells are kept, in one dict per store,
+    so the memory depends on the number of stocked cells, not on items x stores.
+    The store is None for the stock on all stores (/report/stock/all/current).
+    (Таблица (assortmentId, storeId) -> остаток. Хранятся только ненулевые ячейки, в одном словаре на склад,
+    поэтому память зависит от количества ячеек с остатком, а не от позиций x складов.
+    Склад равен None для остатка на всех складах (/report/stock/all/current).)
+    """
+
+    def __init__(self):
+        self._stores: typing.Dict[typing.Optional[str], typing.Dict[str, float]] = {}
+
+    def get(self, assortment_id: str, store_id: typing.Optional[str] = None) -> float:
+        column = self._stores.get(store_id)
+        if column is None:
+            return 0.0
+        return column.get(assortment_id, 0.0)
+
+    def set(
+        self, assortment_id: str, store_id: typing.Optional[str], stock: float
+    ) -> float:
+        """
+        Sets the stock, returns the previous value.
+        (Устанавливает остаток, возвращает предыдущее значение.)
+        """
+        column = self._stores.get(store_id)
+        if not stock:
+            if column is None:
+                return 0.0
+            old = column.pop(assortment_id, 0.0)
+            if not column:
+                del self._stores[store_id]
+            return old
+        if column is None:
+            column = self._stores[store_id] = {}
+        old = column.get(assortment_id, 0.0)
+        # the same id is kept once for all stores (один и тот же id хранится один раз для всех складов)
+        column[sys.intern(assortment_id)] = float(stock)
+        return old
+
+    def total(self, assortment_id: str) -> float:
+        """
+        Sum of the stock on all known stores.
+        (Сумма остатков на всех известных складах.)
+        """
+        return sum(
+            column.get(assortment_id, 0.0)
+            for store_id, column in self._stores.items()
+            if store_id is not None
+        )
+
+    def by_store(self, assortment_id: str) -> typing.Dict[str, float]:
+        """
+        Non-zero stock of the item per store.
+        (Ненулевые остатки позиции по складам.)
+        """
+        return {
+            store_id: column[assortment_id]
+            for store_id, column in self._stores.items()
+            if store_id is not None and assortment_id in column
+        }
+
+    def items(
+        self,
+    ) -> typing.Iterator[typing.Tuple[str, typing.Optional[str], float]]:
+        """
+        (assortmentId, storeId, stock) of all non-zero cells.
+        ((assortmentId, storeId, остаток) всех ненулевых ячеек.)
+        """
+        for store_id, column in self._stores.items():
+            for assortment_id, stock in column.items():
+                yield assortment_id, store_id, stock
+
+    def apply_rows(
+        self, rows: typing.Iterable[typing.Any]
+    ) -> typing.List[StockChange]:
+        """
+        Applies rows of the current stock reports: raw dicts or SmallStockReport.
+        (Применяет строки отчетов о текущих остатках: словари или SmallStockReport.)
+
+        :return: Changed cells (Измененные ячейки)
+        """
+        changes = []
+        for item in rows:
+            if isinstance(item, dict):
+                key = item["assortmentId"], item.get("storeId")
+                stock = item.get("stock") or 0.0
+            else:
+                key = item.assortment_id, item.store_id
+                stock = item.stock or 0.0
+            old = self.set(key[0], key[1], stock)
+            if old != stock:
+                changes.append(StockChange(key[0], key[1], old, stock))
+        return changes
+
+    def clear_except(
+        self,
+        keys: typing.Set[typing.Tuple[str, typing.Optional[str]]],
+        by_store: typing.Optional[bool] = None,
+    ) -> typing.List[StockChange]:
+        """
+        Sets to 0 all non-zero cells that are not in keys, for example after a full report without zero lines.
+        (Обнуляет все ненулевые ячейки, которых нет в keys, например после полного отчета без нулевых строк.)
+
+        :param keys: (assortmentId, storeId) of the cells to keep (Сохраняемые ячейки (assortmentId, storeId))
+        :param by_store: Only clear the cells of stores (True) or of all stores (False), by default both
+         (Обнулять только ячейки складов (True) или всех складов (False), по умолчанию и те, и другие)
+        """
+        changes = []
+        for assortment_id, store_id, stock in list(self.items()):
+            if by_store is not None and by_store == (store_id is None):
+                continue
+            if (assortment_id, store_id) not in keys:
+                self.set(assortment_id, store_id, 0.0)
+                changes.append(StockChange(assortment_id, store_id, stock, 0.0))
+        return changes
+
+    def __len__(self) -> int:
+        """
+        Number of non-zero cells.
+        (Количество ненулевых ячеек.)
+        """
+        return sum(len(column) for column in self._stores.values())
+
+
+class StockTracker:
+    """
+    Keeps a StockTable up to date with /report/stock/all/current (or /report/stock/bystore/current):
+    polls rows changed since the previous poll (minus the overlap window), and makes a full resync
+    without changedSince once per full_resync_interval, or when the previous poll is older than 24 hours.
+    (Поддерживает StockTable в актуальном состоянии по /report/stock/all/current (или /report/stock/bystore/current):
+    запрашивает строки, изменившиеся с предыдущего опроса (минус окно перекрытия), и делает полную синхронизацию
+    без changedSince раз в full_resync_interval, или когда предыдущий опрос старше 24 часов.)
+
+    changedSince is compared with the server time of the account (Moscow by default), pass a clock returning
+    that time if the local time zone differs.
+    (changedSince сравнивается с временем сервера аккаунта (по умолчанию московским), передайте clock,
+    возвращающий это время, если локальный часовой пояс отличается.)
+
+    Example:
+    tracker = StockTracker(client, by_store=True, sink=on_stock_change)
+    asyncio.create_task(tracker.run(interval=60))
+    stock = tracker.table.get(product_id, store_id)
+    """
+
+    def __init__(
+        self,
+        client: "MoySkladClient",
+        by_store: bool = False,
+        sink: typing.Optional[
+            typing.Union[typing.Callable[[StockChange], typing.Any], asyncio.Queue]
+        ] = None,
+        stock_type: StockType = "stock",
+        overlap: datetime.timedelta = DEFAULT_STOCK_OVERLAP,
+        full_resync_interval: datetime.timedelta = DEFAULT_FULL_RESYNC_INTERVAL,
+        table: typing.Optional[StockTable] = None,
+        clock: typing.Callable[[], datetime.datetime] = datetime.datetime.now,
+    ):
+        """
+
+        :param client: Client used for the requests (Клиент для запросов)
+        :param by_store: Track the stock per store (Отслеживать остатки по складам)
+        :param sink: Callback (sync or async) or asyncio.Queue receiving StockChanges
+         (Функция (синхронная или асинхронная) или asyncio.Queue, получающие StockChange)
+        :param stock_type: "stock", "freeStock" or "quantity" (Тип остатка)
+        :param overlap: How far before the previous poll to request again (Насколько раньше предыдущего опроса запрашивать повторно)
+        :param full_resync_interval: How often to reload all the stock (Как часто перезагружать все остатки)
+        :param table: Table to update, a new one by default (Обновляемая таблица, по умолчанию новая)
+        :param clock: Current server time (Текущее время сервера)
+        """
+        if overlap < datetime.timedelta(0):
+            raise ValueError("overlap must be >= 0")
+        self._client = client
+        self.by_store = by_store
+        self._sink = sink
+        self.stock_type = stock_type
+        self.overlap = overlap
+        self.full_resync_interval = full_resync_interval
+        self.table = table if table is not None else StockTable()
+        self._clock = clock
+        self.last_poll: typing.Optional[datetime.datetime] = None
+        self.last_full_sync: typing.Optional[datetime.datetime] = None
+        self._lock = asyncio.Lock()
+
+    def _request(
+        self, changed_since: typing.Optional[datetime.datetime] = None
+    ) -> stock_api.GetSmallStockReportCurrentRequest:
+        request_class = (
+            stock_api.GetSmallStockReportByStoreCurrentRequest
+            if self.by_store
+            else stock_api.GetSmallStockReportCurrentRequest
+        )
+        kwargs = {"stock_type": self.stock_type}
+        if changed_since is not None:
+            kwargs["changed_since"] = changed_since
+        return request_class(**kwargs).set_output("raw")
+
+    async def _emit(self, changes: typing.List[StockChange]) -> None:
+        if self._sink is None:
+            return
+        for change in changes:
+            await send_event(self._sink, change)
+
+    async def full_sync(self) -> typing.List[StockChange]:
+        """
+        Reloads all the stock, cells missing from the report (zero stock) are set to 0.
+        (Перезагружает все остатки, ячейки, которых нет в отчете (нулевой остаток), обнуляются.)
+        """
+        async with self._lock:
+            started = self._clock()
+            rows = await self._client(self._request())
+            changes = self.table.apply_rows(rows)
+            store_id = None
+            keys = set()
+            for row in rows:
+                if self.by_store:
+                    store_id = row.get("storeId")
+                keys.add((row["assortmentId"], store_id))
+            changes.extend(self.table.clear_except(keys))
+            self.last_poll = self.last_full_sync = started
+        await self._emit(changes)
+        return changes
+
+    async def poll(self) -> typing.List[StockChange]:
+        """
+        Applies the stock changed since the previous poll, or makes a full resync when it is due.
+        (Применяет остатки, изменившиеся с предыдущего опроса, или делает полную синхронизацию, когда пора.)
+
+        :return: Changed cells (Измененные ячейки)
+        """
+        now = self._clock()
+        if (
+            self.last_poll is None
+            or now - self.last_full_sync >= self.full_resync_interval
+            or now - self.last_poll + self.overlap >= MAX_CHANGED_SINCE
+        ):
+            return await self.full_sync()
+        async with self._lock:
+            started = self._clock()
+            changed_since = min(self.last_poll - self.overlap, started)
+            rows = await self._client(self._request(changed_since))
+            changes = self.table.apply_rows(rows)
+            self.last_poll = started
+        await self._emit(changes)
+        return changes
+
+    async def run(self, interval: float) -> None:
+        """
+        Polls every interval seconds, until cancelled.
+        (Опрашивает каждые interval секунд, пока не будет отменено.)
+        """
+        while True:
+            await self.poll()
+            await asyncio.sleep(interval)
@@ -0,0 +1,3 @@
+from .query import Query, F, Condition, Operator, format_value
+
+__all__ = ["Query", "F", "Condition", "Operator", "format_value"]
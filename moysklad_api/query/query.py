@@ -0,0 +1,512 @@
+import datetime
+import re
+import typing
+
+from .. import types
+
+# https://dev.moysklad.ru/doc/api/remap/1.2/#mojsklad-json-api-obschie-swedeniq-fil-traciq-wyborki-s-pomosch-u-parametra-filter
+# =  равно, != не равно, > < >= <= сравнение, ~ содержит, ~= начинается с, =~ заканчивается на
+Operator = typing.Literal["=", "!=", ">", ">=", "<", "<=", "~", "~=", "=~"]
+_OPERATORS = typing.get_args(Operator)
+_FIELD_RE = re.compile(r"[A-Za-z_]\w*(?:\.\w+)*")
+
+# operators of the "Фильтрация" column of the entity tables in the API documentation
+# (операторы из колонки "Фильтрация" таблиц сущностей в документации API)
+_EQUALITY = ("=", "!=")
+_COMPARISON = ("=", "!=", ">", ">=", "<", "<=")
+_TEXT = ("=", "!=", "~", "~=", "=~")
+
+_COMMON_FILTER = {
+    "id": _EQUALITY,
+    "accountId": _EQUALITY,
+    "updated": _COMPARISON,
+    "owner": _EQUALITY,
+    "shared": _EQUALITY,
+    "group": _EQUALITY,
+    "name": _TEXT,
+    "externalCode": _TEXT,
+    "description": _TEXT,
+}
+_DICTIONARY_FILTER = {**_COMMON_FILTER, "archived": _EQUALITY, "code": _TEXT}
+_ASSORTMENT_FILTER = {
+    **_DICTIONARY_FILTER,
+    "pathName": _TEXT,
+    "syncId": _EQUALITY,
+}
+_DOCUMENT_FILTER = {
+    **_COMMON_FILTER,
+    "moment": _COMPARISON,
+    "created": _COMPARISON,
+    "deleted": _COMPARISON,
+    "printed": _EQUALITY,
+    "published": _EQUALITY,
+    "organization": _EQUALITY,
+    "state": _EQUALITY,
+    "syncId": _EQUALITY,
+}
+_OPERATION_FILTER = {
+    **_DOCUMENT_FILTER,
+    "applicable": _EQUALITY,
+    "project": _EQUALITY,
+    "sum": _COMPARISON,
+}
+_AGENT_OPERATION_FILTER = {
+    **_OPERATION_FILTER,
+    "agent": _EQUALITY,
+    "contract": _EQUALITY,
+}
+_RETAIL_OPERATION_FILTER = {
+    **_DOCUMENT_FILTER,
+    "applicable": _EQUALITY,
+    "sum": _COMPARISON,
+    "agent": _EQUALITY,
+    "store": _EQUALITY,
+    "retailShift": _EQUALITY,
+    "retailStore": _EQUALITY,
+}
+
+# entity type -> API field -> operators it can be filtered with, for the entities with documented filtering.
+# Other entities are only checked against the fields of their model, add them here to check them fully.
+# (тип сущности -> поле API -> операторы, с которыми по нему можно фильтровать, для сущностей с описанной фильтрацией.
+# Остальные сущности проверяются только по полям модели, добавьте их сюда для полной проверки.)
+FILTER_FIELDS: typing.Dict[str, typing.Dict[str, typing.Tuple[str, ...]]] = {
+    "product": {
+        **_ASSORTMENT_FILTER,
+        "article": _TEXT,
+        "supplier": _EQUALITY,
+        "isSerialTrackable": _EQUALITY,
+    },
+    "service": _ASSORTMENT_FILTER,
+    "bundle": {**_ASSORTMENT_FILTER, "article": _TEXT},
+    "variant": {
+        "id": _EQUALITY,
+        "accountId": _EQUALITY,
+        "updated": _COMPARISON,
+        "name": _TEXT,
+        "code": _TEXT,
+        "externalCode": _TEXT,
+        "description": _TEXT,
+        "archived": _EQUALITY,
+    },
+    "productfolder": {**_DICTIONARY_FILTER, "pathName": _TEXT},
+    "counterparty": {
+        **_DICTIONARY_FILTER,
+        "created": _COMPARISON,
+        "email": _TEXT,
+        "phone": _TEXT,
+        "fax": _TEXT,
+        "inn": _TEXT,
+        "kpp": _TEXT,
+        "ogrn": _TEXT,
+        "okpo": _TEXT,
+        "legalTitle": _TEXT,
+        "legalAddress": _TEXT,
+        "actualAddress": _TEXT,
+        "companyType": _EQUALITY,
+        "discountCardNumber": _TEXT,
+        "state": _EQUALITY,
+        "tags": _EQUALITY,
+        "syncId": _EQUALITY,
+    },
+    "organization": {
+        **_DICTIONARY_FILTER,
+        "created": _COMPARISON,
+        "actualAddress": _TEXT,
+        "companyType": _EQUALITY,
+        "syncId": _EQUALITY,
+    },
+    "employee": {
+        **_COMMON_FILTER,
+        "archived": _EQUALITY,
+        "email": _TEXT,
+        "phone": _TEXT,
+        "firstName": _TEXT,
+        "middleName": _TEXT,
+        "lastName": _TEXT,
+        "position": _TEXT,
+        "inn": _TEXT,
+        "uid": _TEXT,
+    },
+    "store": {
+        **_DICTIONARY_FILTER,
+        "address": _TEXT,
+        "parent": _EQUALITY,
+        "pathName": _TEXT,
+    },
+    "project": _DICTIONARY_FILTER,
+    "contract": {
+        **_DICTIONARY_FILTER,
+        "moment": _COMPARISON,
+        "agent": _EQUALITY,
+        "ownAgent": _EQUALITY,
+        "contractType": _EQUALITY,
+        "rewardType": _EQUALITY,
+        "state": _EQUALITY,
+    },
+    **{
+        document: {**_AGENT_OPERATION_FILTER, "store": _EQUALITY}
+        for document in (
+            "customerorder",
+            "demand",
+            "supply",
+            "purchaseorder",
+            "invoicein",
+            "salesreturn",
+            "purchasereturn",
+        )
+    },
+    **{
+        document: _AGENT_OPERATION_FILTER
+        for document in (
+            "paymentin",
+            "paymentout",
+            "cashin",
+            "cashout",
+            "commissionreportin",
+            "commissionreportout",
+        )
+    },
+    **{
+        document: {**_OPERATION_FILTER, "store": _EQUALITY}
+        for document in ("enter", "loss", "internalorder")
+    },
+    "retaildemand": _RETAIL_OPERATION_FILTER,
+    "retailsalesreturn": _RETAIL_OPERATION_FILTER,
+    "inventory": {**_DOCUMENT_FILTER, "store": _EQUALITY, "sum": _COMPARISON},
+    "move": {
+        **_OPERATION_FILTER,
+        "sourceStore": _EQUALITY,
+        "targetStore": _EQUALITY,
+    },
+    "processing": {
+        **_DOCUMENT_FILTER,
+        "applicable": _EQUALITY,
+        "project": _EQUALITY,
+        "productsStore": _EQUALITY,
+        "materialsStore": _EQUALITY,
+    },
+}
+
+_COMMON_ORDER = ("id", "updated", "name", "externalCode")
+_DICTIONARY_ORDER = _COMMON_ORDER + ("code", "archived")
+_ASSORTMENT_ORDER = _DICTIONARY_ORDER + ("pathName", "syncId")
+_DOCUMENT_ORDER = _COMMON_ORDER + (
+    "moment",
+    "created",
+    "applicable",
+    "sum",
+    "description",
+    "syncId",
+)
+
+# entity type -> API fields it can be sorted by, the entities not listed are only checked against their model
+# (тип сущности -> поля API, по которым можно сортировать, не указанные сущности проверяются только по модели)
+ORDER_FIELDS: typing.Dict[str, typing.Tuple[str, ...]] = {
+    "product": _ASSORTMENT_ORDER + ("article", "isSerialTrackable"),
+    "service": _ASSORTMENT_ORDER,
+    "bundle": _ASSORTMENT_ORDER + ("article",),
+    "variant": ("id", "updated", "name", "code", "externalCode", "archived"),
+    "productfolder": _DICTIONARY_ORDER + ("pathName",),
+    "counterparty": _DICTIONARY_ORDER
+    + ("created", "legalTitle", "email", "phone", "inn", "companyType"),
+    "organization": _DICTIONARY_ORDER + ("created",),
+    "employee": _COMMON_ORDER
+    + ("archived", "firstName", "middleName", "lastName", "email"),
+    "store": _DICTIONARY_ORDER + ("pathName", "address"),
+    "project": _DICTIONARY_ORDER,
+    "contract": _DICTIONARY_ORDER + ("moment",),
+    **{
+        # documents are sorted by the fields of _DOCUMENT_ORDER they have (документы сортируются по имеющимся полям)
+        document: tuple(x for x in _DOCUMENT_ORDER if x in fields)
+        for document, fields in FILTER_FIELDS.items()
+        if "moment" in fields and document != "contract"
+    },
+}
+
+
+def _camel_case(name: str) -> str:
+    first, *rest = name.split("_")
+    return first + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
+def _snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def format_value(value: typing.Any) -> str:
+    """
+    Converts a value to the filter syntax: dates to "YYYY-MM-DD HH:MM:SS[.mmm]", bools to true/false,
+    metas and models to their href, None to an empty value.
+    (Преобразует значение в синтаксис фильтра: даты в "YYYY-MM-DD HH:MM:SS[.mmm]", bool в true/false,
+    meta и модели в их href, None в пустое значение.)
+    """
+    if value is None:
+        result = ""
+    elif isinstance(value, bool):
+        result = "true" if value else "false"
+    elif isinstance(value, datetime.datetime):
+        result = value.strftime("%Y-%m-%d %H:%M:%S")
+        if value.microsecond:
+            result += f".{value.microsecond // 1000:03d}"
+    elif isinstance(value, datetime.date):
+        result = value.strftime("%Y-%m-%d")
+    elif isinstance(value, types.MoySkladBaseClass):
+        result = value.meta["href"]
+    elif isinstance(value, dict):
+        result = value["meta"]["href"] if "meta" in value else value["href"]
+    else:
+        result = str(value)
+    if ";" in result:
+        raise ValueError(f"Filter values can not contain ';': {result!r}")
+    return result
+
+
+class Condition:
+    """
+    One `field<operator>value` part of a filter.
+    (Одна часть фильтра `поле<оператор>значение`.)
+    """
+
+    __slots__ = ("field", "operator", "value")
+
+    def __init__(self, field: str, operator: Operator, value: typing.Any):
+        if operator not in _OPERATORS:
+            raise ValueError(f"Unknown filter operator: {operator}")
+        self.field = field
+        self.operator = operator
+        self.value = value
+
+    def compile(self) -> str:
+        return f"{self.field}{self.operator}{format_value(self.value)}"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.compile()!r})"
+
+
+class F:
+    """
+    Field of a filter, comparisons make Conditions.
+    Several conditions with "=" on the same field are joined with OR by the API, with other operators - with AND.
+    (Поле фильтра, сравнения создают Condition.
+    Несколько условий "=" по одному полю API объединяет через ИЛИ, с остальными операторами - через И.)
+
+    Example:
+    F("updated") >= datetime.datetime(2024, 1, 1), F("archived") == False, F("name").like("стол")
+    """
+
+    __slots__ = ("name",)
+    __hash__ = None
+
+    def __init__(self, name: str):
+        """
+
+        :param name: Field name, model (external_code) or API (externalCode) (Имя поля, модели (external_code) или API (externalCode))
+        """
+        if not _FIELD_RE.fullmatch(name):
+            raise ValueError(f"Invalid field name: {name!r}")
+        self.name = name
+
+    def __eq__(self, value) -> Condition:
+        return Condition(self.name, "=", value)
+
+    def __ne__(self, value) -> Condition:
+        return Condition(self.name, "!=", value)
+
+    def __gt__(self, value) -> Condition:
+        return Condition(self.name, ">", value)
+
+    def __ge__(self, value) -> Condition:
+        return Condition(self.name, ">=", value)
+
+    def __lt__(self, value) -> Condition:
+        return Condition(self.name, "<", value)
+
+    def __le__(self, value) -> Condition:
+        return Condition(self.name, "<=", value)
+
+    def like(self, value: str) -> Condition:
+        return Condition(self.name, "~", value)
+
+    def startswith(self, value: str) -> Condition:
+        return Condition(self.name, "~=", value)
+
+    def endswith(self, value: str) -> Condition:
+        return Condition(self.name, "=~", value)
+
+    def isin(self, values: typing.Iterable[typing.Any]) -> typing.List[Condition]:
+        return [Condition(self.name, "=", value) for value in values]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name!r})"
+
+
+class Query:
+    """
+    Builder of the filter and order parameters of list and report requests, see ApiRequest.set_query.
+    If a model is given, conditions are checked against the filterable fields and operators of its entity
+    (FILTER_FIELDS) and the sort order against its sortable fields (ORDER_FIELDS). Entities missing from
+    these tables, such as report rows, are only checked against the fields of the model.
+    (Построитель параметров filter и order для списков и отчетов, см. ApiRequest.set_query.
+    Если указана модель, условия проверяются по полям и операторам фильтрации ее сущности (FILTER_FIELDS),
+    а сортировка - по полям сортировки (ORDER_FIELDS). Сущности, которых нет в этих таблицах, например строки отчетов,
+    проверяются только по полям модели.)
+
+    Example:
+    query = (
+        Query(product_api.Product)
+        .where(F("updated") >= since, F("archived") == False)
+        .order_by("updated", "id")
+    )
+    products = await client(product_api.GetProductListRequest().set_query(query))
+    """
+
+    def __init__(
+        self, model: typing.Optional[typing.Type[types.MoySkladBaseClass]] = None
+    ):
+        self.model = model
+        self.conditions: typing.List[Condition] = []
+        self.order: typing.List[typing.Tuple[str, str]] = []
+        self._filter_fields: typing.Optional[
+            typing.Dict[str, typing.Tuple[str, ...]]
+        ] = None
+        self._order_fields: typing.Optional[typing.Tuple[str, ...]] = None
+        if model is not None:
+            ms_name = model.ms_name()
+            if ms_name is not None and len(ms_name) == 1:
+                self._filter_fields = FILTER_FIELDS.get(ms_name[0])
+                self._order_fields = ORDER_FIELDS.get(ms_name[0])
+
+    def _api_field(
+        self, name: str, allowed: typing.Optional[typing.Collection[str]], usage: str
+    ) -> str:
+        if "." in name:
+            # nested fields, for example "agent.name", are passed as is
+            # (вложенные поля, например "agent.name", передаются как есть)
+            return name
+        api_name = _camel_case(name)
+        if self.model is None:
+            return api_name
+        if allowed is not None:
+            if api_name not in allowed:
+                raise ValueError(
+                    f"{self.model.__name__} can not be {usage} by {name}. "
+                    f"Possible fields: {', '.join(allowed)}"
+                )
+        elif _snake_case(name) not in self.model._fields:
+            raise ValueError(
+                f"Unknown field {name} of {self.model.__name__}. "
+                f"Known fields: {', '.join(self.model._fields)}"
+            )
+        return api_name
+
+    def _condition(self, condition: Condition) -> Condition:
+        field = self._api_field(condition.field, self._filter_fields, "filtered")
+        if self._filter_fields is not None and field in self._filter_fields:
+            operators = self._filter_fields[field]
+            if condition.operator not in operators:
+                raise ValueError(
+                    f"{field} of {self.model.__name__} can not be filtered with {condition.operator}. "
+                    f"Possible operators: {' '.join(operators)}"
+                )
+        return Condition(field, condition.operator, condition.value)
+
+    def where(
+        self, *conditions: typing.Union[Condition, typing.Iterable[Condition]]
+    ) -> "Query":
+        """
+        Add conditions, F(...).isin(...) lists are accepted too.
+        (Добавить условия, списки F(...).isin(...) тоже принимаются.)
+
+        :return: self
+        """
+        for condition in conditions:
+            if isinstance(condition, Condition):
+                condition = [condition]
+            for item in condition:
+                if not isinstance(item, Condition):
+                    raise TypeError(f"Expected Condition, got {item!r}")
+                self.conditions.append(self._condition(item))
+        return self
+
+    def ids(self, ids: typing.Iterable[str]) -> "Query":
+        """
+        Objects with any of the given ids.
+        (Объекты с любым из указанных id.)
+        """
+        self.conditions.extend(Condition("id", "=", x) for x in ids)
+        return self
+
+    def attribute(
+        self,
+        attribute: typing.Union[str, dict],
+        operator: Operator,
+        value: typing.Any,
+    ) -> "Query":
+        """
+        Condition on an additional field.
+        (Условие по дополнительному полю.)
+
+        :param attribute: href of the attribute metadata, or the attribute / its meta (href метаданных доп. поля, или доп. поле / его meta)
+        :param operator: Operator (Оператор)
+        :param value: Value (Значение)
+        """
+        if isinstance(attribute, dict):
+            attribute = format_value(attribute)
+        if "/attributes/" not in attribute:
+            raise ValueError(f"Not an attribute href: {attribute}")
+        self.conditions.append(Condition(attribute, operator, value))
+        return self
+
+    def order_by(self, *fields: typing.Union[str, typing.Tuple[str, str]]) -> "Query":
+        """
+        Sort order: "name", "-updated" (descending) or ("updated", "desc").
+        (Порядок сортировки: "name", "-updated" (по убыванию) или ("updated", "desc").)
+        """
+        for field in fields:
+            if isinstance(field, str):
+                direction = "desc" if field.startswith("-") else "asc"
+                field = field.lstrip("-")
+            else:
+                field, direction = field
+            if direction not in ("asc", "desc"):
+                raise ValueError(f"Unknown sort direction: {direction}")
+            self.order.append(
+                (self._api_field(field, self._order_fields, "sorted"), direction)
+            )
+        return self
+
+    def filter_string(self) -> typing.Optional[str]:
+        if not self.conditions:
+            return None
+        return ";".join(condition.compile() for condition in self.conditions)
+
+    def order_string(self) -> typing.Optional[str]:
+        if not self.order:
+            return None
+        return ";".join(
+            field if direction == "asc" else f"{field},desc"
+            for field, direction in self.order
+        )
+
+    def to_params(self) -> typing.Dict[str, str]:
+        """
+        Returns the filter and order request parameters.
+        (Возвращает параметры запроса filter и order.)
+        """
+        params = {}
+        filter_string = self.filter_string()
+        if filter_string:
+            params["filter"] = filter_string
+        order_string = self.order_string()
+        if order_string:
+            params["order"] = order_string
+        return params
+
+    def copy(self) -> "Query":
+        query = Query(self.model)
+        query.conditions = list(self.conditions)
+        query.order = list(self.order)
+        return query
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_params()!r})"
@@ -0,0 +1,31 @@
+from .checkpoints import (
+    Checkpoint,
+    CheckpointStore,
+    MemoryCheckpointStore,
+    JsonFileCheckpointStore,
+    SqliteCheckpointStore,
+)
+from .sync import (
+    SyncEngine,
+    SyncEvent,
+    SyncResult,
+    UPSERT,
+    DELETE,
+    DEFAULT_OVERLAP,
+    send_event,
+)
+
+__all__ = [
+    "Checkpoint",
+    "CheckpointStore",
+    "MemoryCheckpointStore",
+    "JsonFileCheckpointStore",
+    "SqliteCheckpointStore",
+    "SyncEngine",
+    "SyncEvent",
+    "SyncResult",
+    "UPSERT",
+    "DELETE",
+    "DEFAULT_OVERLAP",
+    "send_event",
+]
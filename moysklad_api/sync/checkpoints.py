@@ -0,0 +1,215 @@
+import abc
+import datetime
+import json
+import os
+import sqlite3
+import typing
+
+from .. import helpers
+
+
+def _format_date(value: typing.Optional[datetime.datetime]) -> typing.Optional[str]:
+    if value is None:
+        return None
+    return value.isoformat(sep=" ", timespec="milliseconds")
+
+
+class Checkpoint:
+    """
+    Sync position of one entity type: (updated, id) of the last synced object
+    and the moment of the last processed deletion in the audit.
+    (Позиция синхронизации одного типа сущности: (updated, id) последнего синхронизированного объекта
+    и момент последнего обработанного удаления в аудите.)
+    """
+
+    __slots__ = ("updated", "id", "deleted_since")
+
+    def __init__(
+        self,
+        updated: typing.Optional[datetime.datetime] = None,
+        id_: typing.Optional[str] = None,
+        deleted_since: typing.Optional[datetime.datetime] = None,
+    ):
+        self.updated = updated
+        self.id = id_
+        self.deleted_since = deleted_since
+
+    def to_dict(self) -> dict:
+        return {
+            "updated": _format_date(self.updated),
+            "id": self.id,
+            "deletedSince": _format_date(self.deleted_since),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Checkpoint":
+        return cls(
+            helpers.parse_date(data.get("updated")),
+            data.get("id"),
+            helpers.parse_date(data.get("deletedSince")),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Checkpoint):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(updated={self.updated!r}, id={self.id!r}, "
+            f"deleted_since={self.deleted_since!r})"
+        )
+
+
+class CheckpointStore(abc.ABC):
+    """
+    Storage of the checkpoints of SyncEngine, one per entity type.
+    (Хранилище контрольных точек SyncEngine, по одной на тип сущности.)
+    """
+
+    @abc.abstractmethod
+    def load(self, entity_type: str) -> typing.Optional[Checkpoint]:
+        """
+        Returns the checkpoint of the type, or None if the type was never synced.
+        (Возвращает контрольную точку типа, или None, если тип еще не синхронизировался.)
+        """
+        pass
+
+    @abc.abstractmethod
+    def save(self, entity_type: str, checkpoint: Checkpoint) -> None:
+        pass
+
+    @abc.abstractmethod
+    def delete(self, entity_type: str) -> None:
+        """
+        Removes the checkpoint, the next sync of the type loads everything again.
+        (Удаляет контрольную точку, следующая синхронизация типа загрузит все заново.)
+        """
+        pass
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """
+    Checkpoints kept in memory only, lost when the process exits.
+    (Контрольные точки только в памяти, теряются при завершении процесса.)
+    """
+
+    def __init__(self):
+        self._checkpoints: typing.Dict[str, dict] = {}
+
+    def load(self, entity_type: str) -> typing.Optional[Checkpoint]:
+        data = self._checkpoints.get(entity_type)
+        return Checkpoint.from_dict(data) if data is not None else None
+
+    def save(self, entity_type: str, checkpoint: Checkpoint) -> None:
+        self._checkpoints[entity_type] = checkpoint.to_dict()
+
+    def delete(self, entity_type: str) -> None:
+        self._checkpoints.pop(entity_type, None)
+
+
+class JsonFileCheckpointStore(CheckpointStore):
+    """
+    Checkpoints in a JSON file {"<type>": {...}}. The file is rewritten atomically (temporary file + rename),
+    so a crash during a save leaves the previous checkpoints.
+    (Контрольные точки в JSON файле {"<тип>": {...}}. Файл перезаписывается атомарно (временный файл + переименование),
+    поэтому сбой во время сохранения оставляет предыдущие контрольные точки.)
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]):
+        """
+
+        :param path: Path of the file, created on the first save (Путь к файлу, создается при первом сохранении)
+        """
+        self.path = os.fspath(path)
+        self._checkpoints: typing.Optional[typing.Dict[str, dict]] = None
+
+    def _read(self) -> typing.Dict[str, dict]:
+        if self._checkpoints is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._checkpoints = json.load(f)
+            except FileNotFoundError:
+                self._checkpoints = {}
+        return self._checkpoints
+
+    def _write(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._checkpoints, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def load(self, entity_type: str) -> typing.Optional[Checkpoint]:
+        data = self._read().get(entity_type)
+        return Checkpoint.from_dict(data) if data is not None else None
+
+    def save(self, entity_type: str, checkpoint: Checkpoint) -> None:
+        self._read()[entity_type] = checkpoint.to_dict()
+        self._write()
+
+    def delete(self, entity_type: str) -> None:
+        if self._read().pop(entity_type, None) is not None:
+            self._write()
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """
+    Checkpoints in the sync_checkpoints table of an SQLite database,
+    the database may be shared with the synced data so both are committed together.
+    (Контрольные точки в таблице sync_checkpoints базы SQLite,
+    база может быть общей с синхронизируемыми данными, чтобы они сохранялись вместе.)
+    """
+
+    def __init__(
+        self,
+        database: typing.Union[str, os.PathLike, sqlite3.Connection],
+        table: str = "sync_checkpoints",
+    ):
+        """
+
+        :param database: Path of the database file or an open connection (Путь к файлу базы или открытое соединение)
+        :param table: Table name (Имя таблицы)
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}")
+        if isinstance(database, sqlite3.Connection):
+            self.connection = database
+        else:
+            self.connection = sqlite3.connect(os.fspath(database))
+        self.table = table
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "entity_type TEXT PRIMARY KEY, updated TEXT, id TEXT, deleted_since TEXT)"
+            )
+
+    def load(self, entity_type: str) -> typing.Optional[Checkpoint]:
+        row = self.connection.execute(
+            f"SELECT updated, id, deleted_since FROM {self.table} WHERE entity_type = ?",
+            (entity_type,),
+        ).fetchone()
+        if row is None:
+            return None
+        return Checkpoint.from_dict(
+            {"updated": row[0], "id": row[1], "deletedSince": row[2]}
+        )
+
+    def save(self, entity_type: str, checkpoint: Checkpoint) -> None:
+        data = checkpoint.to_dict()
+        with self.connection:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (entity_type, updated, id, deleted_since) "
+                "VALUES (?, ?, ?, ?)",
+                (entity_type, data["updated"], data["id"], data["deletedSince"]),
+            )
+
+    def delete(self, entity_type: str) -> None:
+        with self.connection:
+            self.connection.execute(
+                f"DELETE FROM {self.table} WHERE entity_type = ?", (entity_type,)
+            )
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,310 @@
+import asyncio
+import datetime
+import inspect
+import re
+import typing
+
+from .. import types, helpers, query
+from ..api import bulk as bulk_api, audit as audit_api
+from ..client.keyset import KeysetCursor, row_key
+from .checkpoints import Checkpoint, CheckpointStore, MemoryCheckpointStore
+
+if typing.TYPE_CHECKING:
+    from ..client import MoySkladClient
+
+UPSERT = "upsert"
+DELETE = "delete"
+SyncAction = typing.Literal["upsert", "delete"]
+# audit event types of deleted objects, including ones moved to the trash, as listed in
+# https://dev.moysklad.ru/doc/api/remap/1.2/#mojsklad-json-api-audit-audit
+# (типы событий аудита удаленных объектов, включая перемещенные в корзину, из документации)
+DELETE_EVENT_TYPES = ("delete", "puttotrash")
+# mass deletions are logged as one "bulkoperation" context with a "delete" event per object
+# (массовое удаление записывается одним контекстом "bulkoperation" с событием "delete" для каждого объекта)
+DELETE_CONTEXT_EVENT_TYPES = DELETE_EVENT_TYPES + ("bulkoperation",)
+# rows committed a bit later than their updated time are not lost (строки, сохраненные чуть позже своего updated, не теряются)
+DEFAULT_OVERLAP = datetime.timedelta(seconds=60)
+_ENTITY_URL_RE = re.compile(r"/entity/(\w+)/?$")
+
+
+class SyncEvent:
+    """
+    Change found by SyncEngine: action "upsert" with the object, or "delete" with obj None.
+    (Изменение, найденное SyncEngine: действие "upsert" с объектом, или "delete" с obj равным None.)
+    """
+
+    __slots__ = ("action", "entity_type", "id", "obj")
+
+    def __init__(
+        self,
+        action: SyncAction,
+        entity_type: str,
+        id_: str,
+        obj: typing.Any = None,
+    ):
+        self.action = action
+        self.entity_type = entity_type
+        self.id = id_
+        self.obj = obj
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(action={self.action!r}, "
+            f"entity_type={self.entity_type!r}, id={self.id!r})"
+        )
+
+
+class SyncResult:
+    """
+    Result of syncing one entity type.
+    (Результат синхронизации одного типа сущности.)
+    """
+
+    __slots__ = ("entity_type", "upserted", "deleted", "checkpoint")
+
+    def __init__(
+        self, entity_type: str, upserted: int, deleted: int, checkpoint: Checkpoint
+    ):
+        self.entity_type = entity_type
+        self.upserted = upserted
+        self.deleted = deleted
+        self.checkpoint = checkpoint
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(entity_type={self.entity_type!r}, "
+            f"upserted={self.upserted!r}, deleted={self.deleted!r})"
+        )
+
+
+EventSink = typing.Union[
+    typing.Callable[[SyncEvent], typing.Any], "asyncio.Queue[SyncEvent]"
+]
+
+
+async def send_event(
+    sink: typing.Union[typing.Callable[[typing.Any], typing.Any], asyncio.Queue],
+    event: typing.Any,
+) -> None:
+    """
+    Puts the event to the queue, or calls the callback (awaiting it if it is async).
+    (Кладет событие в очередь, или вызывает функцию (ожидая ее, если она асинхронная).)
+    """
+    if isinstance(sink, asyncio.Queue):
+        await sink.put(event)
+        return
+    result = sink(event)
+    if inspect.isawaitable(result):
+        await result
+
+
+def _entity_type_of_request(request: types.ApiRequest) -> str:
+    found = _ENTITY_URL_RE.search(request.to_request().url)
+    if found is None:
+        raise ValueError(
+            f"Not a list request of /entity/<type>: {request.to_request().url}"
+        )
+    return found.group(1)
+
+
+class SyncEngine:
+    """
+    Incremental sync of entity types. Every sync requests only the objects with updated after the checkpoint
+    of the type (minus the overlap window), ordered by updated, id, and emits an "upsert" event for each of them.
+    Deleted objects are found in the audit and emitted as "delete" events.
+    Checkpoints are saved to the store after every checkpoint_every objects and at the end of the sync,
+    so an interrupted sync continues from the last saved position.
+    Objects of the overlap window are emitted again, so the receiver must apply events idempotently.
+    (Инкрементальная синхронизация типов сущностей. Каждая синхронизация запрашивает только объекты с updated
+    после контрольной точки типа (минус окно перекрытия), упорядоченные по updated, id, и выдает событие "upsert"
+    для каждого из них. Удаленные объекты находятся в аудите и выдаются как события "delete".
+    Контрольные точки сохраняются после каждых checkpoint_every объектов и в конце синхронизации,
+    поэтому прерванная синхронизация продолжается с последней сохраненной позиции.
+    Объекты окна перекрытия выдаются повторно, поэтому получатель должен применять события идемпотентно.)
+
+    Example:
+    queue = asyncio.Queue(maxsize=1000)
+    engine = SyncEngine(client, ["product", "counterparty"], queue, JsonFileCheckpointStore("sync.json"))
+    await engine.sync()
+    """
+
+    def __init__(
+        self,
+        client: "MoySkladClient",
+        entity_types: typing.Iterable[
+            typing.Union[str, typing.Type[types.MoySkladBaseClass], types.ApiRequest]
+        ],
+        sink: EventSink,
+        store: typing.Optional[CheckpointStore] = None,
+        overlap: datetime.timedelta = DEFAULT_OVERLAP,
+        detect_deletions: bool = True,
+        page_size: int = helpers.MAX_PAGE_SIZE,
+        checkpoint_every: int = helpers.MAX_PAGE_SIZE,
+    ):
+        """
+
+        :param client: Client used for the requests (Клиент для запросов)
+        :param entity_types: Entity type names ("product"), model classes (Product) or list requests of /entity/<type>
+         with additional parameters, for example GetProductListRequest(archived=True)
+         (Имена типов ("product"), классы моделей (Product) или запросы списков /entity/<type>
+         с дополнительными параметрами, например GetProductListRequest(archived=True))
+        :param sink: Callback (sync or async) or asyncio.Queue receiving SyncEvents. A bounded queue slows the sync down
+         to the speed of the consumer (Функция (синхронная или асинхронная) или asyncio.Queue, получающие SyncEvent.
+         Ограниченная очередь замедляет синхронизацию до скорости потребителя)
+        :param store: Checkpoint store, by default in memory (Хранилище контрольных точек, по умолчанию в памяти)
+        :param overlap: How far before the checkpoint to request again (Насколько раньше контрольной точки запрашивать повторно)
+        :param detect_deletions: Find deleted objects in the audit (Искать удаленные объекты в аудите)
+        :param page_size: Number of objects per page, 1 - 1000 (Количество объектов на странице, 1 - 1000)
+        :param checkpoint_every: Save the checkpoint after this many objects (Сохранять контрольную точку после такого количества объектов)
+        """
+        if overlap < datetime.timedelta(0):
+            raise ValueError("overlap must be >= 0")
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be >= 1")
+        self._client = client
+        self._requests: typing.Dict[str, types.ApiRequest] = {}
+        for entity in entity_types:
+            if isinstance(entity, types.ApiRequest):
+                self._requests[_entity_type_of_request(entity)] = entity
+            else:
+                request = bulk_api.GetEntityListRequest(entity)
+                self._requests[request.entity_type] = request
+        self._sink = sink
+        self.store = store if store is not None else MemoryCheckpointStore()
+        self.overlap = overlap
+        self.detect_deletions = detect_deletions
+        self.page_size = page_size
+        self.checkpoint_every = checkpoint_every
+        self._locks: typing.Dict[str, asyncio.Lock] = {}
+
+    @property
+    def entity_types(self) -> typing.List[str]:
+        return list(self._requests)
+
+    async def _emit(self, event: SyncEvent) -> None:
+        await send_event(self._sink, event)
+
+    async def sync(
+        self, entity_types: typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.Dict[str, SyncResult]:
+        """
+        Syncs all (or the given) types concurrently.
+        (Синхронизирует все (или указанные) типы параллельно.)
+        """
+        if entity_types is None:
+            entity_types = self._requests
+        results = await asyncio.gather(*(self.sync_type(x) for x in entity_types))
+        return {result.entity_type: result for result in results}
+
+    async def sync_type(self, entity_type: str) -> SyncResult:
+        """
+        Syncs one type. The first sync of a type emits all its objects, deletions are looked for starting
+        from the next one. Concurrent calls for the same type run one after another.
+        (Синхронизирует один тип. Первая синхронизация типа выдает все его объекты, удаления ищутся
+        начиная со следующей. Одновременные вызовы для одного типа выполняются по очереди.)
+        """
+        if entity_type not in self._requests:
+            raise ValueError(f"{entity_type} is not synced by this engine")
+        lock = self._locks.setdefault(entity_type, asyncio.Lock())
+        async with lock:
+            return await self._sync_type(entity_type)
+
+    async def _sync_type(self, entity_type: str) -> SyncResult:
+        previous = self.store.load(entity_type)
+        if previous is None:
+            checkpoint = Checkpoint()
+            if self.detect_deletions:
+                # deletions before the first full load do not matter (удаления до первой полной загрузки не важны)
+                checkpoint.deleted_since = await self._last_audit_moment()
+        else:
+            checkpoint = Checkpoint(
+                previous.updated, previous.id, previous.deleted_since
+            )
+
+        cursor = KeysetCursor(
+            checkpoint.updated - self.overlap
+            if checkpoint.updated is not None
+            else None
+        )
+        upserted = 0
+        async for item in self._client.iterate(
+            self._requests[entity_type], self.page_size, cursor=cursor
+        ):
+            key = row_key(item)
+            await self._emit(SyncEvent(UPSERT, entity_type, key[1], item))
+            if checkpoint.updated is None or key > (
+                checkpoint.updated,
+                checkpoint.id or "",
+            ):
+                checkpoint.updated, checkpoint.id = key
+            upserted += 1
+            if upserted % self.checkpoint_every == 0:
+                self.store.save(entity_type, checkpoint)
+
+        deleted = 0
+        if previous is not None and self.detect_deletions:
+            deleted = await self._sync_deletions(entity_type, checkpoint)
+        self.store.save(entity_type, checkpoint)
+        return SyncResult(entity_type, upserted, deleted, checkpoint)
+
+    async def _last_audit_moment(self) -> typing.Optional[datetime.datetime]:
+        # the audit is ordered by moment, newest first (аудит упорядочен по moment, сначала новые)
+        contexts = await self._client(audit_api.GetAuditContextsRequest(limit=1))
+        return contexts[0].moment if contexts else None
+
+    async def _sync_deletions(self, entity_type: str, checkpoint: Checkpoint) -> int:
+        filter_ = f"entityType={entity_type};" + ";".join(
+            f"eventType={x}" for x in DELETE_CONTEXT_EVENT_TYPES
+        )
+        if checkpoint.deleted_since is not None:
+            since = checkpoint.deleted_since - self.overlap
+            filter_ += f";moment>={query.format_value(since)}"
+        # the audit accepts a smaller limit than other lists (аудит принимает меньший limit, чем другие списки)
+        page_size = min(self.page_size, helpers.MAX_AUDIT_PAGE_SIZE)
+        contexts = [
+            x
+            async for x in self._client.iterate(
+                audit_api.GetAuditContextsRequest(filter_=filter_), page_size
+            )
+        ]
+        contexts.sort(key=lambda x: x.moment)
+        deleted_ids = set()
+        for context in contexts:
+            async for event in self._client.iterate(
+                audit_api.GetAuditEventsByContextRequest(context.id), page_size
+            ):
+                if (
+                    event.entity_type != entity_type
+                    or event.event_type not in DELETE_EVENT_TYPES
+                    or not event.entity
+                ):
+                    continue
+                id_ = event.entity["href"].rstrip("/").rsplit("/", 1)[1]
+                if id_ in deleted_ids:
+                    continue
+                deleted_ids.add(id_)
+                await self._emit(SyncEvent(DELETE, entity_type, id_))
+            if (
+                checkpoint.deleted_since is None
+                or context.moment > checkpoint.deleted_since
+            ):
+                checkpoint.deleted_since = context.moment
+        return len(deleted_ids)
+
+    async def run(self, interval: float) -> None:
+        """
+        Syncs all types every interval seconds, until cancelled.
+        (Синхронизирует все типы каждые interval секунд, пока не будет отменено.)
+        """
+        while True:
+            await self.sync()
+            await asyncio.sleep(interval)
+
+    async def reset(self, entity_type: str) -> None:
+        """
+        Removes the checkpoint of the type, the next sync loads all its objects again.
+        (Удаляет контрольную точку типа, следующая синхронизация загрузит все его объекты заново.)
+        """
+        lock = self._locks.setdefault(entity_type, asyncio.Lock())
+        async with lock:
+            self.store.delete(entity_type)
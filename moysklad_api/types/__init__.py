@@ -1,19 +1,33 @@
 from .types import (
     Meta,
     MetaArray,
+    MetaArrayMeta,
     ApiRequest,
     Rate,
     MoySkladBaseClass,
     Unset,
     RequestData,
+    OutputMode,
+    get_model_class,
+    MAX_EXPAND_DEPTH,
+    MAX_EXPAND_LIMIT,
+    build_expanded,
+    merge_param,
 )
 
 __all__ = [
     "Meta",
     "MetaArray",
+    "MetaArrayMeta",
     "ApiRequest",
     "Rate",
     "MoySkladBaseClass",
     "Unset",
     "RequestData",
+    "OutputMode",
+    "get_model_class",
+    "MAX_EXPAND_DEPTH",
+    "MAX_EXPAND_LIMIT",
+    "build_expanded",
+    "merge_param",
 ]
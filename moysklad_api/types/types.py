@@ -1,4 +1,8 @@
 import abc
+import collections
+import contextvars
+import operator
+import re
 import typing
 
 
@@ -27,6 +31,8 @@ class MetaArrayMeta(typing.TypedDict):
     size: int
     limit: int
     offset: int
+    nextHref: typing.NotRequired[str]
+    previousHref: typing.NotRequired[str]
 
 
 class MetaArray(typing.TypedDict):
@@ -41,7 +47,341 @@ class Rate(typing.TypedDict):
     currency: Meta
 
 
-class MoySkladBaseClass(abc.ABC):
+# model classes by ms_name(), filled when classes are created
+# (классы моделей по ms_name(), заполняется при создании классов)
+_models_by_ms_name: typing.Dict[typing.Tuple[str, ...], type] = {}
+
+
+def get_model_class(
+    ms_name: typing.Tuple[str, ...]
+) -> typing.Optional[typing.Type["MoySkladBaseClass"]]:
+    """
+    Returns the model class with the given ms_name(), for example ("product",) or ("supply", "positions").
+    (Возвращает класс модели с указанным ms_name(), например ("product",) или ("supply", "positions").)
+    """
+    return _models_by_ms_name.get(ms_name)
+
+
+class _MoySkladModelMeta(abc.ABCMeta):
+    """
+    Gives every model class __slots__ made of its annotated fields, unless the class defines __slots__ itself.
+    Instances then have no per-instance __dict__, which makes large lists of models much smaller.
+    (Добавляет каждому классу модели __slots__ из его аннотированных полей, если класс не задает __slots__ сам.
+    У экземпляров нет собственного __dict__, поэтому большие списки моделей занимают намного меньше памяти.)
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        inherited = []
+        for base in bases:
+            inherited.extend(getattr(base, "_fields", ()))
+        own = [
+            field
+            for field in namespace.get("__annotations__", {})
+            # fields with a class-level value can not be slots
+            # (поля со значением на уровне класса не могут быть слотами)
+            if field not in inherited and field not in namespace
+        ]
+        if "__slots__" not in namespace:
+            namespace["__slots__"] = tuple(own)
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        cls._fields = tuple(dict.fromkeys(inherited + own))
+        # lazy views share ms_name() with their model and are not registered
+        # (ленивые представления имеют тот же ms_name(), что и модель, и не регистрируются)
+        if not cls.__abstractmethods__ and "_model" not in namespace:
+            ms_name = cls.ms_name()
+            if ms_name is not None:
+                _models_by_ms_name.setdefault(tuple(ms_name), cls)
+        return cls
+
+
+def _camel_to_snake(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _field_extractor(
+    key: typing.Optional[str], convert: typing.Optional[typing.Callable]
+) -> typing.Callable[[dict], typing.Any]:
+    """
+    Function of the raw dict returning one field, from an entry of MoySkladBaseClass._json_fields.
+    (Функция от исходного словаря, возвращающая одно поле, по записи MoySkladBaseClass._json_fields.)
+    """
+    if key is None:
+        return convert
+    if convert is None:
+        return operator.methodcaller("get", key)
+
+    def extract(dict_data: dict):
+        return convert(dict_data.get(key))
+
+    return extract
+
+
+def _no_value(_: dict) -> None:
+    # from_json does not set the field (from_json не задает поле)
+    return None
+
+
+def _make_projection(
+    model: type, fields: typing.Tuple[str, ...], named: bool
+) -> typing.Callable[[dict], tuple]:
+    """
+    Builds a function that converts a raw dict into a tuple (or namedtuple) of the given fields.
+    The JSON keys and converters are taken from the field table of the model once per projection:
+    values are read from the dict by key and only the fields that need it are converted, no model is created.
+    Models without a field table are converted by from_json.
+    (Создает функцию, которая преобразует исходный словарь в кортеж (или namedtuple) указанных полей.
+    Ключи JSON и функции преобразования берутся из таблицы полей модели один раз для проекции:
+    значения читаются из словаря по ключу и преобразуются только поля, которым это нужно, модель не создается.
+    Модели без таблицы полей преобразуются from_json.)
+    """
+    result_type = (
+        collections.namedtuple(model.__name__ + "Row", fields) if named else tuple
+    )
+    new = tuple.__new__
+    table = model._json_table()
+    if table is None:
+        from_json = model.from_json
+
+        def project(dict_data: dict) -> tuple:
+            instance = from_json(dict_data)
+            return new(result_type, [getattr(instance, x, None) for x in fields])
+
+        return project
+
+    keys = []
+    converters = []
+    for index, field in enumerate(fields):
+        key, convert = table.get(field, (None, None))
+        keys.append(key)
+        if convert is not None:
+            converters.append((index, key is None, convert))
+    keys = tuple(keys)
+    converters = tuple(converters)
+
+    if not converters:
+
+        def project(dict_data: dict) -> tuple:
+            return new(result_type, map(dict_data.get, keys))
+
+        return project
+
+    def project(dict_data: dict) -> tuple:
+        values = list(map(dict_data.get, keys))
+        for index, whole, convert in converters:
+            values[index] = convert(dict_data if whole else values[index])
+        return new(result_type, values)
+
+    return project
+
+
+class _LazyField:
+    """
+    Field of a lazy view with a field table: identity fields are read from the raw dict on every access,
+    converted fields are converted on first access and kept in the cache of the view, as are assigned values.
+    (Поле ленивого представления с таблицей полей: поля без преобразования читаются из исходного словаря
+    при каждом обращении, преобразуемые поля преобразуются при первом обращении и хранятся в кэше представления,
+    как и присвоенные значения.)
+    """
+
+    __slots__ = ("name", "key", "extract")
+
+    def __init__(
+        self,
+        name: str,
+        key: typing.Optional[str],
+        extract: typing.Optional[typing.Callable[[dict], typing.Any]],
+    ):
+        self.name = name
+        # set only for fields taken as is (задан только для полей без преобразования)
+        self.key = key
+        self.extract = extract
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance._cache
+        if cache is not None and self.name in cache:
+            return cache[self.name]
+        if self.extract is None:
+            return instance._raw.get(self.key)
+        value = self.extract(instance._raw)
+        if cache is None:
+            cache = instance._cache = {}
+        cache[self.name] = value
+        return value
+
+    def __set__(self, instance, value) -> None:
+        if instance._cache is None:
+            instance._cache = {}
+        instance._cache[self.name] = value
+
+    def __delete__(self, instance) -> None:
+        raise AttributeError(f"Fields of lazy views can not be deleted: {self.name}")
+
+
+def _lazy_fields(model: type) -> typing.Optional[typing.Dict[str, _LazyField]]:
+    table = model._json_table()
+    if table is None:
+        return None
+    fields = {}
+    for field in model._fields:
+        key, convert = table.get(field, (None, _no_value))
+        if key is not None and convert is None:
+            fields[field] = _LazyField(field, key, None)
+        else:
+            fields[field] = _LazyField(field, None, _field_extractor(key, convert))
+    return fields
+
+
+class _LazyModelMixin:
+    """
+    Base of the lazy view classes made by MoySkladBaseClass.lazy_from_json. Models with a field table
+    (MoySkladBaseClass._json_fields) get a _LazyField per field, the others are converted by from_json
+    on first access to any field.
+    (База классов ленивых представлений, создаваемых MoySkladBaseClass.lazy_from_json. Модели с таблицей полей
+    (MoySkladBaseClass._json_fields) получают _LazyField на каждое поле, остальные преобразуются from_json
+    при первом обращении к любому полю.)
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        model = type(self)._model
+        if name not in model._fields:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        full = model.from_json(self._raw)
+        for field in model._fields:
+            setattr(self, field, getattr(full, field, None))
+        return object.__getattribute__(self, name)
+
+    def __reduce__(self):
+        # converted and assigned fields are restored by __setstate__ (преобразованные и присвоенные поля восстанавливает __setstate__)
+        return type(self)._model.lazy_from_json, (self._raw,), self._cache or None
+
+
+class MoySkladBaseClass(abc.ABC, metaclass=_MoySkladModelMeta):
+    # names of all fields of the model, in declaration order (имена всех полей модели, в порядке объявления)
+    _fields: typing.ClassVar[typing.Tuple[str, ...]] = ()
+    # {field: (JSON key, converter)} - how from_json fills each field, used by lazy views. The converter gets
+    # the value of the key (None - the value is taken as is), or the whole dict if the key is None
+    # ({поле: (ключ JSON, преобразование)} - как from_json заполняет каждое поле, используется ленивыми представлениями.
+    # Преобразование получает значение ключа (None - значение берется как есть), или весь словарь, если ключ равен None)
+    _json_fields: typing.ClassVar[
+        typing.Optional[
+            typing.Dict[
+                str,
+                typing.Tuple[typing.Optional[str], typing.Optional[typing.Callable]],
+            ]
+        ]
+    ] = None
+
+    @classmethod
+    def _json_table(
+        cls,
+    ) -> typing.Optional[
+        typing.Dict[
+            str,
+            typing.Tuple[typing.Optional[str], typing.Optional[typing.Callable]],
+        ]
+    ]:
+        """
+        _json_fields of the class that defines from_json, None if it has no table.
+        (_json_fields класса, который определяет from_json, None, если у него нет таблицы.)
+        """
+        for klass in cls.__mro__:
+            if "from_json" in klass.__dict__:
+                return klass.__dict__.get("_json_fields")
+        return None
+
+    @classmethod
+    def _lazy_class(cls) -> type:
+        lazy_class = cls.__dict__.get("_lazy_view_class")
+        if lazy_class is None:
+            fields = _lazy_fields(cls)
+            namespace = {
+                "__slots__": ("_raw", "_cache"),
+                "__module__": cls.__module__,
+                "_model": cls,
+            }
+            namespace.update(fields or {})
+            lazy_class = type(f"Lazy{cls.__name__}", (_LazyModelMixin, cls), namespace)
+            cls._lazy_view_class = lazy_class
+        return lazy_class
+
+    @classmethod
+    def lazy_from_json(cls, dict_data: dict) -> "MoySkladBaseClass":
+        """
+        Like from_json, but returns a lazy view (an instance of a subclass of cls) that keeps dict_data
+        and converts each field on first access. Useful for large lists where only a few fields are read.
+        (Как from_json, но возвращает ленивое представление (экземпляр подкласса cls), которое хранит dict_data
+        и преобразует каждое поле при первом обращении. Полезно для больших списков, из которых читается несколько полей.)
+        """
+        instance = object.__new__(cls._lazy_class())
+        instance._raw = dict_data
+        instance._cache = None
+        return instance
+
+    @classmethod
+    def projector(
+        cls, fields: typing.Sequence[str], named: bool = False
+    ) -> typing.Callable[[dict], tuple]:
+        """
+        Returns a function that converts a raw dict into a tuple (or a namedtuple if named) of the given fields,
+        converted the same way as by from_json (see _json_fields), without building the model. Functions are cached per fields.
+        Fields are model field names; JSON names (salePrices) are accepted for snake_case fields (sale_prices).
+        (Возвращает функцию, которая преобразует исходный словарь в кортеж (или namedtuple, если named) указанных полей,
+        преобразованных так же, как в from_json (см. _json_fields), без создания модели. Функции кэшируются по списку полей.
+        Поля - имена полей модели; JSON имена (salePrices) принимаются для полей в snake_case (sale_prices).)
+
+        :raises ValueError: if the model has no such field (если у модели нет такого поля)
+        """
+        key = (tuple(fields), named)
+        projections = cls.__dict__.get("_projections")
+        if projections is None:
+            projections = cls._projections = {}
+        project = projections.get(key)
+        if project is None:
+            resolved = []
+            unknown = []
+            for field in fields:
+                if field not in cls._fields:
+                    field = _camel_to_snake(field)
+                if field not in cls._fields:
+                    unknown.append(field)
+                resolved.append(field)
+            if unknown or not resolved:
+                raise ValueError(
+                    f"Unknown fields for {cls.__name__}: {', '.join(unknown) or '(none given)'}. "
+                    f"Known fields: {', '.join(cls._fields)}"
+                )
+            if len(set(resolved)) != len(resolved):
+                raise ValueError(f"Duplicate fields: {', '.join(resolved)}")
+            project = projections[key] = _make_projection(cls, tuple(resolved), named)
+        return project
+
+    @property
+    def __dict__(self) -> dict:
+        """
+        Models use __slots__, this returns a new dict of the fields that are set, so code that reads __dict__ or vars() keeps working.
+        (Модели используют __slots__, возвращает новый словарь заданных полей, чтобы код, читающий __dict__ или vars(), продолжал работать.)
+        """
+        result = {}
+        for field in self._fields:
+            try:
+                result[field] = getattr(self, field)
+            except AttributeError:
+                pass
+        return result
+
+    def __getstate__(self):
+        return self.__dict__
+
+    def __setstate__(self, state: dict):
+        for field, value in state.items():
+            setattr(self, field, value)
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}("
@@ -111,7 +451,179 @@ class RequestData:
         return kwargs
 
 
+OutputMode = typing.Literal["model", "lazy", "raw", "tuple", "namedtuple"]
+
+# maximum nesting of expand, "positions.assortment.uom" (максимальная вложенность expand)
+MAX_EXPAND_DEPTH = 3
+# maximum limit of list requests with expand, larger limits make the API ignore expand
+# (максимальный limit списков с expand, при большем limit API игнорирует expand)
+MAX_EXPAND_LIMIT = 100
+_EXPAND_PATH_RE = re.compile(r"\w+(?:\.\w+)*")
+
+# True while the response of a request with expand is converted, see helpers.get_meta
+# (True, пока преобразуется ответ запроса с expand, см. helpers.get_meta)
+build_expanded: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "build_expanded", default=False
+)
+
+
+def merge_param(params: dict, name: str, value: str) -> None:
+    """
+    Adds a filter-like value to params[name]: joined with ";" to a string, appended to a list
+    (repeated parameters, for example filter of the current stock reports).
+    (Добавляет значение вида фильтра к params[name]: через ";" к строке, в конец списка
+    (повторяющиеся параметры, например filter отчетов о текущих остатках).)
+    """
+    current = params.get(name)
+    if isinstance(current, list):
+        params[name] = current + [value]
+    elif current:
+        params[name] = f"{current};{value}"
+    else:
+        params[name] = value
+
+
 class ApiRequest(abc.ABC):
+    # how rows of list responses are returned, see set_output()
+    # (в каком виде возвращаются строки списков, см. set_output())
+    output: OutputMode = "model"
+    output_fields: typing.Optional[typing.Tuple[str, ...]] = None
+    # expand parameter, see set_expand() (параметр expand, см. set_expand())
+    expand_paths: typing.Optional[str] = None
+    # filter and order, see set_query() (filter и order, см. set_query())
+    query = None
+
+    def set_output(
+        self,
+        output: OutputMode,
+        fields: typing.Optional[typing.Sequence[str]] = None,
+    ) -> "ApiRequest":
+        """
+        Choose how rows of a list response are returned by from_response.
+        (Выбрать, в каком виде from_response возвращает строки списка.)
+
+        "model" - models built with from_json (модели, созданные from_json)
+        "lazy" - lazy views, fields are converted on first access (ленивые представления, поля преобразуются при первом обращении)
+        "raw" - the dicts of the response as is (словари из ответа как есть)
+        "tuple" - tuples of the given fields (кортежи указанных полей)
+        "namedtuple" - namedtuples of the given fields (namedtuple указанных полей)
+
+        :param output: Output mode (Режим вывода)
+        :param fields: Fields for "tuple" and "namedtuple", see MoySkladBaseClass.projector (Поля для "tuple" и "namedtuple", см. MoySkladBaseClass.projector)
+        :return: self, so it can be chained: client(GetSuppliesRequest().set_output("lazy"))
+        """
+        if output not in typing.get_args(OutputMode):
+            raise ValueError(f"Unknown output mode: {output}")
+        if output in ("tuple", "namedtuple"):
+            if not fields:
+                raise ValueError(f"Output mode {output} requires fields")
+            if isinstance(fields, str):
+                raise ValueError("fields must be a sequence of field names")
+            fields = tuple(fields)
+        elif fields is not None:
+            raise ValueError(f"Output mode {output} does not take fields")
+        self.output = output
+        self.output_fields = fields
+        return self
+
+    def parse_rows(
+        self, model: typing.Type["MoySkladBaseClass"], rows: typing.List[dict]
+    ) -> list:
+        """
+        Converts rows of a list response according to the output mode.
+        (Преобразует строки списка согласно режиму вывода.)
+        """
+        output = self.output
+        if output == "lazy" and not self.expand_paths:
+            return [model.lazy_from_json(row) for row in rows]
+        if output == "model" or output == "lazy":
+            # with expand lazy views are not used, their fields would be converted after parse_response
+            # (с expand ленивые представления не используются, их поля преобразовывались бы после parse_response)
+            return [model.from_json(row) for row in rows]
+        if output == "raw":
+            return rows
+        project = model.projector(self.output_fields, named=output == "namedtuple")
+        return [project(row) for row in rows]
+
+    def set_expand(self, *paths: str) -> "ApiRequest":
+        """
+        Ask the API to return the given references as full objects instead of metas.
+        They are converted to models of their types (found by meta.href), expanded positions - to lists of position models.
+        For list requests limit is reduced to 100, the API does not expand larger pages.
+        (Запросить у API указанные ссылки целыми объектами вместо meta.
+        Они преобразуются в модели своих типов (по meta.href), раскрытые позиции - в списки моделей позиций.
+        Для списков limit уменьшается до 100, API не раскрывает большие страницы.)
+
+        Example:
+        client(GetSupplyRequest(id_).set_expand("agent", "store", "positions.assortment"))
+
+        :param paths: Field paths in API names, up to 3 levels, "a,b" is also accepted
+         (Пути полей в именах API, до 3 уровней, также принимается "a,b")
+        :return: self
+        """
+        expand = []
+        for path in paths:
+            for part in path.split(","):
+                part = part.strip()
+                if not _EXPAND_PATH_RE.fullmatch(part):
+                    raise ValueError(f"Invalid expand path: {part!r}")
+                if part.count(".") >= MAX_EXPAND_DEPTH:
+                    raise ValueError(
+                        f"expand supports at most {MAX_EXPAND_DEPTH} levels: {part}"
+                    )
+                if part not in expand:
+                    expand.append(part)
+        self.expand_paths = ",".join(expand) or None
+        return self
+
+    def set_query(self, query) -> "ApiRequest":
+        """
+        Filter and sort on the server with a moysklad_api.query.Query. Its filter is added to the filter
+        of the request (if any), its order is added to the order of the request.
+        (Фильтрация и сортировка на сервере с помощью moysklad_api.query.Query. Ее фильтр добавляется к фильтру
+        запроса (если есть), ее сортировка - к сортировке запроса.)
+
+        Example:
+        client(GetProductListRequest().set_query(Query(Product).where(F("updated") >= since)))
+
+        :return: self
+        """
+        self.query = query
+        return self
+
+    def build_request(self) -> RequestData:
+        """
+        to_request() with the options of the base class (expand, query) applied. Used by the client.
+        (to_request() с примененными параметрами базового класса (expand, query). Используется клиентом.)
+        """
+        request_data = self.to_request()
+        if self.query is not None:
+            params = dict(request_data.params or {})
+            for name, value in self.query.to_params().items():
+                merge_param(params, name, value)
+            request_data.params = params
+        if self.expand_paths:
+            params = dict(request_data.params or {})
+            params["expand"] = self.expand_paths
+            limit = params.get("limit")
+            if isinstance(limit, int) and limit > MAX_EXPAND_LIMIT:
+                params["limit"] = MAX_EXPAND_LIMIT
+            request_data.params = params
+        return request_data
+
+    def parse_response(self, result):
+        """
+        from_response, with expanded references converted to models if expand is set.
+        (from_response, с преобразованием раскрытых ссылок в модели, если задан expand.)
+        """
+        if not self.expand_paths:
+            return self.from_response(result)
+        token = build_expanded.set(True)
+        try:
+            return self.from_response(result)
+        finally:
+            build_expanded.reset(token)
+
     @abc.abstractmethod
     def to_request(self) -> RequestData:
         raise NotImplementedError
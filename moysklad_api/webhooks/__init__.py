@@ -0,0 +1,18 @@
+from .receiver import (
+    WebhookReceiver,
+    WebhookEvent,
+    WebhookBatch,
+    WebhookStats,
+    parse_webhook,
+)
+from .stock import WebhookStockConsumer, StockConsumerStats
+
+__all__ = [
+    "WebhookReceiver",
+    "WebhookEvent",
+    "WebhookBatch",
+    "WebhookStats",
+    "parse_webhook",
+    "WebhookStockConsumer",
+    "StockConsumerStats",
+]
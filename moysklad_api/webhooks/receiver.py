@@ -0,0 +1,465 @@
+import asyncio
+import collections
+import datetime
+import inspect
+import time
+import typing
+
+from aiohttp import web
+
+from .. import types, helpers
+from ..api import bulk as bulk_api
+
+if typing.TYPE_CHECKING:
+    from ..client import MoySkladClient
+
+WebhookAction = typing.Literal["CREATE", "UPDATE", "DELETE", "PROCESSED"]
+# MoySklad waits 1500 ms for the answer (MoySklad ждет ответа 1500 мс)
+DEFAULT_RESPONSE_TIMEOUT = 1.0
+# ids per list request when changed objects are fetched (id на один запрос списка при загрузке измененных объектов)
+_FETCH_CHUNK_SIZE = 100
+# queue marker: send all collected batches now (маркер очереди: отправить все собранные пачки сейчас)
+_FLUSH = object()
+
+
+class WebhookEvent:
+    """
+    One event of a webhook request.
+    (Одно событие запроса вебхука.)
+    """
+
+    __slots__ = (
+        "entity_type",
+        "id",
+        "href",
+        "action",
+        "updated_fields",
+        "account_id",
+        "moment",
+        "uid",
+    )
+
+    def __init__(
+        self,
+        entity_type: str,
+        id_: str,
+        href: str,
+        action: WebhookAction,
+        updated_fields: typing.Optional[typing.List[str]] = None,
+        account_id: typing.Optional[str] = None,
+        moment: typing.Optional[datetime.datetime] = None,
+        uid: typing.Optional[str] = None,
+    ):
+        self.entity_type = entity_type
+        self.id = id_
+        self.href = href
+        self.action = action
+        self.updated_fields = updated_fields
+        self.account_id = account_id
+        self.moment = moment
+        self.uid = uid
+
+    def key(self) -> tuple:
+        """
+        Identity of the event, repeated deliveries have the same key.
+        (Идентичность события, у повторных доставок одинаковый ключ.)
+        """
+        return (
+            self.href,
+            self.action,
+            self.moment,
+            tuple(self.updated_fields or ()),
+        )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(entity_type={self.entity_type!r}, id={self.id!r}, "
+            f"action={self.action!r}, moment={self.moment!r})"
+        )
+
+
+def parse_webhook(payload: dict) -> typing.List[WebhookEvent]:
+    """
+    Parses a webhook request body: {"auditContext": {...}, "events": [{"meta": ..., "action": ..., "updatedFields": ...}]}.
+    (Разбирает тело запроса вебхука.)
+    """
+    context = payload.get("auditContext") or {}
+    moment = helpers.parse_date(context.get("moment"))
+    events = []
+    for event in payload.get("events") or []:
+        meta = event.get("meta") or {}
+        href = meta.get("href")
+        if not href or not meta.get("type"):
+            continue
+        events.append(
+            WebhookEvent(
+                meta["type"],
+                href.split("?", 1)[0].rstrip("/").rsplit("/", 1)[1],
+                href,
+                event.get("action"),
+                event.get("updatedFields"),
+                event.get("accountId"),
+                moment,
+                context.get("uid"),
+            )
+        )
+    return events
+
+
+class WebhookBatch:
+    """
+    Events of one entity type collected by WebhookReceiver. objects are the fetched CREATE/UPDATE objects
+    by id, if the receiver fetches them (deleted or not found objects are missing).
+    (События одного типа сущности, собранные WebhookReceiver. objects - загруженные объекты событий CREATE/UPDATE
+    по id, если получатель их загружает (удаленных и не найденных объектов нет).)
+    """
+
+    __slots__ = ("entity_type", "events", "objects")
+
+    def __init__(
+        self,
+        entity_type: str,
+        events: typing.List[WebhookEvent],
+        objects: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ):
+        self.entity_type = entity_type
+        self.events = events
+        self.objects = objects
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(entity_type={self.entity_type!r}, "
+            f"events={len(self.events)})"
+        )
+
+
+WebhookHandler = typing.Callable[[WebhookBatch], typing.Awaitable[typing.Any]]
+
+
+class WebhookStats:
+    """
+    Counters of WebhookReceiver.
+    (Счетчики WebhookReceiver.)
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.events = 0
+        self.duplicates = 0
+        # events without meta.href or meta.type (события без meta.href или meta.type)
+        self.invalid = 0
+        self.rejected = 0
+        self.batches = 0
+        self.errors = 0
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            + ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+            + ")"
+        )
+
+
+class WebhookReceiver:
+    """
+    aiohttp.web handler for MoySklad webhooks. Requests are answered right after their events are queued,
+    repeated deliveries within dedupe_window are dropped, events are collected per entity type for batch_window
+    seconds (or up to max_batch_size) and the batches are passed to the registered handlers by a pool of workers.
+    When the workers fall behind the queue fills up, and a request that can not be queued within response_timeout
+    is answered with 503, so MoySklad always gets an answer in time.
+    (Обработчик aiohttp.web для вебхуков MoySklad. На запросы отвечается сразу после постановки их событий в очередь,
+    повторные доставки в пределах dedupe_window отбрасываются, события собираются по типам сущностей batch_window
+    секунд (или до max_batch_size) и пачки передаются зарегистрированным обработчикам пулом воркеров.
+    Когда воркеры не успевают, очередь заполняется, и запрос, который не удалось поставить в очередь за response_timeout,
+    получает ответ 503, поэтому MoySklad всегда вовремя получает ответ.)
+
+    Example:
+    receiver = WebhookReceiver(client, fetch=True)
+
+    @receiver.on("product", actions=("CREATE", "UPDATE"))
+    async def products_changed(batch):
+        for id_, product in batch.objects.items():
+            ...
+
+    app = web.Application()
+    receiver.setup(app, "/moysklad/webhook")
+    web.run_app(app)
+    """
+
+    def __init__(
+        self,
+        client: typing.Optional["MoySkladClient"] = None,
+        fetch: bool = False,
+        fetch_output: types.OutputMode = "model",
+        dedupe_window: float = 60.0,
+        batch_window: float = 0.5,
+        max_batch_size: int = 100,
+        workers: int = 4,
+        queue_size: int = 10000,
+        response_timeout: float = DEFAULT_RESPONSE_TIMEOUT,
+        on_error: typing.Optional[
+            typing.Callable[[WebhookBatch, Exception], typing.Any]
+        ] = None,
+    ):
+        """
+
+        :param client: Client used to fetch changed objects (Клиент для загрузки измененных объектов)
+        :param fetch: Fetch the CREATE/UPDATE objects of a batch, one filtered list request per type
+         (Загружать объекты CREATE/UPDATE пачки, одним запросом списка с фильтром на тип)
+        :param fetch_output: "model", "lazy" or "raw" for the fetched objects ("model", "lazy" или "raw" для загруженных объектов)
+        :param dedupe_window: How long delivered events are remembered, seconds (Сколько помнить доставленные события, секунды)
+        :param batch_window: How long to collect events of a type, seconds (Сколько собирать события одного типа, секунды)
+        :param max_batch_size: Maximum number of events in a batch (Максимальное количество событий в пачке)
+        :param workers: Number of batches handled at once (Количество одновременно обрабатываемых пачек)
+        :param queue_size: Maximum number of queued events (Максимальное количество событий в очереди)
+        :param response_timeout: How long a request may wait for queue space, seconds
+         (Сколько запрос может ждать места в очереди, секунды)
+        :param on_error: Called (sync or async) with the batch and the exception when a handler fails
+         (Вызывается (синхронно или асинхронно) с пачкой и исключением, когда обработчик завершился ошибкой)
+        """
+        if fetch and client is None:
+            raise ValueError("fetch requires a client")
+        if fetch_output not in ("model", "lazy", "raw"):
+            raise ValueError(f"Unsupported fetch_output: {fetch_output}")
+        if workers < 1 or max_batch_size < 1:
+            raise ValueError("workers and max_batch_size must be >= 1")
+        self._client = client
+        self.fetch = fetch
+        self.fetch_output = fetch_output
+        self.dedupe_window = dedupe_window
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.workers = workers
+        self.queue_size = queue_size
+        self.response_timeout = response_timeout
+        self._on_error = on_error
+        self._handlers: typing.List[
+            typing.Tuple[
+                WebhookHandler,
+                typing.Optional[typing.FrozenSet[str]],
+                typing.Optional[typing.FrozenSet[str]],
+            ]
+        ] = []
+        # event key -> expires at, in order of arrival (ключ события -> истекает в, в порядке поступления)
+        self._seen: "collections.OrderedDict[tuple, float]" = collections.OrderedDict()
+        self._events: typing.Optional[asyncio.Queue] = None
+        self._batches: typing.Optional[asyncio.Queue] = None
+        self._tasks: typing.List[asyncio.Task] = []
+        self.stats = WebhookStats()
+
+    def add_handler(
+        self,
+        handler: WebhookHandler,
+        entity_types: typing.Optional[typing.Iterable[str]] = None,
+        actions: typing.Optional[typing.Iterable[WebhookAction]] = None,
+    ) -> None:
+        """
+        Registers an async handler of batches. A batch is passed with only the events of the given actions.
+        (Регистрирует асинхронный обработчик пачек. Пачка передается только с событиями указанных действий.)
+
+        :param entity_types: Types to handle, all if None (Обрабатываемые типы, все если None)
+        :param actions: Actions to handle, all if None (Обрабатываемые действия, все если None)
+        """
+        self._handlers.append(
+            (
+                handler,
+                frozenset(entity_types) if entity_types is not None else None,
+                frozenset(actions) if actions is not None else None,
+            )
+        )
+
+    def on(
+        self,
+        *entity_types: str,
+        actions: typing.Optional[typing.Iterable[WebhookAction]] = None,
+    ) -> typing.Callable[[WebhookHandler], WebhookHandler]:
+        """
+        Decorator form of add_handler.
+        (Декоратор для add_handler.)
+        """
+
+        def decorator(handler: WebhookHandler) -> WebhookHandler:
+            self.add_handler(handler, entity_types or None, actions)
+            return handler
+
+        return decorator
+
+    def setup(self, app: web.Application, path: str = "/webhook") -> None:
+        """
+        Adds the POST route and starts / stops the workers with the application.
+        (Добавляет маршрут POST и запускает / останавливает воркеры вместе с приложением.)
+        """
+        app.router.add_post(path, self.handle)
+
+        async def on_startup(_):
+            await self.start()
+
+        async def on_cleanup(_):
+            await self.stop()
+
+        app.on_startup.append(on_startup)
+        app.on_cleanup.append(on_cleanup)
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._events = asyncio.Queue(maxsize=self.queue_size)
+        self._batches = asyncio.Queue(maxsize=self.workers)
+        self._tasks = [asyncio.ensure_future(self._collect())] + [
+            asyncio.ensure_future(self._work()) for _ in range(self.workers)
+        ]
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stops the workers. With drain, the queued events are handled first.
+        (Останавливает воркеры. С drain сначала обрабатываются события из очереди.)
+        """
+        if not self._tasks:
+            return
+        if drain:
+            # pending batches are sent without waiting for batch_window
+            # (собранные пачки отправляются, не дожидаясь batch_window)
+            await self._events.put(_FLUSH)
+            await self._events.join()
+            await self._batches.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _is_duplicate(self, event: WebhookEvent) -> bool:
+        now = time.monotonic()
+        while self._seen and next(iter(self._seen.values())) < now:
+            self._seen.popitem(last=False)
+        key = event.key()
+        if key in self._seen:
+            return True
+        self._seen[key] = now + self.dedupe_window
+        return False
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """
+        aiohttp.web handler of webhook requests.
+        (Обработчик запросов вебхуков для aiohttp.web.)
+        """
+        if not self._tasks:
+            raise RuntimeError("WebhookReceiver is not started, call start() or setup()")
+        self.stats.requests += 1
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=400)
+        if not isinstance(payload, dict):
+            return web.Response(status=400)
+        return await self.accept(payload)
+
+    async def accept(self, payload: dict) -> web.Response:
+        """
+        Queues the events of a parsed webhook request body and returns the answer for MoySklad.
+        (Ставит в очередь события разобранного тела запроса вебхука и возвращает ответ для MoySklad.)
+        """
+        parsed = parse_webhook(payload)
+        events = [x for x in parsed if not self._is_duplicate(x)]
+        self.stats.events += len(events)
+        self.stats.duplicates += len(parsed) - len(events)
+        self.stats.invalid += len(payload.get("events") or []) - len(parsed)
+        deadline = time.monotonic() + self.response_timeout
+        for i, event in enumerate(events):
+            try:
+                self._events.put_nowait(event)
+            except asyncio.QueueFull:
+                try:
+                    await asyncio.wait_for(
+                        self._events.put(event), max(deadline - time.monotonic(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    # the rest is forgotten, so a repeated delivery is not dropped as a duplicate
+                    # (остальные забываются, чтобы повторная доставка не была отброшена как дубликат)
+                    for rest in events[i:]:
+                        self._seen.pop(rest.key(), None)
+                    self.stats.rejected += len(events) - i
+                    return web.Response(status=503)
+        return web.Response(status=200)
+
+    async def _collect(self) -> None:
+        pending: typing.Dict[str, typing.List[WebhookEvent]] = {}
+        deadlines: typing.Dict[str, float] = {}
+        while True:
+            timeout = (
+                max(min(deadlines.values()) - time.monotonic(), 0) if deadlines else None
+            )
+            try:
+                event = await asyncio.wait_for(self._events.get(), timeout)
+            except asyncio.TimeoutError:
+                event = None
+            flush = event is _FLUSH
+            if event is not None and not flush:
+                events = pending.setdefault(event.entity_type, [])
+                if not events:
+                    deadlines[event.entity_type] = time.monotonic() + self.batch_window
+                events.append(event)
+            now = time.monotonic()
+            for entity_type in list(pending):
+                if (
+                    flush
+                    or len(pending[entity_type]) >= self.max_batch_size
+                    or deadlines[entity_type] <= now
+                ):
+                    del deadlines[entity_type]
+                    await self._batches.put(
+                        WebhookBatch(entity_type, pending.pop(entity_type))
+                    )
+            if event is not None:
+                self._events.task_done()
+
+    async def _work(self) -> None:
+        while True:
+            batch = await self._batches.get()
+            try:
+                await self._dispatch(batch)
+            except Exception as e:
+                self.stats.errors += 1
+                if self._on_error is not None:
+                    try:
+                        result = self._on_error(batch, e)
+                        if inspect.isawaitable(result):
+                            await result
+                    except Exception:
+                        # a failing error callback must not stop the worker
+                        # (ошибка в функции обработки ошибок не должна останавливать воркер)
+                        pass
+            finally:
+                self._batches.task_done()
+
+    async def _fetch(self, batch: WebhookBatch) -> typing.Dict[str, typing.Any]:
+        ids = list(
+            dict.fromkeys(
+                event.id
+                for event in batch.events
+                if event.action in ("CREATE", "UPDATE")
+            )
+        )
+        if not ids or types.get_model_class((batch.entity_type,)) is None:
+            return {}
+        objects = {}
+        for start in range(0, len(ids), _FETCH_CHUNK_SIZE):
+            request = bulk_api.GetByIdsRequest(
+                batch.entity_type, ids[start : start + _FETCH_CHUNK_SIZE]
+            ).set_output(self.fetch_output)
+            for obj in await self._client(request):
+                objects[obj["id"] if isinstance(obj, dict) else obj.id] = obj
+        return objects
+
+    async def _dispatch(self, batch: WebhookBatch) -> None:
+        self.stats.batches += 1
+        if self.fetch:
+            batch.objects = await self._fetch(batch)
+        for handler, entity_types, actions in self._handlers:
+            if entity_types is not None and batch.entity_type not in entity_types:
+                continue
+            events = batch.events
+            if actions is not None:
+                events = [x for x in events if x.action in actions]
+                if not events:
+                    continue
+            await handler(WebhookBatch(batch.entity_type, events, batch.objects))
@@ -0,0 +1,285 @@
+import asyncio
+import collections
+import inspect
+import time
+import typing
+
+from aiohttp import web
+
+from .. import helpers
+from ..api.reports import stock as stock_api
+from ..mirror import StockTable, StockChange
+from ..mirror.stock import MAX_CHANGED_SINCE
+from ..sync import send_event
+
+if typing.TYPE_CHECKING:
+    from ..client import MoySkladClient
+
+# latencies kept for the percentiles (задержки, хранимые для перцентилей)
+DEFAULT_LATENCY_SAMPLES = 1000
+# delay before fetching a failed report again, doubled up to MAX_RETRY_DELAY
+# (задержка перед повторной загрузкой неудавшегося отчета, удваивается до MAX_RETRY_DELAY)
+DEFAULT_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+
+class StockConsumerStats:
+    """
+    Counters of WebhookStockConsumer. Latency is the time from receiving a notification to applying its report,
+    seconds, the last latency_samples values are kept for latency().
+    (Счетчики WebhookStockConsumer. Задержка - время от получения уведомления до применения его отчета,
+    в секундах, последние latency_samples значений хранятся для latency().)
+    """
+
+    def __init__(self, latency_samples: int = DEFAULT_LATENCY_SAMPLES):
+        self.notifications = 0
+        self.coalesced = 0
+        self.fetches = 0
+        self.rows = 0
+        self.changes = 0
+        self.errors = 0
+        self.max_latency = 0.0
+        self.latencies: typing.Deque[float] = collections.deque(maxlen=latency_samples)
+
+    def add_latency(self, seconds: float) -> None:
+        self.latencies.append(seconds)
+        self.max_latency = max(self.max_latency, seconds)
+
+    def latency(self, percentile: float = 50) -> typing.Optional[float]:
+        """
+        Percentile (0 - 100) of the recent latencies, None if there are none.
+        (Перцентиль (0 - 100) последних задержек, None если их нет.)
+        """
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(int(len(ordered) * percentile / 100), len(ordered) - 1)
+        return ordered[index]
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(notifications={self.notifications!r}, "
+            f"coalesced={self.coalesced!r}, fetches={self.fetches!r}, rows={self.rows!r}, "
+            f"changes={self.changes!r}, errors={self.errors!r}, p50={self.latency(50)!r}, "
+            f"p95={self.latency(95)!r}, max_latency={self.max_latency!r})"
+        )
+
+
+class _PendingReport:
+    __slots__ = ("request", "received")
+
+    def __init__(
+        self, request: stock_api.GetSmallStockReportByUrlRequest, received: float
+    ):
+        self.request = request
+        self.received = [received]
+
+    def merge(
+        self, request: stock_api.GetSmallStockReportByUrlRequest, received: float
+    ) -> None:
+        """
+        Widens the window to cover both reports: the earliest changedSince, or none at all.
+        (Расширяет окно, чтобы покрыть оба отчета: самый ранний changedSince, или без него.)
+        """
+        ours = helpers.parse_date(self.request.params.get("changedSince"))
+        theirs = helpers.parse_date(request.params.get("changedSince"))
+        if ours is None or theirs is None:
+            self.request.params.pop("changedSince", None)
+        elif theirs < ours:
+            self.request.params["changedSince"] = request.params["changedSince"]
+        self.received.append(received)
+
+    def merge_pending(self, other: "_PendingReport") -> None:
+        self.merge(other.request, other.received[0])
+        self.received.extend(other.received[1:])
+
+
+class WebhookStockConsumer:
+    """
+    Receives stock webhook notifications (see CreateWebhookStockRequest), fetches their reportUrl through the client
+    and applies the rows to a StockTable. Notifications of the same report type and stock type that arrive while
+    a report is waiting or being fetched are merged into one request covering all their changedSince windows.
+    (Получает уведомления вебхуков на остатки (см. CreateWebhookStockRequest), загружает их reportUrl через клиент
+    и применяет строки к StockTable. Уведомления одного типа отчета и типа остатка, пришедшие, пока отчет ожидает
+    или загружается, объединяются в один запрос, покрывающий все их окна changedSince.)
+
+    Example:
+    consumer = WebhookStockConsumer(client, sink=on_stock_change)
+    consumer.setup(app, "/moysklad/stock")
+    ...
+    consumer.table.get(product_id, store_id), consumer.stats.latency(95)
+    """
+
+    def __init__(
+        self,
+        client: "MoySkladClient",
+        table: typing.Optional[StockTable] = None,
+        sink: typing.Optional[
+            typing.Union[typing.Callable[[StockChange], typing.Any], asyncio.Queue]
+        ] = None,
+        coalesce_window: float = 0.2,
+        latency_samples: int = DEFAULT_LATENCY_SAMPLES,
+        on_error: typing.Optional[typing.Callable[[Exception], typing.Any]] = None,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ):
+        """
+
+        :param client: Client used to fetch the reports (Клиент для загрузки отчетов)
+        :param table: Table to update, a new one by default (Обновляемая таблица, по умолчанию новая)
+        :param sink: Callback (sync or async) or asyncio.Queue receiving StockChanges
+         (Функция (синхронная или асинхронная) или asyncio.Queue, получающие StockChange)
+        :param coalesce_window: How long to wait for more notifications before fetching, seconds
+         (Сколько ждать другие уведомления перед загрузкой, секунды)
+        :param latency_samples: Number of recent latencies kept (Количество хранимых последних задержек)
+        :param on_error: Called (sync or async) with the exception when a report can not be fetched or applied,
+         or the sink fails (Вызывается (синхронно или асинхронно) с исключением, когда отчет не удалось загрузить
+         или применить, или получатель завершился с ошибкой)
+        :param retry_delay: First delay before a failed report is fetched again, doubled after every failure
+         up to 60 seconds (Первая задержка перед повторной загрузкой неудавшегося отчета, удваивается после каждой
+         ошибки до 60 секунд)
+        """
+        self._client = client
+        self.table = table if table is not None else StockTable()
+        self._sink = sink
+        self.coalesce_window = coalesce_window
+        self._on_error = on_error
+        self.retry_delay = retry_delay
+        self._pending: typing.Dict[typing.Tuple[str, str], _PendingReport] = {}
+        self._running: typing.Dict[typing.Tuple[str, str], asyncio.Task] = {}
+        self.stats = StockConsumerStats(latency_samples)
+
+    def setup(self, app: web.Application, path: str = "/webhookstock") -> None:
+        """
+        Adds the POST route and stops the fetches with the application.
+        (Добавляет маршрут POST и останавливает загрузки вместе с приложением.)
+        """
+        app.router.add_post(path, self.handle)
+
+        async def on_cleanup(_):
+            await self.stop()
+
+        app.on_cleanup.append(on_cleanup)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """
+        aiohttp.web handler of stock webhook requests.
+        (Обработчик запросов вебхуков на остатки для aiohttp.web.)
+        """
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=400)
+        if not isinstance(payload, dict):
+            return web.Response(status=400)
+        return self.accept(payload)
+
+    def accept(self, payload: dict) -> web.Response:
+        """
+        Schedules the report of a parsed notification body ({"reportUrl": ..., ...}) and returns the answer for MoySklad.
+        (Планирует загрузку отчета разобранного тела уведомления и возвращает ответ для MoySklad.)
+        """
+        try:
+            request = stock_api.GetSmallStockReportByUrlRequest(payload["reportUrl"])
+        except (KeyError, TypeError, ValueError):
+            return web.Response(status=400)
+        self.stats.notifications += 1
+        received = time.monotonic()
+        key = request.report_type, request.params.get("stockType", "stock")
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = _PendingReport(request, received)
+        else:
+            pending.merge(request, received)
+            self.stats.coalesced += 1
+        if key not in self._running:
+            self._running[key] = asyncio.ensure_future(self._run(key))
+        return web.Response(status=200)
+
+    async def _report_error(self, error: Exception) -> None:
+        if self._on_error is None:
+            return
+        try:
+            result = self._on_error(error)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            # a failing error callback must not stop the fetches
+            # (ошибка в функции обработки ошибок не должна останавливать загрузки)
+            pass
+
+    def _retry_later(self, key: typing.Tuple[str, str], pending: _PendingReport) -> None:
+        newer = self._pending.get(key)
+        if newer is not None:
+            pending.merge_pending(newer)
+        if time.monotonic() - pending.received[0] >= MAX_CHANGED_SINCE.total_seconds():
+            # changedSince is too old for the API now, fetch the whole report
+            # (changedSince теперь слишком старый для API, загружаем весь отчет)
+            pending.request.params.pop("changedSince", None)
+        self._pending[key] = pending
+
+    async def _apply(
+        self,
+        request: stock_api.GetSmallStockReportByUrlRequest,
+        rows: typing.List[dict],
+        received: typing.List[float],
+    ) -> None:
+        changes = self.table.apply_rows(rows)
+        if "changedSince" not in request.params:
+            # the whole report has no zero lines, the cells missing from it are cleared as in StockTracker.full_sync
+            # (во всем отчете нет нулевых строк, отсутствующие в нем ячейки обнуляются, как в StockTracker.full_sync)
+            by_store = request.report_type != "all"
+            keys = {(row["assortmentId"], row.get("storeId")) for row in rows}
+            changes.extend(self.table.clear_except(keys, by_store))
+        self.stats.changes += len(changes)
+        applied = time.monotonic()
+        for moment in received:
+            self.stats.add_latency(applied - moment)
+        if self._sink is not None:
+            for change in changes:
+                try:
+                    await send_event(self._sink, change)
+                except Exception as e:
+                    # the other changes are still sent (остальные изменения все равно отправляются)
+                    self.stats.errors += 1
+                    await self._report_error(e)
+
+    async def _run(self, key: typing.Tuple[str, str]) -> None:
+        delay = self.retry_delay
+        try:
+            while key in self._pending:
+                await asyncio.sleep(self.coalesce_window)
+                pending = self._pending.pop(key)
+                try:
+                    rows = await self._client(pending.request.set_output("raw"))
+                except Exception as e:
+                    self.stats.errors += 1
+                    # the notifications are not lost, they are merged with the newer ones and fetched again
+                    # (уведомления не теряются, они объединяются с более новыми и загружаются повторно)
+                    self._retry_later(key, pending)
+                    await self._report_error(e)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, MAX_RETRY_DELAY)
+                    continue
+                delay = self.retry_delay
+                self.stats.fetches += 1
+                self.stats.rows += len(rows)
+                try:
+                    await self._apply(pending.request, rows, pending.received)
+                except Exception as e:
+                    # a bad report must not stop the fetches, it is not fetched again
+                    # (ошибочный отчет не должен останавливать загрузки, он не загружается повторно)
+                    self.stats.errors += 1
+                    await self._report_error(e)
+        finally:
+            self._running.pop(key, None)
+
+    async def stop(self) -> None:
+        """
+        Cancels the waiting and running fetches.
+        (Отменяет ожидающие и выполняющиеся загрузки.)
+        """
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._pending.clear()
@@ -92,6 +92,15 @@ class PyType(enum.StrEnum):
             )
         return done
 
+    def to_json_field(self, snake_name: str, json_name: str):
+        converter = "None"
+        if snake_name != "meta":
+            if self == PyType.meta:
+                converter = "helpers.get_meta"
+            elif self == PyType.datetime:
+                converter = "helpers.parse_date"
+        return f'"{snake_name}": ("{json_name}", {converter}),'
+
     def to_request_put_in_json(self, snake_name):
         if self == PyType.meta:
             load = f'{{"meta": self.{snake_name}}}'
@@ -352,6 +361,9 @@ class TableField:
     def from_json_line(self, prefix="\t\t") -> str:
         return prefix + self.type.to_json_parse(self.snake_case_name, self.name)
 
+    def json_field_line(self, prefix="\t\t") -> str:
+        return prefix + self.type.to_json_field(self.snake_case_name, self.name)
+
     # as a request
     def create_param_str(self, prefix="\t\t\t"):
         if self.read_only:
@@ -472,6 +484,11 @@ class Table:
         ret += "\n"
 
         prefix = "\t"
+        ret += prefix + "_json_fields = {\n"
+        for row in self.rows:
+            ret += row.json_field_line(prefix + "\t")
+            ret += "\n"
+        ret += prefix + "}\n\n"
         ret += prefix + "@classmethod\n"
         ret += prefix + f'def from_json(cls, dict_data: dict) -> "{self.class_name}":\n'
         prefix += "\t"